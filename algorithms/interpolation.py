@@ -1,3 +1,4 @@
+import numpy
 from math import pow, sin, cos, pi, sqrt
 
 '''
@@ -9,8 +10,30 @@ https://github.com/libgdx/libgdx/blob/master/gdx/src/com/badlogic/gdx/math/Inter
 def assignArguments(function, *arguments):
     def interpolationWrapper(x):
         return function(x, *arguments)
+    arrayFunction = getattr(function, "evaluateArray", None)
+    if arrayFunction is not None:
+        interpolationWrapper.evaluateArray = lambda x: arrayFunction(x, *arguments)
     return interpolationWrapper
 
+def arrayVersionOf(function):
+    '''
+    Register a function that does the same as the given interpolation
+    function for all values in a numpy array at once.
+    It can be accessed with function.evaluateArray(x, *arguments).
+    '''
+    def registerArrayFunction(arrayFunction):
+        function.evaluateArray = arrayFunction
+        return arrayFunction
+    return registerArrayFunction
+
+def evaluateInterpolationArray(interpolation, x):
+    '''Evaluate any interpolation for all values in x and return a numpy array'''
+    x = numpy.asarray(x, dtype = "d")
+    arrayFunction = getattr(interpolation, "evaluateArray", None)
+    if arrayFunction is not None:
+        return arrayFunction(x)
+    return numpy.fromiter(map(interpolation, x.tolist()), dtype = "d", count = len(x))
+
 def getInterpolationPreset(name = "LINEAR", easeIn = True, easeOut = True):
     if not (easeIn or easeOut): return linear
     if name == "LINEAR": return linear
@@ -53,13 +76,9 @@ exponentOfName = {
     "QUINTIC" : 5 }
 
 def sampleInterpolation(interpolation, amount = 40, minValue = 0, maxValue = 1):
-    samples = []
-    size = maxValue - minValue
-    for i in range(amount):
-          x = i / (amount - 1)
-          y = interpolation(x) * size + minValue
-          samples.append(y)
-    return samples
+    x = numpy.linspace(0, 1, amount)
+    samples = evaluateInterpolationArray(interpolation, x) * (maxValue - minValue) + minValue
+    return samples.tolist()
 
 
 # Linear interpolation
@@ -67,6 +86,10 @@ def sampleInterpolation(interpolation, amount = 40, minValue = 0, maxValue = 1):
 def linear(x):
     return x
 
+@arrayVersionOf(linear)
+def linear_Array(x):
+    return x.copy()
+
 
 # Power interpolation
 
@@ -83,6 +106,20 @@ def powerIn(x, exponent = 2):
 def powerOut(x, exponent = 2):
     return pow(x - 1, exponent) * (-1 if exponent % 2 == 0 else 1) + 1
 
+@arrayVersionOf(powerInOut)
+def powerInOut_Array(x, exponent = 2):
+    return numpy.where(x <= 0.5,
+        numpy.power(x * 2, exponent) / 2,
+        numpy.power((x - 1) * 2, exponent) / (-2 if exponent % 2 == 0 else 2) + 1)
+
+@arrayVersionOf(powerIn)
+def powerIn_Array(x, exponent = 2):
+    return numpy.power(x, exponent)
+
+@arrayVersionOf(powerOut)
+def powerOut_Array(x, exponent = 2):
+    return numpy.power(x - 1, exponent) * (-1 if exponent % 2 == 0 else 1) + 1
+
 
 # Exponential interpolation
 
@@ -108,6 +145,23 @@ def exponentialOut(x, settings):
     base, exponent, minValue, scale = settings
     return 1 - (pow(base, -exponent * x) - minValue) * scale
 
+@arrayVersionOf(exponentialInOut)
+def exponentialInOut_Array(x, settings):
+    base, exponent, minValue, scale = settings
+    return numpy.where(x <= 0.5,
+        (numpy.power(base, exponent * (x * 2 - 1)) - minValue) * scale / 2,
+        (2 - (numpy.power(base, -exponent * (x * 2 - 1)) - minValue) * scale) / 2)
+
+@arrayVersionOf(exponentialIn)
+def exponentialIn_Array(x, settings):
+    base, exponent, minValue, scale = settings
+    return (numpy.power(base, exponent * (x - 1)) - minValue) * scale
+
+@arrayVersionOf(exponentialOut)
+def exponentialOut_Array(x, settings):
+    base, exponent, minValue, scale = settings
+    return 1 - (numpy.power(base, -exponent * x) - minValue) * scale
+
 
 # Circle interpolation
 
@@ -126,6 +180,25 @@ def circularOut(x):
     x -= 1
     return sqrt(1 - x * x)
 
+# the square roots are clamped because both branches of numpy.where are always calculated
+
+@arrayVersionOf(circularInOut)
+def circularInOut_Array(x):
+    a = x * 2
+    b = (x - 1) * 2
+    return numpy.where(x <= 0.5,
+        (1 - numpy.sqrt(numpy.maximum(1 - a * a, 0))) / 2,
+        (numpy.sqrt(numpy.maximum(1 - b * b, 0)) + 1) / 2)
+
+@arrayVersionOf(circularIn)
+def circularIn_Array(x):
+    return 1 - numpy.sqrt(numpy.maximum(1 - x * x, 0))
+
+@arrayVersionOf(circularOut)
+def circularOut_Array(x):
+    x = x - 1
+    return numpy.sqrt(numpy.maximum(1 - x * x, 0))
+
 
 # Elastic interpolation
 
@@ -155,6 +228,26 @@ def elasticOut(x, settings):
     x = 1 - x
     return 1 - pow(base, exponent * (x - 1)) * sin(x * bounces) * scale
 
+@arrayVersionOf(elasticInOut)
+def elasticInOut_Array(x, settings):
+    base, exponent, bounces, scale = settings
+    a = x * 2
+    b = (1 - x) * 2
+    return numpy.where(x <= 0.5,
+        numpy.power(base, exponent * (a - 1)) * numpy.sin(a * bounces) * scale / 2,
+        1 - numpy.power(base, exponent * (b - 1)) * numpy.sin(b * bounces) * scale / 2)
+
+@arrayVersionOf(elasticIn)
+def elasticIn_Array(x, settings):
+    base, exponent, bounces, scale = settings
+    return numpy.power(base, exponent * (x - 1)) * numpy.sin(x * bounces) * scale
+
+@arrayVersionOf(elasticOut)
+def elasticOut_Array(x, settings):
+    base, exponent, bounces, scale = settings
+    x = 1 - x
+    return 1 - numpy.power(base, exponent * (x - 1)) * numpy.sin(x * bounces) * scale
+
 
 # Bounce interpolation
 
@@ -188,6 +281,34 @@ def bounceOut(x, settings):
     z = 4 / width * height * x
     return 1 -(z - z * x) * width
 
+@arrayVersionOf(bounceInOut)
+def bounceInOut_Array(x, settings):
+    return numpy.where(x <= 0.5,
+        (1 - bounceOut_Array(1 - x * 2, settings)) / 2,
+        bounceOut_Array(x * 2 - 1, settings) / 2 + 0.5)
+
+@arrayVersionOf(bounceIn)
+def bounceIn_Array(x, settings):
+    return 1 - bounceOut_Array(1 - x, settings)
+
+@arrayVersionOf(bounceOut)
+def bounceOut_Array(x, settings):
+    widths, heights = settings
+    x = x + widths[0] / 2
+    # elements that are not inside any bounce use the last one
+    currentWidths = numpy.full(len(x), widths[-1])
+    currentHeights = numpy.full(len(x), heights[-1])
+    found = numpy.zeros(len(x), dtype = bool)
+    for width, height in zip(widths, heights):
+        inside = ~found & (x <= width)
+        currentWidths[inside] = width
+        currentHeights[inside] = height
+        found |= inside
+        x = numpy.where(found, x, x - width)
+    x = x / currentWidths
+    z = 4 / currentWidths * currentHeights * x
+    return 1 - (z - z * x) * currentWidths
+
 
 
 # Back swing interpolation
@@ -207,6 +328,23 @@ def backOut(x, scale = 1.7):
     x -= 1
     return x * x * ((scale + 1) * x + scale) + 1
 
+@arrayVersionOf(backInOut)
+def backInOut_Array(x, scale = 1.7):
+    a = x * 2
+    b = (x - 1) * 2
+    return numpy.where(x <= 0.5,
+        a * a * ((scale + 1) * a - scale) / 2,
+        b * b * ((scale + 1) * b + scale) / 2 + 1)
+
+@arrayVersionOf(backIn)
+def backIn_Array(x, scale = 1.7):
+    return x * x * ((scale + 1) * x - scale)
+
+@arrayVersionOf(backOut)
+def backOut_Array(x, scale = 1.7):
+    x = x - 1
+    return x * x * ((scale + 1) * x + scale) + 1
+
 
 # Sine interpolation
 
@@ -219,6 +357,18 @@ def sinIn(x):
 def sinOut(x):
     return sin(x * pi / 2)
 
+@arrayVersionOf(sinInOut)
+def sinInOut_Array(x):
+    return (1 - numpy.cos(x * pi)) / 2
+
+@arrayVersionOf(sinIn)
+def sinIn_Array(x):
+    return 1 - numpy.cos(x * pi / 2)
+
+@arrayVersionOf(sinOut)
+def sinOut_Array(x):
+    return numpy.sin(x * pi / 2)
+
 
 # Specials
 
@@ -230,3 +380,8 @@ def fCurveMapping(x, settings):
 def mixedInterpolation(x, settings):
     a, b, factor = settings
     return a(x) * (1 - factor) + b(x) * factor
+
+@arrayVersionOf(mixedInterpolation)
+def mixedInterpolation_Array(x, settings):
+    a, b, factor = settings
+    return evaluateInterpolationArray(a, x) * (1 - factor) + evaluateInterpolationArray(b, x) * factor
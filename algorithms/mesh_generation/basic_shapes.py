@@ -1,30 +1,48 @@
 import math
+import numpy
 from mathutils import Vector
+from ... data_structures.vector_array import normalizeRows
 
 def gridVertices(xDivisions, yDivisions, xDistance = 1, yDistance = 1, offset = Vector((0, 0, 0))):
-    vertices = []
-    append = vertices.append
-    for x in range(xDivisions):
-        for y in range(yDivisions):
-            append(Vector((x * xDistance, y * yDistance, 0)) + offset)
-    return vertices
+    vertices = gridVertexArray(xDivisions, yDivisions, xDistance, yDistance, offset)
+    return list(map(Vector, vertices.tolist()))
+
+def gridVertexArray(xDivisions, yDivisions, xDistance = 1, yDistance = 1, offset = (0, 0, 0)):
+    '''(xDivisions * yDivisions, 3) array; the y index changes fastest'''
+    xDivisions, yDivisions = max(xDivisions, 0), max(yDivisions, 0)
+    vertices = numpy.empty((xDivisions, yDivisions, 3))
+    vertices[:, :, 0] = (numpy.arange(xDivisions) * xDistance)[:, numpy.newaxis]
+    vertices[:, :, 1] = (numpy.arange(yDivisions) * yDistance)[numpy.newaxis, :]
+    vertices[:, :, 2] = 0
+    vertices += tuple(offset)
+    return vertices.reshape(-1, 3)
 
 def tubeVertices(centerPoints, ringPoints, tangents, resolution):
-    vertices = []
-    for center, pointOnCircle, tangent in zip(centerPoints, ringPoints, tangents):
-        vertices.extend(alignedCircleVertices(center, pointOnCircle, tangent, resolution))
-    return vertices
+    vertices = tubeVertexArray(numpy.array([tuple(point) for point in centerPoints], dtype = "d"),
+                               numpy.array([tuple(point) for point in ringPoints], dtype = "d"),
+                               numpy.array([tuple(tangent) for tangent in tangents], dtype = "d"),
+                               resolution)
+    return list(map(Vector, vertices.tolist()))
 
-def alignedCircleVertices(center, pointOnCircle, tangent, resolution):
-    dirX = pointOnCircle - center
-    radius = dirX.length
-    dirY = tangent.cross(dirX).normalized()
-    dirX.normalize()
+def tubeVertexArray(centerPoints, ringPoints, tangents, resolution):
+    '''
+    (len(centerPoints) * resolution, 3) array with one circle per center point.
+    Every circle goes through its ring point and is perpendicular to the tangent.
+    '''
+    centerPoints = numpy.asarray(centerPoints, dtype = "d").reshape(-1, 3)
+    dirX = numpy.asarray(ringPoints, dtype = "d").reshape(-1, 3) - centerPoints
+    dirY = numpy.cross(numpy.asarray(tangents, dtype = "d").reshape(-1, 3), dirX)
+    radii = numpy.sqrt(numpy.einsum("ij,ij->i", dirX, dirX))[:, numpy.newaxis]
+    dirX = dirX / numpy.where(radii > 0, radii, 1)
+    dirY = normalizeRows(dirY)
+
+    angles = numpy.arange(resolution) * (2 * math.pi / resolution)
+    cosines = numpy.cos(angles)[numpy.newaxis, :, numpy.newaxis]
+    sines = numpy.sin(angles)[numpy.newaxis, :, numpy.newaxis]
 
-    vertices = []
-    angleFactor = 2 * math.pi / resolution
-    for i in range(resolution):
-        angle = i * angleFactor
-        vertex = center + radius * (math.cos(angle) * dirX + math.sin(angle) * dirY)
-        vertices.append(vertex)
-    return vertices
+    offsets = cosines * dirX[:, numpy.newaxis] + sines * dirY[:, numpy.newaxis]
+    vertices = centerPoints[:, numpy.newaxis] + radii[:, numpy.newaxis] * offsets
+    return vertices.reshape(-1, 3)
+
+def alignedCircleVertices(center, pointOnCircle, tangent, resolution):
+    return tubeVertices([center], [pointOnCircle], [tangent], resolution)
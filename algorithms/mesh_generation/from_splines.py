@@ -1,18 +1,27 @@
-from ... data_structures.splines.bezier_spline import BezierSpline
-from ... data_structures.splines.poly_spline import PolySpline
-from . indices_utils import gridQuadPolygonIndices, tubeQuadPolygonIndices
-from . basic_shapes import tubeVertices
+import numpy
+from mathutils import Vector
+from . indices_utils import gridQuadPolygonIndexArray, tubeQuadPolygonIndexArray
+from . basic_shapes import tubeVertexArray
+from ... data_structures.vector_array import rowLengths
+from ... data_structures.splines.base_spline import ArcLengthTable
+from ... data_structures.splines.bezier_spline import calculateSmoothHandlesArray
+
+'''
+The cross sections of a loft are splines through the same sample of every
+input spline. They all have the same amount of segments, so they are
+evaluated together as arrays with the shape (sections, segments, ...).
+Every segment is stored as a polynomial c0 + c1 * t + c2 * t^2 + c3 * t^3.
+'''
 
 # Loft
 ###################################
 
-def loftSplines(splines, 
+def loftSplines(splines,
                 nSplineSamples, nSurfaceSamples, *,
                 type = "LINEAR", cyclic = False, smoothness = 1,
                 uniformConverterResolution = 100, splineDistributionType = "RESOLUTION", surfaceDistributionType = "RESOLUTION",
                 startSurfaceParameter = 0.0, endSurfaceParameter = 1.0):
-
-    vertices = []
+    '''Returns an (N, 3) vertex array and an (M, 4) polygon index array'''
 
     isRealCyclic = cyclic and startSurfaceParameter <= 0.0 and endSurfaceParameter >= 1.0
 
@@ -21,51 +30,113 @@ def loftSplines(splines,
     elif splineDistributionType == "UNIFORM":
         samples = [spline.getUniformSamples(nSplineSamples, resolution = uniformConverterResolution) for spline in splines]
 
-    for points in zip(*samples):
-        if type == "BEZIER":
-            spline = BezierSpline.fromLocations(points)
-            spline.isCyclic = cyclic
-            spline.calculateSmoothHandles(smoothness)
-        elif type == "LINEAR":
-            spline = PolySpline.fromLocations(points)
-            spline.isCyclic = cyclic
-        spline.update()
+    # (sections, splines, 3)
+    sectionPoints = numpy.stack([numpy.asarray(points.data, dtype = "d") for points in samples], axis = 1)
 
-        amount = nSurfaceSamples + int(isRealCyclic)
+    if type == "BEZIER":
+        coefficients = getBezierSectionCoefficients(sectionPoints, cyclic, smoothness)
+    elif type == "LINEAR":
+        coefficients = getLinearSectionCoefficients(sectionPoints, cyclic)
+
+    if isRealCyclic:
+        # the last sample would be at the same position as the first
+        parameters = numpy.arange(nSurfaceSamples) / nSurfaceSamples
+    else:
+        start, end = sorted((min(max(startSurfaceParameter, 0.0), 1.0), min(max(endSurfaceParameter, 0.0), 1.0)))
+        parameters = numpy.linspace(start, end, nSurfaceSamples)
+    parameters = numpy.tile(parameters, (len(sectionPoints), 1))
 
-        if surfaceDistributionType == "RESOLUTION":
-            vertices.extend(spline.getSamples(amount, start = startSurfaceParameter, end = endSurfaceParameter))
-        elif surfaceDistributionType == "UNIFORM":
-            vertices.extend(spline.getUniformSamples(amount, resolution = uniformConverterResolution, start = startSurfaceParameter, end = endSurfaceParameter))
+    if surfaceDistributionType == "UNIFORM":
+        if type == "BEZIER":
+            table = getSectionArcLengthTable(coefficients, max(uniformConverterResolution, 1))
+        elif type == "LINEAR":
+            table = getLinearSectionArcLengthTable(coefficients)
+        parameters = table.lookUpArray(parameters)
 
-        if isRealCyclic: del vertices[-1]
+    vertices = evaluateSections(coefficients, parameters).reshape(-1, 3)
 
     if isRealCyclic:
-        polygons = tubeQuadPolygonIndices(nSplineSamples, nSurfaceSamples)
+        polygons = tubeQuadPolygonIndexArray(nSplineSamples, nSurfaceSamples)
     else:
-        polygons = gridQuadPolygonIndices(nSplineSamples, nSurfaceSamples)
+        polygons = gridQuadPolygonIndexArray(nSplineSamples, nSurfaceSamples)
 
     return vertices, polygons
 
+def getLinearSectionCoefficients(points, cyclic):
+    starts, ends = getSegmentEndPoints(points, cyclic)
+    coefficients = numpy.zeros(starts.shape[:2] + (4, 3))
+    coefficients[:, :, 0] = starts
+    coefficients[:, :, 1] = ends - starts
+    return coefficients
+
+def getBezierSectionCoefficients(points, cyclic, smoothness):
+    leftHandles, rightHandles, _ = calculateSmoothHandlesArray(points, cyclic, smoothness)
+    start, end = getSegmentEndPoints(points, cyclic)
+    startHandle, _ = getSegmentEndPoints(rightHandles, cyclic)
+    _, endHandle = getSegmentEndPoints(leftHandles, cyclic)
+
+    coefficients = numpy.empty(start.shape[:2] + (4, 3))
+    coefficients[:, :, 0] = start
+    coefficients[:, :, 1] = start * (-3.0) + startHandle * (+3.0)
+    coefficients[:, :, 2] = start * (+3.0) + startHandle * (-6.0) + endHandle * (+3.0)
+    coefficients[:, :, 3] = start * (-1.0) + startHandle * (+3.0) + endHandle * (-3.0) + end
+    return coefficients
+
+def getSegmentEndPoints(points, cyclic):
+    if cyclic: return points, numpy.roll(points, -1, axis = 1)
+    return points[:, :-1], points[:, 1:]
+
+def evaluateSections(coefficients, parameters):
+    '''(sections, parameters, 3) array; every section has its own parameters'''
+    segmentAmount = coefficients.shape[1]
+    p = numpy.maximum(parameters, 0.0) * segmentAmount
+    indices = numpy.minimum(p.astype("int64"), segmentAmount - 1)
+    t = (p - indices)[:, :, numpy.newaxis]
+    c = coefficients[numpy.arange(len(coefficients))[:, numpy.newaxis], indices]
+    return c[:, :, 0] + t * (c[:, :, 1] + t * (c[:, :, 2] + t * c[:, :, 3]))
+
+def getLinearSectionArcLengthTable(coefficients):
+    segmentAmount = coefficients.shape[1]
+    lengths = numpy.zeros((len(coefficients), segmentAmount + 1))
+    numpy.cumsum(rowLengths(coefficients[:, :, 1]), axis = 1, out = lengths[:, 1:])
+    return ArcLengthTable(numpy.linspace(0.0, 1.0, segmentAmount + 1), lengths)
+
+def getSectionArcLengthTable(coefficients, resolution):
+    '''Arc lengths of all sections at the same parameters'''
+    segmentAmount = coefficients.shape[1]
+    # a few samples per segment, so that the table follows every bend
+    subdivisions = max(8, -(-4 * resolution // segmentAmount))
+    parameters = numpy.linspace(0.0, 1.0, segmentAmount * subdivisions + 1)
+
+    localParameters = numpy.arange(subdivisions) / subdivisions
+    points = numpy.concatenate((evaluateSectionGrid(coefficients, localParameters),
+                                coefficients[:, -1:].sum(axis = 2)), axis = 1)
+    middlePoints = evaluateSectionGrid(coefficients, localParameters + 0.5 / subdivisions)
+    return ArcLengthTable.fromPoints(parameters, points, middlePoints, resolution)
+
+def evaluateSectionGrid(coefficients, localParameters):
+    '''Evaluate every segment of every section at the same local parameters'''
+    powers = localParameters[:, numpy.newaxis] ** numpy.arange(4)
+    # (sections, segments, 3, 4) x (4, parameters)
+    points = numpy.dot(coefficients.swapaxes(2, 3), powers.T).swapaxes(2, 3)
+    return points.reshape(len(coefficients), -1, 3)
+
 
 # Revolve
 ###################################
 
 def revolveProfileAroundAxis(axis, profile, nSplineSamples, nSurfaceSamples, type = "PARAMETER"):
+    '''Returns an (N, 3) vertex array and an (M, 4) polygon index array'''
+    profileSamples = numpy.asarray(profile.getSamples(nSplineSamples).data, dtype = "d")
     if type == "PARAMETER":
-        axisSamples = axis.getSamples(nSplineSamples)
-        profileSamples = profile.getSamples(nSplineSamples)
-        tangents = axis.getTangentSamples(nSplineSamples)
+        axisSamples = numpy.asarray(axis.getSamples(nSplineSamples).data, dtype = "d")
+        tangents = numpy.asarray(axis.getTangentSamples(nSplineSamples).data, dtype = "d")
     if type == "PROJECT":
-        profileSamples = profile.getSamples(nSplineSamples)
-        axisSamples = []
-        tangents = []
-        for point in profileSamples:
-            location, tangent = axis.projectExtended(point)
-            axisSamples.append(location)
-            tangents.append(tangent)
-
-    vertices = tubeVertices(axisSamples, profileSamples, tangents, nSurfaceSamples)
-    polygons = tubeQuadPolygonIndices(nSplineSamples, nSurfaceSamples)
+        projections = [axis.projectExtended(point) for point in map(Vector, profileSamples.tolist())]
+        axisSamples = numpy.array([tuple(location) for location, _ in projections], dtype = "d")
+        tangents = numpy.array([tuple(tangent) for _, tangent in projections], dtype = "d")
+
+    vertices = tubeVertexArray(axisSamples, profileSamples, tangents, nSurfaceSamples)
+    polygons = tubeQuadPolygonIndexArray(nSplineSamples, nSurfaceSamples)
 
     return vertices, polygons
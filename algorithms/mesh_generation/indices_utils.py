@@ -1,28 +1,54 @@
+import numpy
+
+'''
+The index arrays have the shape (amount, 2) for edges and (amount, 4)
+for quads. The functions that return lists of tuples convert these arrays
+for nodes and sockets that expect lists.
+'''
+
 def tubeQuadPolygonIndices(xDivisions, yDivisions):
-    polygons = []
-    polygons.extend(gridQuadPolygonIndices(xDivisions, yDivisions))
-    polygons.extend(gridEndEdgesQuadPolygonIndices(xDivisions, yDivisions))
-    return polygons
+    return indexArrayToTuples(tubeQuadPolygonIndexArray(xDivisions, yDivisions))
 
 def gridQuadPolygonIndices(xDivisions, yDivisions):
-    polygons = []
-    for i in range(0, (xDivisions - 1) * yDivisions, yDivisions):
-        for j in range(i, i + yDivisions - 1):
-            polygons.append((j, j + 1, j + yDivisions + 1, j + yDivisions))
-    return polygons
+    return indexArrayToTuples(gridQuadPolygonIndexArray(xDivisions, yDivisions))
 
 def gridQuadEdgeIndices(xDivisions, yDivisions):
-    edges = []
-    for i in range((xDivisions - 1) * yDivisions):
-        edges.append((i, i + yDivisions))
-    for i in range(yDivisions - 1):
-        for j in range(xDivisions):
-            firstIndex = i + j * yDivisions
-            edges.append((firstIndex, firstIndex + 1))
-    return edges
+    return indexArrayToTuples(gridQuadEdgeIndexArray(xDivisions, yDivisions))
 
 def gridEndEdgesQuadPolygonIndices(xDivisions, yDivisions):
-    polygons = []
-    for i in range(0, (xDivisions - 1) * yDivisions, yDivisions):
-        polygons.append((i, i + yDivisions, i + 2 * yDivisions - 1, i + yDivisions - 1))
-    return polygons
+    return indexArrayToTuples(gridEndEdgesQuadPolygonIndexArray(xDivisions, yDivisions))
+
+
+# Array Versions
+##################################
+
+def tubeQuadPolygonIndexArray(xDivisions, yDivisions):
+    return numpy.concatenate((gridQuadPolygonIndexArray(xDivisions, yDivisions),
+                              gridEndEdgesQuadPolygonIndexArray(xDivisions, yDivisions)))
+
+def gridQuadPolygonIndexArray(xDivisions, yDivisions):
+    if xDivisions < 2 or yDivisions < 2: return numpy.zeros((0, 4), dtype = "int64")
+    # every vertex except the ones in the last row and column starts a quad
+    starts = numpy.arange((xDivisions - 1) * yDivisions).reshape(-1, yDivisions)[:, :-1].ravel()
+    return indicesFromStarts(starts, (0, 1, yDivisions + 1, yDivisions))
+
+def gridQuadEdgeIndexArray(xDivisions, yDivisions):
+    xDivisions, yDivisions = max(xDivisions, 0), max(yDivisions, 0)
+    xEdgeStarts = numpy.arange(max(xDivisions - 1, 0) * yDivisions)
+    yEdgeStarts = (numpy.arange(max(yDivisions - 1, 0))[:, numpy.newaxis] +
+                   numpy.arange(xDivisions)[numpy.newaxis, :] * yDivisions).ravel()
+    return numpy.concatenate((indicesFromStarts(xEdgeStarts, (0, yDivisions)),
+                              indicesFromStarts(yEdgeStarts, (0, 1))))
+
+def gridEndEdgesQuadPolygonIndexArray(xDivisions, yDivisions):
+    if yDivisions < 1: return numpy.zeros((0, 4), dtype = "int64")
+    starts = numpy.arange(0, max(xDivisions - 1, 0) * yDivisions, yDivisions)
+    return indicesFromStarts(starts, (0, yDivisions, 2 * yDivisions - 1, yDivisions - 1))
+
+def indicesFromStarts(starts, offsets):
+    return starts[:, numpy.newaxis] + numpy.array(offsets, dtype = "int64")
+
+def indexArrayToTuples(indices):
+    '''Convert an index array to the list of tuples the index list sockets expect'''
+    # zip creates the tuples directly from the columns
+    return list(zip(*numpy.asarray(indices).T.tolist()))
@@ -1,10 +1,24 @@
-from . random import getUniformRandom
+import numpy
+from . random import getRandomNumberCache
 
-# setup a cache for faster results
+# the cache is only created when noise is used the first time
 smoothNoiseCacheSize = 50000
-smoothNoiseCache = []
-for i in range(smoothNoiseCacheSize):
-    smoothNoiseCache.append(getUniformRandom(i, -1, 1)/2.0 + getUniformRandom(i-1, -1, 1)/4.0 + getUniformRandom(i+1, -1, 1)/4.0)
+smoothNoiseCache = None
+smoothNoiseCacheArray = None
+
+def getSmoothNoiseCacheArray():
+    global smoothNoiseCache, smoothNoiseCacheArray
+    if smoothNoiseCacheArray is None:
+        # same as getUniformRandom(i, -1, 1) for i in range(-1, smoothNoiseCacheSize + 1)
+        randomNumbers = getRandomNumberCache().take(numpy.arange(-1, smoothNoiseCacheSize + 1))
+        uniform = -1 + randomNumbers * 2
+        smoothNoiseCacheArray = uniform[1:-1] / 2.0 + uniform[:-2] / 4.0 + uniform[2:] / 4.0
+        smoothNoiseCache = smoothNoiseCacheArray.tolist()
+    return smoothNoiseCacheArray
+
+def getSmoothNoiseCache():
+    getSmoothNoiseCacheArray()
+    return smoothNoiseCache
 
 # http://freespace.virgin.net/hugo.elias/models/m_perlin.htm
 def perlinNoise(x, persistance, octaves):
@@ -16,13 +30,50 @@ def perlinNoise(x, persistance, octaves):
     return total
 
 def interpolatedNoise(x):
+    cache = smoothNoiseCache or getSmoothNoiseCache()
     intX = int(x)
-    v1 = smoothNoiseCache[intX % smoothNoiseCacheSize]
-    v2 = smoothNoiseCache[(intX+1) % smoothNoiseCacheSize]
-    v3 = smoothNoiseCache[(intX+2) % smoothNoiseCacheSize]
-    v4 = smoothNoiseCache[(intX+3) % smoothNoiseCacheSize]
+    v1 = cache[intX % smoothNoiseCacheSize]
+    v2 = cache[(intX+1) % smoothNoiseCacheSize]
+    v3 = cache[(intX+2) % smoothNoiseCacheSize]
+    v4 = cache[(intX+3) % smoothNoiseCacheSize]
     return cubicInterpolation(v1, v2, v3, v4, x - intX)
 
 def cubicInterpolation(v0, v1, v2, v3, x):
     p = v3 - v2 - v0 + v1
     return p * x**3 + ((v0 - v1) - p) * x**2 + (v2 - v0) * x + v1
+
+
+# Array Versions
+##################################
+# Same results as above for every element of the array.
+
+def perlinNoiseArray(x, persistance, octaves):
+    x = numpy.asarray(x, dtype = "d")
+    total = numpy.zeros(x.shape)
+    for i in range(octaves):
+        frequency = 2**i
+        localAmplitude = persistance**i
+        total += interpolatedNoiseArray(x * frequency) * localAmplitude
+    return total
+
+def interpolatedNoiseArray(x):
+    cache = getSmoothNoiseCacheArray()
+    # int() rounds towards zero, so floor can't be used here
+    intX = numpy.trunc(x)
+    indices = intX.astype("int64") % smoothNoiseCacheSize
+    v1 = cache[indices]
+    v2 = cache[(indices + 1) % smoothNoiseCacheSize]
+    v3 = cache[(indices + 2) % smoothNoiseCacheSize]
+    v4 = cache[(indices + 3) % smoothNoiseCacheSize]
+    return cubicInterpolation(v1, v2, v3, v4, x - intX)
+
+def wiggleVectorArray(x, persistance, octaves):
+    '''(N, 3) noise values like the vector and rotation wiggle nodes calculate them'''
+    x = numpy.asarray(x, dtype = "d")
+    result = numpy.empty((len(x), 3))
+    result[:, 0] = perlinNoiseArray(x, persistance, octaves)
+    x = x + 79
+    result[:, 1] = perlinNoiseArray(x, persistance, octaves)
+    x = x + 263
+    result[:, 2] = perlinNoiseArray(x, persistance, octaves)
+    return result
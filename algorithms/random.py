@@ -1,12 +1,138 @@
 import numpy
 import random
+from collections import OrderedDict
 from mathutils import Vector, Color
 from .. utils.timing import measureTime
 
-randomNumberCache = []
-cacheSize = int(2e7)
-numpy.random.seed(1234)
-randomNumberCache = numpy.random.random(cacheSize)
+
+# Counter based random numbers
+##################################
+# Every (seed, index) pair is hashed with the SplitMix64 finalizer,
+# so there is no state and no table that has to be generated first.
+
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+GAMMA = 0x9E3779B97F4A7C15
+MIX_1 = 0xBF58476D1CE4E5B9
+MIX_2 = 0x94D049BB133111EB
+
+def randomNumber(seed, index = 0):
+    '''Float in the range [0, 1) that only depends on seed and index'''
+    z = (_mixInteger(seed & MASK_64) + index) & MASK_64
+    return (_mixInteger(z) >> 11) * 2.0**-53
+
+def _mixInteger(z):
+    z = (z + GAMMA) & MASK_64
+    z = ((z ^ (z >> 30)) * MIX_1) & MASK_64
+    z = ((z ^ (z >> 27)) * MIX_2) & MASK_64
+    return z ^ (z >> 31)
+
+def randomNumbers(seeds, indices = 0):
+    '''Vectorized version of randomNumber; seeds and indices can be arrays or numbers'''
+    with numpy.errstate(over = "ignore"):
+        z = _mixArray(_toUInt64(seeds)) + _toUInt64(indices)
+        return (_mixArray(z) >> numpy.uint64(11)) * 2.0**-53
+
+def randomNumberSequence(seed, amount, offset = 0):
+    '''Same as [randomNumber(seed, i) for i in range(offset, offset + amount)]'''
+    return randomNumbers(seed, numpy.arange(offset, offset + max(amount, 0), dtype = "int64"))
+
+def randomNumberRows(seed, amount, rowLength, offset = 0):
+    '''
+    (amount, rowLength) array of random numbers.
+    Row i only depends on seed, offset and i, so it does not change with the amount.
+    '''
+    numbers = randomNumberSequence(seed, amount * rowLength, offset)
+    return numbers.reshape(max(amount, 0), rowLength)
+
+def _mixArray(z):
+    z = z + numpy.uint64(GAMMA)
+    z = (z ^ (z >> numpy.uint64(30))) * numpy.uint64(MIX_1)
+    z = (z ^ (z >> numpy.uint64(27))) * numpy.uint64(MIX_2)
+    return z ^ (z >> numpy.uint64(31))
+
+def _toUInt64(values):
+    # negative seeds are interpreted as two's complement like in randomNumber
+    return numpy.asarray(values, dtype = "int64").view("uint64")
+
+
+
+# Legacy random number cache
+##################################
+# Older versions generated 2e7 numbers with numpy.random.seed(1234) when the
+# addon was loaded. The same numbers are still available for existing node
+# trees, but they are only generated when they are used.
+
+class LegacyRandomNumberCache:
+    size = int(2e7)
+    seed = 1234
+    # small chunks are fast to regenerate, together they can hold a third of all numbers
+    chunkSize = 2**14
+    maxLoadedChunks = 400
+
+    # seed - 1 is used for seed 0 in a few places, this avoids
+    # generating the whole sequence just to get the last number
+    knownValues = {size - 1 : 0.4928643531010789}
+
+    def __init__(self):
+        # least recently used chunks come first
+        self.chunks = OrderedDict()
+        # state of the random generator at the start of every chunk
+        self.chunkStartStates = [self.getInitialState()]
+
+    def getInitialState(self):
+        generator = numpy.random.RandomState(self.seed)
+        return generator.get_state()
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        if index < 0: index += self.size
+        if not 0 <= index < self.size: raise IndexError("random number cache index out of range")
+        if index in self.knownValues: return self.knownValues[index]
+        return float(self.getChunk(index // self.chunkSize)[index % self.chunkSize])
+
+    def take(self, indices):
+        '''Get many numbers at once; indices are wrapped around like seed % size'''
+        indices = numpy.asarray(indices, dtype = "int64") % self.size
+        result = numpy.empty(indices.shape, dtype = "d")
+        isKnown = numpy.zeros(indices.shape, dtype = bool)
+        for index, value in self.knownValues.items():
+            mask = indices == index
+            result[mask] = value
+            isKnown |= mask
+
+        chunkIndices = indices // self.chunkSize
+        for chunkIndex in numpy.unique(chunkIndices[~isKnown]).tolist():
+            mask = (chunkIndices == chunkIndex) & ~isKnown
+            result[mask] = self.getChunk(chunkIndex)[indices[mask] % self.chunkSize]
+        return result
+
+    def getChunk(self, chunkIndex):
+        chunk = self.chunks.get(chunkIndex)
+        if chunk is None:
+            chunk = self.generateChunk(chunkIndex)
+            self.chunks[chunkIndex] = chunk
+            if len(self.chunks) > self.maxLoadedChunks:
+                self.chunks.popitem(last = False)
+        else:
+            self.chunks.move_to_end(chunkIndex)
+        return chunk
+
+    def generateChunk(self, chunkIndex):
+        generator = numpy.random.RandomState()
+        # advance from the last known state until the requested chunk starts
+        while len(self.chunkStartStates) <= chunkIndex:
+            generator.set_state(self.chunkStartStates[-1])
+            generator.random_sample(self.chunkSize)
+            self.chunkStartStates.append(generator.get_state())
+
+        generator.set_state(self.chunkStartStates[chunkIndex])
+        amount = min(self.chunkSize, self.size - chunkIndex * self.chunkSize)
+        return generator.random_sample(amount)
+
+randomNumberCache = LegacyRandomNumberCache()
+cacheSize = randomNumberCache.size
 
 def getRandomNumberCache():
     return randomNumberCache
@@ -14,6 +140,11 @@ def getRandomNumberCache():
 def getUniformRandom(seed, min, max):
     return min + randomNumberCache[seed % cacheSize] * (max - min)
 
+
+
+# Other
+##################################
+
 def getRandomColor(seed = None, hue = None, saturation = None, value = None):
     if seed is None: random.seed()
     else: random.seed(seed)
@@ -26,6 +157,23 @@ def getRandomColor(seed = None, hue = None, saturation = None, value = None):
     color.hsv = hue, saturation, value
     return color
 
+def getColorsFromHues(hues, saturation, value):
+    '''RGBA colors with the same saturation and value for every hue in the array'''
+    hues = numpy.asarray(hues) * 6
+    sectors = numpy.floor(hues).astype("int64") % 6
+    fractions = hues - numpy.floor(hues)
+
+    p = numpy.full(len(hues), value * (1 - saturation))
+    q = value * (1 - saturation * fractions)
+    t = value * (1 - saturation * (1 - fractions))
+    v = numpy.full(len(hues), value)
+
+    colors = numpy.ones((len(hues), 4))
+    colors[:, 0] = numpy.choose(sectors, (v, q, p, p, t, v))
+    colors[:, 1] = numpy.choose(sectors, (t, v, v, q, p, p))
+    colors[:, 2] = numpy.choose(sectors, (p, p, t, v, v, q))
+    return colors
+
 def getRandomVectors(seed, amount):
     numpy.random.seed(seed)
-    return [Vector(v) for v in numpy.random.random([amount, 3])]
+    return list(map(Vector, numpy.random.random([amount, 3]).tolist()))
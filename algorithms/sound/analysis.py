@@ -0,0 +1,280 @@
+import wave
+import math
+import numpy
+from numpy.lib.stride_tricks import as_strided
+
+try: import aud
+except ImportError: aud = None
+
+'''
+Headless version of the analysis that bpy.ops.graph.sound_bake does.
+
+The sound is mixed down to mono, filtered with a highpass (low frequency) and
+a lowpass (high frequency) biquad, rectified, smoothed with an attack/release
+envelope follower and finally sampled once per frame.
+
+The sound is decoded only once. The filters of all frequency ranges are
+applied to the same spectrum of every chunk (overlap-add) and the envelopes
+of all ranges are followed at the same time.
+'''
+
+def analyseSoundFile(path, frequencyRanges, attack, release, frameRate):
+    samples, sampleRate = loadSound(path)
+    return calculateBandEnvelopes(samples, sampleRate, frequencyRanges, attack, release, frameRate)
+
+def calculateBandEnvelopes(samples, sampleRate, frequencyRanges, attack, release, frameRate,
+                           windowSize = None, progress = None):
+    '''
+    (len(frequencyRanges), frameAmount) float32 array, the first value belongs to frame 0
+    progress is called with the finished fraction after every window
+    '''
+    samples = numpy.asarray(samples, dtype = "f")
+    bandAmount = len(frequencyRanges)
+    frameAmount = int(math.ceil(len(samples) * frameRate / sampleRate))
+    envelopes = numpy.zeros((bandAmount, frameAmount), dtype = "f")
+    if bandAmount == 0 or len(samples) == 0: return envelopes
+
+    follower = EnvelopeFollower(bandAmount,
+        getEnvelopeFactor(sampleRate, attack), getEnvelopeFactor(sampleRate, release))
+    if windowSize is None: windowSize = 2**24 // bandAmount
+    windowSize = max(windowSize, 4 * follower.warmUpLength)
+
+    frameStep = sampleRate / frameRate
+    for start, filtered in iterFilteredWindows(samples, sampleRate, frequencyRanges, windowSize):
+        end = start + filtered.shape[1]
+        # frames between the last sample of the previous window and the last sample of this window
+        firstFrame = int(math.ceil((start - 1) / frameStep))
+        lastFrame = frameAmount - 1 if end == len(samples) else int((end - 1) / frameStep)
+        framePositions = numpy.arange(firstFrame, lastFrame + 1) * frameStep - start
+        envelopes[:, firstFrame:lastFrame + 1] = follower.process(numpy.abs(filtered), framePositions)
+        if progress is not None: progress(end / len(samples))
+    return envelopes
+
+
+# Decoding
+###########################################
+
+def loadSound(path):
+    '''Returns the sound mixed down to mono as float32 array and the sample rate'''
+    samples, sampleRate = decodeSound(path)
+    # same weights as the channel mapper of audaspace uses for mono
+    mono = samples.sum(axis = 1) / math.sqrt(samples.shape[1])
+    return mono.astype("f"), sampleRate
+
+def decodeSound(path):
+    '''(sampleAmount, channelAmount) array and the sample rate'''
+    if canDecodeWithAudaspace():
+        factory = aud.Factory(path)
+        sampleRate = int(factory.specs[0])
+        return numpy.asarray(factory.data(), dtype = "f"), sampleRate
+    if isWaveFile(path):
+        return decodeWaveFile(path)
+    raise Exception("Cannot decode the sound file: " + path)
+
+def canDecodeWithAudaspace():
+    return aud is not None and hasattr(aud.Factory, "data")
+
+def isWaveFile(path):
+    with open(path, "rb") as file:
+        header = file.read(12)
+    return header[:4] == b"RIFF" and header[8:] == b"WAVE"
+
+def decodeWaveFile(path):
+    with wave.open(path, "rb") as file:
+        channelAmount = file.getnchannels()
+        sampleWidth = file.getsampwidth()
+        sampleRate = file.getframerate()
+        data = file.readframes(file.getnframes())
+
+    if sampleWidth == 1:
+        samples = (numpy.frombuffer(data, dtype = "u1").astype("f") - 128) / 128
+    elif sampleWidth == 2:
+        samples = numpy.frombuffer(data, dtype = "<i2").astype("f") / 2**15
+    elif sampleWidth == 3:
+        bytes = numpy.frombuffer(data, dtype = "u1").reshape(-1, 3).astype("i4")
+        values = bytes[:, 0] | (bytes[:, 1] << 8) | (bytes[:, 2] << 16)
+        values[values >= 2**23] -= 2**24
+        samples = values.astype("f") / 2**23
+    elif sampleWidth == 4:
+        samples = numpy.frombuffer(data, dtype = "<i4").astype("f") / 2**31
+    else:
+        raise Exception("Unsupported sample width: {} bytes".format(sampleWidth))
+    return samples.reshape(-1, channelAmount), sampleRate
+
+
+# Filtering
+###########################################
+
+def iterFilteredWindows(samples, sampleRate, frequencyRanges, windowSize):
+    '''Yields (start, (bandAmount, length) array) with at least windowSize samples per window'''
+    chunks = []
+    windowStart = 0
+    length = 0
+    for chunk in iterFilteredChunks(samples, sampleRate, frequencyRanges):
+        chunks.append(chunk)
+        length += chunk.shape[1]
+        if length >= windowSize:
+            yield windowStart, numpy.concatenate(chunks, axis = 1)
+            windowStart += length
+            chunks = []
+            length = 0
+    if len(chunks) > 0:
+        yield windowStart, numpy.concatenate(chunks, axis = 1)
+
+def iterFilteredChunks(samples, sampleRate, frequencyRanges):
+    '''Yields (bandAmount, length) arrays with the filtered samples in order'''
+    responseLength = max([getImpulseResponseLength(coefficients, sampleRate)
+                          for coefficients in iterFilterCoefficients(sampleRate, frequencyRanges)] + [1])
+    # the filtered chunk including the tail of the response has to fit into the fft
+    fftSize = max(2**16, nextPowerOfTwo(4 * responseLength))
+    chunkSize = fftSize - responseLength
+    responses = numpy.array([getFrequencyResponse(sampleRate, low, high, fftSize)
+                             for low, high in frequencyRanges])
+
+    tail = numpy.zeros((len(frequencyRanges), fftSize - chunkSize))
+    for start in range(0, len(samples), chunkSize):
+        chunk = samples[start:start + chunkSize]
+        spectrum = numpy.fft.rfft(chunk, fftSize)
+        filtered = numpy.fft.irfft(spectrum * responses, fftSize)
+        filtered[:, :fftSize - chunkSize] += tail
+        tail = filtered[:, chunkSize:]
+        yield filtered[:, :len(chunk)].astype("f")
+
+def getFrequencyResponse(sampleRate, low, high, fftSize):
+    frequencies = numpy.arange(fftSize // 2 + 1) * (2 * math.pi / fftSize)
+    response = numpy.ones(len(frequencies), dtype = "D")
+    for b, a in iterFilterCoefficients(sampleRate, [(low, high)]):
+        z = numpy.exp(-1j * frequencies)
+        response *= (b[0] + b[1] * z + b[2] * z**2) / (a[0] + a[1] * z + a[2] * z**2)
+    return response
+
+def iterFilterCoefficients(sampleRate, frequencyRanges):
+    for low, high in frequencyRanges:
+        if high < sampleRate:
+            yield getLowpassCoefficients(sampleRate, high)
+        if low > 0:
+            yield getHighpassCoefficients(sampleRate, low)
+
+def getLowpassCoefficients(sampleRate, frequency, q = 1.0):
+    w0, alpha, c, norm = getBiquadParameters(sampleRate, frequency, q)
+    b = ((1 - c) / 2 / norm, (1 - c) / norm, (1 - c) / 2 / norm)
+    return b, (1.0, -2 * c / norm, (1 - alpha) / norm)
+
+def getHighpassCoefficients(sampleRate, frequency, q = 1.0):
+    w0, alpha, c, norm = getBiquadParameters(sampleRate, frequency, q)
+    b = ((1 + c) / 2 / norm, -(1 + c) / norm, (1 + c) / 2 / norm)
+    return b, (1.0, -2 * c / norm, (1 - alpha) / norm)
+
+def getBiquadParameters(sampleRate, frequency, q):
+    w0 = 2 * math.pi * frequency / sampleRate
+    alpha = math.sin(w0) / (2 * q)
+    return w0, alpha, math.cos(w0), 1 + alpha
+
+def getImpulseResponseLength(coefficients, sampleRate, tolerance = 1e-7):
+    # the product of the poles is a2, so the response decays with sqrt(a2) per sample
+    poleRadius = math.sqrt(abs(coefficients[1][2]))
+    if poleRadius >= 1: return sampleRate * 10
+    if poleRadius == 0: return 3
+    return min(int(math.log(tolerance) / math.log(poleRadius)) + 3, sampleRate * 10)
+
+
+# Envelope
+###########################################
+
+def getEnvelopeFactor(sampleRate, time):
+    # the envelope reaches 10% of the difference after the given time
+    if time <= 0: return 0.0
+    return 0.1 ** (1 / (sampleRate * time))
+
+class EnvelopeFollower:
+    '''
+    y = (attack if x > y else release) * (y - x) + x
+
+    Every sample depends on the previous one, so numpy can't calculate this
+    directly. Instead the window is split into segments that are calculated
+    side by side. A segment starts with the samples before it, so that the
+    initial value has been forgotten when the segment begins.
+    '''
+
+    def __init__(self, bandAmount, attackFactor, releaseFactor, tolerance = 1e-4):
+        self.attackFactor = attackFactor
+        self.releaseFactor = releaseFactor
+        self.state = numpy.zeros(bandAmount, dtype = "f")
+        # the distance between two envelopes shrinks at least by the larger factor per sample
+        slowestFactor = max(attackFactor, releaseFactor)
+        if slowestFactor <= 0: self.warmUpLength = 1
+        else: self.warmUpLength = int(math.ceil(math.log(tolerance) / math.log(slowestFactor)))
+        self.history = numpy.zeros((bandAmount, self.warmUpLength), dtype = "f")
+
+    def process(self, values, positions):
+        '''
+        Continues the envelope with the (bandAmount, length) array and returns the envelope
+        at the given positions. Position -1 is the last sample of the previous call.
+        '''
+        values = numpy.asarray(values, dtype = "f")
+        bandAmount, length = values.shape
+        warmUp = self.warmUpLength
+        if length == 0: return numpy.zeros((bandAmount, len(positions)), dtype = "f")
+
+        if length < 4 * warmUp:
+            # not worth splitting, the initial state is known exactly
+            warmUp = 0
+            segmentLength = length
+        else:
+            segmentLength = max(warmUp, 2**14)
+        segmentAmount = int(math.ceil(length / segmentLength))
+
+        extended = numpy.zeros((bandAmount, warmUp + segmentAmount * segmentLength), dtype = "f")
+        extended[:, :warmUp] = self.history[:, self.history.shape[1] - warmUp:]
+        extended[:, warmUp:warmUp + length] = values
+
+        # (bandAmount, segmentAmount, warmUp + segmentLength) view with the inputs of all segments
+        bandStride, sampleStride = extended.strides
+        inputs = as_strided(extended,
+            shape = (bandAmount, segmentAmount, warmUp + segmentLength),
+            strides = (bandStride, segmentLength * sampleStride, sampleStride))
+        # one contiguous (bandAmount, segmentAmount) row per step is much faster to process
+        inputs = numpy.ascontiguousarray(inputs.transpose(2, 0, 1))
+        outputs = numpy.empty((segmentLength, bandAmount, segmentAmount), dtype = "f")
+
+        current = numpy.zeros((bandAmount, segmentAmount), dtype = "f")
+        buffers = EnvelopeBuffers(current.shape)
+        for x in inputs[:warmUp]:
+            self.followStep(x, current, current, buffers)
+        # the first segment continues from the known state
+        current[:, 0] = self.state
+        for x, y in zip(inputs[warmUp:], outputs):
+            self.followStep(x, current, y, buffers)
+            current = y
+
+        def getValues(indices):
+            segments, steps = divmod(numpy.maximum(indices, 0), segmentLength)
+            result = outputs[steps, :, segments]
+            result[indices < 0] = self.state
+            return result.T
+
+        positions = numpy.asarray(positions, dtype = "d")
+        lower = numpy.floor(positions).astype("int64")
+        weights = (positions - lower).astype("f")
+        result = getValues(lower) * (1 - weights) + getValues(numpy.minimum(lower + 1, length - 1)) * weights
+
+        self.state = getValues(numpy.array([length - 1]))[:, 0].copy()
+        self.history = numpy.concatenate((self.history, values[:, -self.warmUpLength:]), axis = 1)[:, -self.warmUpLength:]
+        return result
+
+    def followStep(self, x, current, out, buffers):
+        numpy.greater(x, current, out = buffers.isAttack)
+        numpy.multiply(buffers.isAttack, self.attackFactor - self.releaseFactor, out = buffers.factors)
+        buffers.factors += self.releaseFactor
+        numpy.subtract(current, x, out = buffers.difference)
+        buffers.difference *= buffers.factors
+        numpy.add(buffers.difference, x, out = out)
+
+class EnvelopeBuffers:
+    def __init__(self, shape):
+        self.isAttack = numpy.empty(shape, dtype = bool)
+        self.factors = numpy.empty(shape, dtype = "f")
+        self.difference = numpy.empty(shape, dtype = "f")
+
+def nextPowerOfTwo(n):
+    return 1 << max(int(n) - 1, 0).bit_length()
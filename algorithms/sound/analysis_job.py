@@ -0,0 +1,53 @@
+import threading
+from . cache import analyseSoundFileCached
+
+class AnalysisCancelled(Exception):
+    pass
+
+class SoundAnalysisJob:
+    '''
+    Analyses a sound file in a background thread.
+    Nothing in here accesses Blender data, so the result has to be
+    committed by the main thread once the job is finished.
+    '''
+
+    def __init__(self, soundFile, frequencyRanges, attack, release, frameRate, cache):
+        self.soundFile = soundFile
+        self.frequencyRanges = list(frequencyRanges)
+        self.attack = attack
+        self.release = release
+        self.frameRate = frameRate
+        self.cache = cache
+
+        self.isCancelled = False
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target = self.run, daemon = True)
+        self.thread.start()
+
+    def cancel(self):
+        self.isCancelled = True
+
+    @property
+    def isFinished(self):
+        return self.thread is not None and not self.thread.is_alive()
+
+    def run(self):
+        try:
+            self.result = analyseSoundFileCached(self.soundFile, self.frequencyRanges,
+                self.attack, self.release, self.frameRate, self.cache, self.setProgress)
+        except AnalysisCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+
+    def setProgress(self, fraction):
+        self.progress = fraction
+        self.checkCancelled()
+
+    def checkCancelled(self):
+        if self.isCancelled: raise AnalysisCancelled()
@@ -0,0 +1,175 @@
+import os
+import numpy
+import hashlib
+import tempfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from . analysis import loadSound, calculateBandEnvelopes
+
+'''
+The envelope of every frequency range is stored in its own .npy file.
+The file name is a hash of the sound content and all bake settings, so the
+same sound can be used by many .blend files and computers sharing the directory.
+'''
+
+# change this when the analysis produces different results
+analysisVersion = 1
+
+class SoundFile:
+    '''Sound that is stored in a file or packed into the .blend file'''
+
+    def __init__(self, path, packedData = None):
+        self.path = path
+        self.packedData = packedData
+
+    def getContentHash(self):
+        if self.packedData is not None:
+            return hashlib.sha1(self.packedData).hexdigest()
+        return getFileContentHash(self.path)
+
+    @contextmanager
+    def getFilePath(self):
+        '''Packed sounds are written to a temporary file as long as the path is used'''
+        if self.packedData is None:
+            yield self.path
+            return
+
+        extension = os.path.splitext(self.path)[1]
+        handle, path = tempfile.mkstemp(suffix = extension)
+        try:
+            with os.fdopen(handle, "wb") as file:
+                file.write(self.packedData)
+            yield path
+        finally:
+            os.remove(path)
+
+# path -> (size, modification time, hash), least recently used paths come first
+fileHashCache = OrderedDict()
+maxFileHashCacheSize = 64
+
+def getFileContentHash(path):
+    status = os.stat(path)
+    fileInfo = (status.st_size, status.st_mtime)
+    cached = fileHashCache.get(path)
+    if cached is not None and cached[:2] == fileInfo:
+        fileHashCache.move_to_end(path)
+        return cached[2]
+
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(2**20), b""):
+            sha1.update(block)
+    contentHash = sha1.hexdigest()
+
+    fileHashCache[path] = fileInfo + (contentHash, )
+    fileHashCache.move_to_end(path)
+    if len(fileHashCache) > maxFileHashCacheSize:
+        fileHashCache.popitem(last = False)
+    return contentHash
+
+
+# directory -> total size of the .npy files when it was checked last plus the files saved since then,
+# a new AnalysisCache is created for every bake, so this is stored outside of it
+knownCacheSizes = {}
+
+class AnalysisCache:
+    '''Directory with .npy files that is limited to a maximum size (least recently used files are removed first)'''
+
+    # when files are removed, the cache is reduced to this fraction of the maximum size,
+    # so that the directory doesn't have to be checked again for the next saved files
+    reducedSizeFactor = 0.8
+
+    def __init__(self, directory, maxSize):
+        self.directory = directory
+        self.maxSize = maxSize
+
+    def load(self, key):
+        path = self.getPath(key)
+        try:
+            envelope = numpy.load(path)
+        except (IOError, OSError, ValueError):
+            return None
+        # the modification time is used to find the least recently used files
+        try: os.utime(path)
+        except OSError: pass
+        return envelope
+
+    def save(self, key, envelope):
+        try:
+            os.makedirs(self.directory, exist_ok = True)
+            # other processes should never see incomplete files
+            handle, temporaryPath = tempfile.mkstemp(suffix = ".tmp", dir = self.directory)
+        except OSError:
+            return
+
+        replaced = False
+        try:
+            with os.fdopen(handle, "wb") as file:
+                numpy.save(file, numpy.asarray(envelope, dtype = "f"))
+            os.replace(temporaryPath, self.getPath(key))
+            replaced = True
+        except OSError:
+            return
+        finally:
+            if not replaced:
+                try: os.remove(temporaryPath)
+                except OSError: pass
+        self.fileSaved(self.getPath(key))
+
+    def fileSaved(self, path):
+        try: size = os.stat(path).st_size
+        except OSError: size = 0
+        knownSize = knownCacheSizes.get(self.directory)
+        # listing the directory is only necessary when the cache might be too large
+        if knownSize is None or knownSize + size > self.maxSize:
+            self.removeLeastRecentlyUsed()
+        else:
+            knownCacheSizes[self.directory] = knownSize + size
+
+    def removeLeastRecentlyUsed(self):
+        files = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npy"): continue
+            path = os.path.join(self.directory, name)
+            try: status = os.stat(path)
+            except OSError: continue
+            files.append((status.st_mtime, status.st_size, path))
+
+        totalSize = sum(size for _, size, _ in files)
+        if totalSize > self.maxSize:
+            for _, size, path in sorted(files):
+                if totalSize <= self.maxSize * self.reducedSizeFactor: break
+                try: os.remove(path)
+                except OSError: continue
+                totalSize -= size
+        knownCacheSizes[self.directory] = totalSize
+
+    def getPath(self, key):
+        return os.path.join(self.directory, key + ".npy")
+
+def getEnvelopeKey(contentHash, frequencyRange, attack, release, frameRate):
+    settings = (analysisVersion, contentHash, tuple(frequencyRange), attack, release, frameRate)
+    return hashlib.sha1(repr(settings).encode("utf-8")).hexdigest()
+
+
+def analyseSoundFileCached(soundFile, frequencyRanges, attack, release, frameRate, cache, progress = None):
+    '''Same as analyseSoundFile, but only the frequency ranges that are not in the cache are calculated'''
+    if len(frequencyRanges) == 0: return numpy.zeros((0, 0), dtype = "f")
+    contentHash = soundFile.getContentHash()
+    keys = [getEnvelopeKey(contentHash, frequencyRange, attack, release, frameRate)
+            for frequencyRange in frequencyRanges]
+    envelopes = [cache.load(key) for key in keys]
+
+    missingIndices = [i for i, envelope in enumerate(envelopes) if envelope is None]
+    if len(missingIndices) > 0:
+        with soundFile.getFilePath() as path:
+            samples, sampleRate = loadSound(path)
+        missingRanges = [frequencyRanges[i] for i in missingIndices]
+        newEnvelopes = calculateBandEnvelopes(samples, sampleRate, missingRanges,
+            attack, release, frameRate, progress = progress)
+        for i, envelope in zip(missingIndices, newEnvelopes):
+            cache.save(keys[i], envelope)
+            envelopes[i] = envelope
+
+    if progress is not None: progress(1.0)
+    return numpy.array(envelopes, dtype = "f").reshape(len(frequencyRanges), -1)
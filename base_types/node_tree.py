@@ -3,6 +3,7 @@ import time
 from bpy.props import *
 from .. utils.handlers import eventHandler
 from .. utils.nodes import getAnimationNodeTrees
+from .. utils.id_reference import validateObjectNameIndex
 from . tree_auto_execution import AutoExecutionProperties
 from .. events import treeChanged, isRendering, propertyChanged
 from .. utils.blender_ui import iterActiveScreens, isViewportRendering
@@ -86,6 +87,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
         self.autoExecution.lastExecutionTimestamp = time.clock()
 
     def execute(self):
+        validateObjectNameIndex()
         setupExecutionUnits()
         self._execute()
         finishExecutionUnits()
@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import *
 from .. utils.blender_ui import getDpiFactor
-from .. utils.id_reference import tryToFindObjectReference
+from .. utils.id_reference import tryToFindObjectReference, findObjectByName
 
 triggerTypeItems = [
     ("MONITOR_PROPERTY", "Monitor Property", "", "", 0)]
@@ -51,7 +51,7 @@ class AutoExecutionTrigger_MonitorProperty(bpy.types.PropertyGroup):
 
     def getObject(self):
         if self.idType == "OBJECT":
-            return bpy.data.objects.get(self.idObjectName)
+            return findObjectByName(self.idObjectName)
         elif self.idType == "SCENE":
             return bpy.data.scenes.get(self.idObjectName)
 
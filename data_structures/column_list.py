@@ -0,0 +1,144 @@
+import numpy
+from collections.abc import Sequence
+
+class ColumnList(Sequence):
+    '''
+    Base class for list types that store their elements as
+    parallel numpy arrays (one array per attribute) instead
+    of one Python object per element.
+
+    Subclasses have to implement:
+        __len__, getElement, take, copy, fromElements, join
+    They can overwrite setElement with a faster version.
+
+    Everything else a node expects from a Python list
+    (slicing, iteration, concatenation, append, ...) is
+    implemented here on top of these functions.
+    '''
+    __slots__ = ()
+
+    # Overwrite in subclasses
+    ##########################################################
+
+    def __len__(self):
+        raise NotImplementedError()
+
+    def getElement(self, index):
+        raise NotImplementedError()
+
+    def setElement(self, index, element):
+        indices = numpy.arange(len(self))
+        self._assign(self.join([self.take(indices[:index]),
+                                self.fromElements([element]),
+                                self.take(indices[index + 1:])]))
+
+    def take(self, indices):
+        '''Create a new list that contains the elements at the given indices'''
+        raise NotImplementedError()
+
+    def copy(self):
+        raise NotImplementedError()
+
+    @classmethod
+    def fromElements(cls, elements):
+        raise NotImplementedError()
+
+    @classmethod
+    def join(cls, lists):
+        raise NotImplementedError()
+
+    ##########################################################
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return self.take(numpy.arange(len(self))[key])
+        return self.getElement(self._normalizeIndex(key))
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            raise TypeError("slice assignment is not supported")
+        self.setElement(self._normalizeIndex(key), value)
+
+    def __delitem__(self, key):
+        mask = numpy.ones(len(self), dtype = bool)
+        if isinstance(key, slice): mask[key] = False
+        else: mask[self._normalizeIndex(key)] = False
+        self._assign(self.take(numpy.flatnonzero(mask)))
+
+    def __iter__(self):
+        getElement = self.getElement
+        for i in range(len(self)):
+            yield getElement(i)
+
+    def __add__(self, other):
+        if isinstance(other, type(self)):
+            return self.join([self, other])
+        return list(self) + list(other)
+
+    def __radd__(self, other):
+        if isinstance(other, type(self)):
+            return self.join([other, self])
+        return list(other) + list(self)
+
+    def __repr__(self):
+        return "<{} with {} elements>".format(type(self).__name__, len(self))
+
+    def append(self, element):
+        self._assign(self.join([self, self.fromElements([element])]))
+
+    def extend(self, elements):
+        if not isinstance(elements, type(self)):
+            elements = self.fromElements(list(elements))
+        self._assign(self.join([self, elements]))
+
+    def remove(self, element):
+        del self[self.index(element)]
+
+    def reverse(self):
+        self._assign(self.take(numpy.arange(len(self))[::-1]))
+
+    def toList(self):
+        return list(self)
+
+    def _normalizeIndex(self, index):
+        length = len(self)
+        if index < 0: index += length
+        if not 0 <= index < length:
+            raise IndexError("list index out of range")
+        return index
+
+    def _assign(self, other):
+        for name in self._getSlotNames():
+            setattr(self, name, getattr(other, name))
+
+    @classmethod
+    def _getSlotNames(cls):
+        names = []
+        for baseClass in cls.__mro__:
+            names.extend(getattr(baseClass, "__slots__", ()))
+        return names
+
+
+def takeRagged(values, starts, lengths, indices):
+    '''
+    Select the sub arrays at the given indices from a ragged array
+    that is stored as one flat array with start and length per element.
+    Returns the new flat values, starts and lengths.
+    '''
+    lengths = lengths[indices]
+    newStarts = numpy.zeros(len(lengths), dtype = starts.dtype)
+    numpy.cumsum(lengths[:-1], out = newStarts[1:])
+    gather = numpy.repeat(starts[indices] - newStarts, lengths) + numpy.arange(lengths.sum())
+    return values[gather], newStarts, lengths
+
+def joinRagged(parts):
+    '''
+    Concatenate multiple ragged arrays given as (values, starts, lengths) tuples.
+    '''
+    parts = [takeRagged(values, starts, lengths, numpy.arange(len(lengths)))
+             for values, starts, lengths in parts]
+    values = numpy.concatenate([part[0] for part in parts])
+    lengths = numpy.concatenate([part[2] for part in parts])
+    starts = numpy.zeros(len(lengths), dtype = lengths.dtype)
+    numpy.cumsum(lengths[:-1], out = starts[1:])
+    return values, starts, lengths
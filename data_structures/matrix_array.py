@@ -0,0 +1,184 @@
+import numpy
+from mathutils import Matrix
+from . column_list import ColumnList
+from . vector_array import VectorArray, asVectorData
+
+class MatrixArray(ColumnList):
+    '''
+    List of 4x4 matrices that is stored in a (N, 4, 4) numpy array.
+    The matrices are stored row by row like in mathutils.Matrix.
+    '''
+    __slots__ = ("data", )
+
+    @classmethod
+    def fromElements(cls, matrices, dtype = "f"):
+        if len(matrices) == 0: return MatrixArray(numpy.zeros((0, 4, 4), dtype = dtype))
+        return MatrixArray(numpy.array([[tuple(row) for row in matrix] for matrix in matrices], dtype = dtype))
+
+    @classmethod
+    def fromValue(cls, value, dtype = "f"):
+        '''Create a MatrixArray from another MatrixArray or a list of matrices without copying if possible'''
+        if isinstance(value, MatrixArray): return value
+        return cls.fromElements(value, dtype)
+
+    @classmethod
+    def join(cls, matrixArrays):
+        return MatrixArray(numpy.concatenate([matrices.data for matrices in matrixArrays]))
+
+    @classmethod
+    def identity(cls, amount, dtype = "f"):
+        return MatrixArray(numpy.tile(numpy.identity(4, dtype = dtype), (amount, 1, 1)))
+
+    @classmethod
+    def compose(cls, translations = None, rotations = None, scales = None, amount = None, dtype = "f"):
+        '''
+        Same as composeMatrix in utils.math for many matrices at once.
+        Every argument can be None, a single value or a list with one value per matrix.
+        The rotations are XYZ euler angles.
+        '''
+        if amount is None:
+            amount = max(len(value) if getattr(value, "ndim", 1) == 2 else 1
+                         for value in map(_asArrayOrNone, (translations, rotations, scales)))
+
+        matrices = numpy.zeros((amount, 4, 4), dtype = dtype)
+        matrices[:, 3, 3] = 1
+
+        if rotations is None: matrices[:, :3, :3] = numpy.identity(3)
+        else: matrices[:, :3, :3] = eulersToRotationMatrices(asVectorData(rotations, dtype))
+
+        if scales is not None:
+            # scaling the columns is the same as multiplying with a scale matrix from the right
+            matrices[:, :3, :3] *= asVectorData(scales, dtype)[..., numpy.newaxis, :]
+
+        if translations is not None:
+            matrices[:, :3, 3] = asVectorData(translations, dtype)
+        return MatrixArray(matrices)
+
+    def __init__(self, data):
+        data = numpy.asarray(data)
+        if data.dtype not in (numpy.float32, numpy.float64):
+            data = data.astype("f")
+        self.data = data.reshape(-1, 4, 4)
+
+    def __len__(self):
+        return len(self.data)
+
+    def getElement(self, index):
+        return Matrix(self.data[index].tolist())
+
+    def setElement(self, index, matrix):
+        self.data[index] = [tuple(row) for row in matrix]
+
+    def take(self, indices):
+        return MatrixArray(self.data[indices])
+
+    def copy(self):
+        return MatrixArray(self.data.copy())
+
+    def toList(self):
+        return list(map(Matrix, self.data.tolist()))
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+
+    # Vectorized Operations
+    ##########################################################
+
+    def multiply(self, other):
+        '''self[i] * other[i]; other can be a single matrix or a list with the same length'''
+        return MatrixArray(numpy.einsum("...ij,...jk->...ik", self.data, asMatrixData(other, self.dtype)))
+
+    def multiplyLeft(self, other):
+        '''other[i] * self[i]; other can be a single matrix or a list with the same length'''
+        return MatrixArray(numpy.einsum("...ij,...jk->...ik", asMatrixData(other, self.dtype), self.data))
+
+    def inverted(self):
+        '''Singular matrices are replaced by the identity matrix like in matrix.inverted(Matrix.Identity(4))'''
+        result = numpy.tile(numpy.identity(4, dtype = self.dtype), (len(self), 1, 1))
+        # mathutils only rejects matrices whose determinant is exactly zero,
+        # so matrices with a very small scale can still be inverted
+        invertible = numpy.linalg.det(self.data) != 0
+        if invertible.any():
+            try: result[invertible] = numpy.linalg.inv(self.data[invertible])
+            except numpy.linalg.LinAlgError:
+                # rounding can make the determinant non zero for singular matrices
+                for index in numpy.flatnonzero(invertible).tolist():
+                    try: result[index] = numpy.linalg.inv(self.data[index])
+                    except numpy.linalg.LinAlgError: pass
+        return MatrixArray(result)
+
+    def combine(self):
+        '''Same as self[n - 1] * ... * self[1] * self[0]'''
+        data = self.data
+        if len(data) == 0: return Matrix.Identity(4)
+        # multiply neighbours pairwise until one matrix is left
+        while len(data) > 1:
+            pairAmount = len(data) // 2
+            products = numpy.einsum("nij,njk->nik", data[1:2 * pairAmount:2], data[0:2 * pairAmount:2])
+            if len(data) % 2 == 1: products = numpy.concatenate((products, data[-1:]))
+            data = products
+        return Matrix(data[0].tolist())
+
+    def transformVectors(self, vectors):
+        '''self[i] * vectors[i] or self[i] * vector for a single vector'''
+        vectors = asVectorData(vectors, self.dtype)
+        return VectorArray(numpy.einsum("...ij,...j->...i", self.data[:, :3, :3], vectors) + self.data[:, :3, 3])
+
+    def getTranslations(self):
+        return VectorArray(self.data[:, :3, 3].copy())
+
+    def getScales(self):
+        return VectorArray(numpy.sqrt(numpy.einsum("nij,nij->nj", self.data[:, :3, :3], self.data[:, :3, :3])))
+
+    def getRotations(self):
+        '''XYZ euler angles as (N, 3) array'''
+        scales = self.getScales().data
+        scales[scales == 0] = 1
+        return rotationMatricesToEulers(self.data[:, :3, :3] / scales[:, numpy.newaxis, :])
+
+    def decompose(self):
+        return self.getTranslations(), self.getRotations(), self.getScales()
+
+
+def asMatrixData(value, dtype = "f"):
+    '''Returns a (4, 4) array for a single matrix or a (N, 4, 4) array for a matrix list'''
+    if isinstance(value, MatrixArray): return value.data
+    if isinstance(value, Matrix): return numpy.array(value, dtype = dtype)
+    return MatrixArray.fromElements(value, dtype).data
+
+def _asArrayOrNone(value):
+    if value is None: return None
+    return asVectorData(value)
+
+def eulersToRotationMatrices(eulers):
+    '''(N, 3) XYZ euler angles to (N, 3, 3) rotation matrices (Rz * Ry * Rx)'''
+    eulers = numpy.atleast_2d(eulers)
+    cx, cy, cz = numpy.cos(eulers).T
+    sx, sy, sz = numpy.sin(eulers).T
+
+    matrices = numpy.empty((len(eulers), 3, 3), dtype = eulers.dtype)
+    matrices[:, 0, 0] = cy * cz
+    matrices[:, 0, 1] = sx * sy * cz - cx * sz
+    matrices[:, 0, 2] = cx * sy * cz + sx * sz
+    matrices[:, 1, 0] = cy * sz
+    matrices[:, 1, 1] = sx * sy * sz + cx * cz
+    matrices[:, 1, 2] = cx * sy * sz - sx * cz
+    matrices[:, 2, 0] = -sy
+    matrices[:, 2, 1] = sx * cy
+    matrices[:, 2, 2] = cx * cy
+    return matrices
+
+def rotationMatricesToEulers(matrices):
+    '''(N, 3, 3) normalized rotation matrices to (N, 3) XYZ euler angles'''
+    eulers = numpy.empty((len(matrices), 3), dtype = matrices.dtype)
+    cy = numpy.hypot(matrices[:, 0, 0], matrices[:, 1, 0])
+    regular = cy > 16 * numpy.finfo(numpy.float32).eps
+
+    eulers[:, 1] = numpy.arctan2(-matrices[:, 2, 0], cy)
+    eulers[:, 0] = numpy.where(regular,
+        numpy.arctan2(matrices[:, 2, 1], matrices[:, 2, 2]),
+        numpy.arctan2(-matrices[:, 1, 2], matrices[:, 1, 1]))
+    eulers[:, 2] = numpy.where(regular, numpy.arctan2(matrices[:, 1, 0], matrices[:, 0, 0]), 0)
+    return eulers
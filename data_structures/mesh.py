@@ -1,7 +1,10 @@
 import bpy
 import bmesh
+import numpy
 import itertools
 from mathutils import Vector
+from . vector_array import transformVectors
+from . column_list import ColumnList, takeRagged, joinRagged
 
 class MeshData:
     __slots__ = ("vertices", "edges", "polygons")
@@ -80,7 +83,7 @@ class Vertex:
         self.groupWeights = groupWeights
 
     def copy(self):
-        return Vertex(self.location.copy(), self.normal.copy(), self.groupWeights[:])
+        return Vertex(self.location.copy(), self.normal.copy(), list(self.groupWeights))
 
 
 class Polygon:
@@ -125,13 +128,318 @@ class Polygon:
 
     def copy(self):
         return Polygon(copyVectorList(self.vertexLocations), self.normal.copy(),
-                       self.center, self.area, self.materialIndex)
+                       self.center.copy(), self.area, self.materialIndex)
 
     def __repr__(self):
         return "<Polygon - Center: ({:.3f}, {:.3f}, {:.3f}), Verts: {}>".format(
             self.center.x, self.center.y, self.center.z, len(self.vertexLocations))
 
 
+class VertexView(Vertex):
+    '''
+    Vertex with the values that an element of a VertexList had when the view
+    was created. Setting an attribute also writes it back to the list.
+    The values are copied, so that swapping elements doesn't mix them up.
+    They are read-only, changing them in place (vertex.location.x = 1)
+    raises an error because it could not change the list.
+    '''
+    __slots__ = ("source", "index", "_location", "_normal", "_groupWeights")
+
+    def __init__(self, source, index):
+        self.source = source
+        self.index = index
+        self._location = frozenVector(source.locations[index])
+        self._normal = frozenVector(source.normals[index])
+        start = source.groupWeightStarts[index]
+        self._groupWeights = ReadOnlyList(source.groupWeights[start:start + source.groupWeightLengths[index]].tolist())
+
+    @property
+    def location(self):
+        return self._location
+
+    @location.setter
+    def location(self, value):
+        self._location = frozenVector(value)
+        self.source.locations[self.index] = value
+
+    @property
+    def normal(self):
+        return self._normal
+
+    @normal.setter
+    def normal(self, value):
+        self._normal = frozenVector(value)
+        self.source.normals[self.index] = value
+
+    @property
+    def groupWeights(self):
+        return self._groupWeights
+
+    @groupWeights.setter
+    def groupWeights(self, value):
+        self._groupWeights = ReadOnlyList(value)
+        self.source[self.index] = Vertex(self._location, self._normal, self._groupWeights)
+
+
+class VertexList(ColumnList):
+    __slots__ = ("locations", "normals", "groupWeights", "groupWeightStarts", "groupWeightLengths")
+
+    @staticmethod
+    def fromMeshVertices(meshVertices, transformation = None, normalTransformation = None):
+        amount = len(meshVertices)
+        locations = numpy.empty(amount * 3, dtype = "f")
+        normals = numpy.empty(amount * 3, dtype = "f")
+        meshVertices.foreach_get("co", locations)
+        meshVertices.foreach_get("normal", normals)
+
+        weights = [[group.weight for group in vertex.groups] for vertex in meshVertices]
+        lengths = numpy.fromiter(map(len, weights), dtype = "i", count = amount)
+        flatWeights = numpy.fromiter(itertools.chain.from_iterable(weights), dtype = "f")
+
+        vertices = VertexList(locations, normals, flatWeights, None, lengths)
+        if transformation is not None:
+            vertices.locations = transformVectors(vertices.locations, transformation)
+            vertices.normals = transformVectors(vertices.normals, normalTransformation)
+        return vertices
+
+    @classmethod
+    def fromElements(cls, vertices):
+        weights = [vertex.groupWeights for vertex in vertices]
+        return VertexList(
+            [tuple(vertex.location) for vertex in vertices],
+            [tuple(vertex.normal) for vertex in vertices],
+            numpy.fromiter(itertools.chain.from_iterable(weights), dtype = "f"),
+            None,
+            numpy.fromiter(map(len, weights), dtype = "i", count = len(weights)))
+
+    @classmethod
+    def join(cls, vertexLists):
+        weights, starts, lengths = joinRagged([(v.groupWeights, v.groupWeightStarts, v.groupWeightLengths) for v in vertexLists])
+        return VertexList(
+            numpy.concatenate([v.locations for v in vertexLists]),
+            numpy.concatenate([v.normals for v in vertexLists]),
+            weights, starts, lengths)
+
+    def __init__(self, locations, normals, groupWeights = None, groupWeightStarts = None, groupWeightLengths = None):
+        self.locations = numpy.asarray(locations, dtype = "f").reshape(-1, 3)
+        self.normals = numpy.asarray(normals, dtype = "f").reshape(-1, 3)
+        amount = len(self.locations)
+
+        if groupWeights is None:
+            groupWeights = numpy.zeros(0, dtype = "f")
+            groupWeightLengths = numpy.zeros(amount, dtype = "i")
+        self.groupWeights = numpy.asarray(groupWeights, dtype = "f")
+        self.groupWeightLengths = numpy.asarray(groupWeightLengths, dtype = "i")
+
+        if groupWeightStarts is None:
+            groupWeightStarts = numpy.zeros(amount, dtype = "i")
+            numpy.cumsum(self.groupWeightLengths[:-1], out = groupWeightStarts[1:])
+        self.groupWeightStarts = numpy.asarray(groupWeightStarts, dtype = "i")
+
+    def __len__(self):
+        return len(self.locations)
+
+    def getElement(self, index):
+        return VertexView(self, index)
+
+    def setElement(self, index, vertex):
+        if len(vertex.groupWeights) != self.groupWeightLengths[index]:
+            ColumnList.setElement(self, index, vertex)
+        else:
+            start = self.groupWeightStarts[index]
+            self.groupWeights[start:start + self.groupWeightLengths[index]] = vertex.groupWeights
+            self.locations[index] = vertex.location
+            self.normals[index] = vertex.normal
+
+    def take(self, indices):
+        weights, starts, lengths = takeRagged(self.groupWeights, self.groupWeightStarts, self.groupWeightLengths, indices)
+        return VertexList(self.locations[indices], self.normals[indices], weights, starts, lengths)
+
+    def copy(self):
+        return VertexList(self.locations.copy(), self.normals.copy(), self.groupWeights.copy(),
+                          self.groupWeightStarts.copy(), self.groupWeightLengths.copy())
+
+
+class PolygonView(Polygon):
+    '''
+    Polygon with the values that an element of a PolygonList had when the view
+    was created. Setting an attribute also writes it back to the list.
+    The values are copied, so that swapping elements doesn't mix them up.
+    Like in VertexView they can't be changed in place.
+    '''
+    __slots__ = ("source", "index", "_vertexLocations", "_normal", "_center", "_area", "_materialIndex")
+
+    def __init__(self, source, index):
+        self.source = source
+        self.index = index
+        start = source.polygonStarts[index]
+        end = start + source.polygonLengths[index]
+        self._vertexLocations = ReadOnlyList(map(frozenVector, source.vertexLocations[start:end]))
+        self._normal = frozenVector(source.normals[index])
+        self._center = frozenVector(source.centers[index])
+        self._area = float(source.areas[index])
+        self._materialIndex = int(source.materialIndices[index])
+
+    @property
+    def vertexLocations(self):
+        return self._vertexLocations
+
+    @vertexLocations.setter
+    def vertexLocations(self, value):
+        self._vertexLocations = ReadOnlyList(map(frozenVector, value))
+        source = self.source
+        if len(value) == source.polygonLengths[self.index]:
+            start = source.polygonStarts[self.index]
+            source.vertexLocations[start:start + len(value)] = [tuple(location) for location in value]
+        else:
+            source[self.index] = Polygon(self._vertexLocations, self._normal, self._center, self._area, self._materialIndex)
+
+    @property
+    def normal(self):
+        return self._normal
+
+    @normal.setter
+    def normal(self, value):
+        self._normal = frozenVector(value)
+        self.source.normals[self.index] = value
+
+    @property
+    def center(self):
+        return self._center
+
+    @center.setter
+    def center(self, value):
+        self._center = frozenVector(value)
+        self.source.centers[self.index] = value
+
+    @property
+    def area(self):
+        return self._area
+
+    @area.setter
+    def area(self, value):
+        self._area = float(value)
+        self.source.areas[self.index] = value
+
+    @property
+    def materialIndex(self):
+        return self._materialIndex
+
+    @materialIndex.setter
+    def materialIndex(self, value):
+        self._materialIndex = int(value)
+        self.source.materialIndices[self.index] = value
+
+
+class PolygonList(ColumnList):
+    __slots__ = ("vertexLocations", "polygonStarts", "polygonLengths",
+                 "normals", "centers", "areas", "materialIndices")
+
+    @staticmethod
+    def fromMesh(mesh, transformation = None, normalTransformation = None, scale = 1):
+        meshPolygons = mesh.polygons
+        amount = len(meshPolygons)
+
+        loopStarts = numpy.empty(amount, dtype = "i")
+        loopTotals = numpy.empty(amount, dtype = "i")
+        normals = numpy.empty(amount * 3, dtype = "f")
+        centers = numpy.empty(amount * 3, dtype = "f")
+        areas = numpy.empty(amount, dtype = "f")
+        materialIndices = numpy.empty(amount, dtype = "i")
+        meshPolygons.foreach_get("loop_start", loopStarts)
+        meshPolygons.foreach_get("loop_total", loopTotals)
+        meshPolygons.foreach_get("normal", normals)
+        meshPolygons.foreach_get("center", centers)
+        meshPolygons.foreach_get("area", areas)
+        meshPolygons.foreach_get("material_index", materialIndices)
+
+        loopVertexIndices = numpy.empty(len(mesh.loops), dtype = "i")
+        mesh.loops.foreach_get("vertex_index", loopVertexIndices)
+        allVertexLocations = numpy.empty(len(mesh.vertices) * 3, dtype = "f")
+        mesh.vertices.foreach_get("co", allVertexLocations)
+        allVertexLocations = allVertexLocations.reshape(-1, 3)
+
+        # loops are not guaranteed to be sorted by polygon
+        cornerIndices, starts, lengths = takeRagged(loopVertexIndices, loopStarts, loopTotals, numpy.arange(amount))
+        polygons = PolygonList(allVertexLocations[cornerIndices], starts, lengths,
+                               normals, centers, areas, materialIndices)
+
+        if transformation is not None:
+            polygons.vertexLocations = transformVectors(polygons.vertexLocations, transformation)
+            polygons.centers = transformVectors(polygons.centers, transformation)
+            polygons.normals = transformVectors(polygons.normals, normalTransformation)
+            polygons.areas *= scale
+        return polygons
+
+    @classmethod
+    def fromElements(cls, polygons):
+        allLocations = [polygon.vertexLocations for polygon in polygons]
+        return PolygonList(
+            [tuple(location) for location in itertools.chain.from_iterable(allLocations)],
+            None,
+            numpy.fromiter(map(len, allLocations), dtype = "i", count = len(allLocations)),
+            [tuple(polygon.normal) for polygon in polygons],
+            [tuple(polygon.center) for polygon in polygons],
+            [polygon.area for polygon in polygons],
+            [polygon.materialIndex for polygon in polygons])
+
+    @classmethod
+    def join(cls, polygonLists):
+        locations, starts, lengths = joinRagged([(p.vertexLocations, p.polygonStarts, p.polygonLengths) for p in polygonLists])
+        return PolygonList(locations, starts, lengths,
+            numpy.concatenate([p.normals for p in polygonLists]),
+            numpy.concatenate([p.centers for p in polygonLists]),
+            numpy.concatenate([p.areas for p in polygonLists]),
+            numpy.concatenate([p.materialIndices for p in polygonLists]))
+
+    def __init__(self, vertexLocations, polygonStarts, polygonLengths, normals, centers, areas, materialIndices):
+        self.vertexLocations = numpy.asarray(vertexLocations, dtype = "f").reshape(-1, 3)
+        self.polygonLengths = numpy.asarray(polygonLengths, dtype = "i")
+        if polygonStarts is None:
+            polygonStarts = numpy.zeros(len(self.polygonLengths), dtype = "i")
+            numpy.cumsum(self.polygonLengths[:-1], out = polygonStarts[1:])
+        self.polygonStarts = numpy.asarray(polygonStarts, dtype = "i")
+        self.normals = numpy.asarray(normals, dtype = "f").reshape(-1, 3)
+        self.centers = numpy.asarray(centers, dtype = "f").reshape(-1, 3)
+        self.areas = numpy.asarray(areas, dtype = "f")
+        self.materialIndices = numpy.asarray(materialIndices, dtype = "i")
+
+    def __len__(self):
+        return len(self.polygonLengths)
+
+    def getElement(self, index):
+        return PolygonView(self, index)
+
+    def take(self, indices):
+        locations, starts, lengths = takeRagged(self.vertexLocations, self.polygonStarts, self.polygonLengths, indices)
+        return PolygonList(locations, starts, lengths, self.normals[indices], self.centers[indices],
+                           self.areas[indices], self.materialIndices[indices])
+
+    def copy(self):
+        return PolygonList(self.vertexLocations.copy(), self.polygonStarts.copy(), self.polygonLengths.copy(),
+                           self.normals.copy(), self.centers.copy(), self.areas.copy(), self.materialIndices.copy())
+
+    def toMeshData(self):
+        compact = self.take(numpy.arange(len(self)))
+        vertices = [Vector(location) for location in compact.vertexLocations]
+        polygonIndices = [tuple(range(start, start + length))
+                          for start, length in zip(compact.polygonStarts.tolist(), compact.polygonLengths.tolist())]
+        return MeshData(vertices, [], polygonIndices)
+
+
+def frozenVector(value):
+    return Vector(value).freeze()
+
+class ReadOnlyList(list):
+    '''List that raises an error when it is changed, copies of it are normal lists'''
+    __slots__ = ()
+
+    def _raiseReadOnlyError(self, *args, **kwargs):
+        raise TypeError("the values of list elements can't be changed in place, assign a new value instead")
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _raiseReadOnlyError
+    append = extend = insert = pop = remove = clear = reverse = sort = _raiseReadOnlyError
+
 def copyVectorList(list):
     return [vertex.copy() for vertex in list]
 
@@ -0,0 +1,102 @@
+import numpy
+from . column_list import ColumnList
+from .. algorithms.interpolation import evaluateInterpolationArray
+
+class NumberArray(ColumnList):
+    '''
+    List of floats or integers that is stored in a 1D numpy array.
+    Element access returns normal Python numbers.
+    '''
+    __slots__ = ("data", )
+
+    @classmethod
+    def fromElements(cls, numbers, dtype = "d"):
+        return NumberArray(numpy.fromiter(numbers, dtype = dtype, count = len(numbers)))
+
+    @classmethod
+    def fromValue(cls, value, dtype = None):
+        '''
+        Create a NumberArray from another NumberArray or a list of numbers without copying if possible.
+        When no dtype is given, lists that only contain integers become integer arrays.
+        '''
+        if isinstance(value, NumberArray):
+            if dtype is None or value.data.dtype == dtype: return value
+            return NumberArray(value.data.astype(dtype))
+        if dtype is None:
+            dtype = "int64" if all(isinstance(number, int) for number in value) else "d"
+        return cls.fromElements(value, dtype)
+
+    @classmethod
+    def join(cls, numberArrays):
+        return NumberArray(numpy.concatenate([numbers.data for numbers in numberArrays]))
+
+    @classmethod
+    def range(cls, amount, start, step, dtype = "d"):
+        '''Same as [start + i * step for i in range(amount)] converted to the dtype'''
+        numbers = start + numpy.arange(max(amount, 0), dtype = "d") * step
+        return NumberArray(numbers.astype(dtype))
+
+    def __init__(self, data):
+        self.data = numpy.asarray(data).reshape(-1)
+
+    def __len__(self):
+        return len(self.data)
+
+    def getElement(self, index):
+        return self.data[index].item()
+
+    def setElement(self, index, number):
+        self.data[index] = number
+
+    def take(self, indices):
+        return NumberArray(self.data[indices])
+
+    def copy(self):
+        return NumberArray(self.data.copy())
+
+    def toList(self):
+        return self.data.tolist()
+
+    @property
+    def isInteger(self):
+        return self.data.dtype.kind in "iu"
+
+
+    # Vectorized Operations
+    ##########################################################
+
+    def sum(self):
+        return self.data.sum().item()
+
+    def product(self):
+        return self.data.prod().item()
+
+    def min(self, default = 0):
+        return self.data.min().item() if len(self.data) > 0 else default
+
+    def max(self, default = 0):
+        return self.data.max().item() if len(self.data) > 0 else default
+
+    def average(self):
+        return self.data.mean().item() if len(self.data) > 0 else 0
+
+    def clamp(self, minValue, maxValue):
+        return NumberArray(numpy.minimum(numpy.maximum(self.data, minValue), maxValue))
+
+    def mapRange(self, inMin, inMax, outMin, outMax, clamp = True, interpolation = None):
+        if inMin == inMax: return NumberArray(numpy.zeros(len(self.data)))
+        values = self.data
+        if clamp:
+            values = numpy.clip(values, min(inMin, inMax), max(inMin, inMax))
+        factors = (values - inMin) / (inMax - inMin)
+        if interpolation is not None:
+            factors = evaluateInterpolationArray(interpolation, factors)
+        return NumberArray(outMin + factors * (outMax - outMin))
+
+    def toIntegers(self):
+        '''Same as int(number) for every number'''
+        if self.isInteger: return self.copy()
+        return NumberArray(self.data.astype("int64"))
+
+    def toFloats(self):
+        return NumberArray(self.data.astype("d"))
@@ -1,5 +1,7 @@
 import copy
+import numpy
 from mathutils import Vector
+from .. vector_array import VectorArray, rowLengths
 from . utils import findNearestParameterOnLine
 
 '''
@@ -12,6 +14,8 @@ How to use Splines:
 '''
 
 class Spline:
+    evaluationAttributes = ()
+
     def __getattr__(self, name):
         if name == "type": return "BASE_SPLINE"
         if name == "isCyclic": return False
@@ -26,6 +30,25 @@ class Spline:
     def copy(self):
         return copy.deepcopy(self)
 
+    def copyEvaluationData(self, source):
+        '''Reuse the segments and the uniform converter of an updated spline with the same points'''
+        # update() creates new arrays instead of changing them, so they can be shared
+        if source.isChanged: return
+        for name in self.evaluationAttributes:
+            setattr(self, name, getattr(source, name))
+        self.isEvaluable = source.isEvaluable
+        self.uniformConverter = source.uniformConverter
+        self.evaluationSource = source
+        self.isChanged = False
+
+    def getEvaluationSource(self):
+        source = self.evaluationSource
+        if source is None or source.isChanged or self.isChanged: return None
+        # one of the splines could have been changed and updated after copying
+        name = self.evaluationAttributes[0]
+        if getattr(source, name) is not getattr(self, name): return None
+        return source
+
 
     def transform(self, matrix):
         return self
@@ -51,6 +74,14 @@ class Spline:
         return Vector((0, 0, 1))
 
 
+    # subclasses can implement faster versions of these
+    def evaluateArray(self, parameters):
+        return numpy.array([tuple(self.evaluate(par)) for par in parameters], dtype = "d").reshape(-1, 3)
+
+    def evaluateTangentArray(self, parameters):
+        return numpy.array([tuple(self.evaluateTangent(par)) for par in parameters], dtype = "d").reshape(-1, 3)
+
+
     def appendPoints(self, points):
         for point in points:
             self.appendPoint(point)
@@ -66,17 +97,17 @@ class Spline:
 
     def getUniformSamples(self, amount, start = 0.0, end = 1.0, resolution = 100):
         self.ensureUniformConverter(resolution)
-        parameters = self.toUniformParameters(amount, start, end)
-        return [self.evaluate(par) for par in parameters]
+        parameters = self.toUniformParameterArray(self.getParameters(amount, start, end))
+        return VectorArray(self.evaluateArray(parameters))
 
     def getUniformTangentSamples(self, amount, start = 0.0, end = 1.0, resolution = 100):
         self.ensureUniformConverter(resolution)
-        parameters = self.toUniformParameters(amount, start, end)
-        return [self.evaluateTangent(par) for par in parameters]
+        parameters = self.toUniformParameterArray(self.getParameters(amount, start, end))
+        return VectorArray(self.evaluateTangentArray(parameters))
 
 
     def toUniformParameters(self, amount, start = 0.0, end = 1.0):
-        return [self.toUniformParameter(par) for par in self.getParameters(amount, start, end)]
+        return self.toUniformParameterArray(self.getParameters(amount, start, end)).tolist()
 
     def getParameters(self, amount, start = 0.0, end = 1.0):
         start = min(max(start, 0.0), 1.0)
@@ -96,6 +127,9 @@ class Spline:
     def toUniformParameter(self, parameter):
         return self.uniformConverter.lookUp(parameter)
 
+    def toUniformParameterArray(self, parameters):
+        return self.uniformConverter.lookUpArray(parameters)
+
 
 
     # the resolution may not be needed in every subclass
@@ -108,10 +142,9 @@ class Spline:
         return self.calculateDistanceSum(samples)
 
     def calculateDistanceSum(self, vectors):
-        distance = 0.0
-        for i in range(len(vectors) - 1):
-            distance += (vectors[i] - vectors[i+1]).length
-        return distance
+        if len(vectors) < 2: return 0.0
+        differences = numpy.diff(VectorArray.fromValue(vectors, "d").data, axis = 0)
+        return numpy.sqrt(numpy.einsum("ij,ij->i", differences, differences)).sum().item()
 
 
     # it's enough when a subclass implements 'getProjectedParameters'
@@ -123,6 +156,9 @@ class Spline:
     def getProjectedParameters(self, coordinates):
         return [i / 100 for i in range(101)]
 
+    def projectArray(self, points):
+        return numpy.array([self.project(Vector(point)) for point in points], dtype = "d")
+
 
     # find the nearest point and tangent on the spline + the straight lines at the end
     def projectExtended(self, coordinates):
@@ -168,36 +204,104 @@ class Spline:
 
 
     def ensureUniformConverter(self, resolution = 100):
+        # the converter is removed when a changed spline is updated
+        if self.isChanged: self.update()
         if getattr(self.uniformConverter, "resolution", 0) < resolution:
             self.newUniformConverter(resolution)
 
     def newUniformConverter(self, resolution = 100):
-        from . poly_spline import PolySpline
-        samples = self.getSamples(resolution)
-
-        polySpline = PolySpline()
-        polySpline.appendPoints(samples)
-        polySpline.update()
-
-        uniformPolySpline = PolySpline()
-        equalDistanceParameters = polySpline.getEqualDistanceParameters(resolution)
-        converter = ParameterConverter(equalDistanceParameters)
-        self.uniformConverter = converter
+        source = self.getEvaluationSource()
+        if source is not None:
+            # create the converter only once for all copies of a spline
+            source.ensureUniformConverter(resolution)
+            self.uniformConverter = source.uniformConverter
+        else:
+            self.uniformConverter = ArcLengthTable.fromSpline(self, resolution)
+
+
+class ArcLengthTable:
+    '''
+    Maps parameters to parameters which have the same distances on the spline.
+    It stores the arc length at sampled parameters. Samples are added where the
+    spline bends a lot, so a low resolution is enough for most splines.
+
+    The lengths can also be a (rows, N) array with one table per row. All rows
+    share the same parameters, so many splines can be converted at once.
+    '''
+    maxSubdivisionLevels = 4
+    # allowed distance between the middle point of an interval and the chord center
+    flatnessTolerance = 0.002
+
+    def __init__(self, parameters, lengths, resolution = 0):
+        self.parameters = parameters
+        self.lengths = lengths
+        self.resolution = resolution
+
+    @classmethod
+    def fromSpline(cls, spline, resolution = 100):
+        parameters = numpy.linspace(0.0, 1.0, max(resolution, 1) + 1)
+        points = spline.evaluateArray(parameters)
+
+        for _ in range(cls.maxSubdivisionLevels):
+            middleParameters = (parameters[:-1] + parameters[1:]) / 2
+            middlePoints = spline.evaluateArray(middleParameters)
+            chordLengths = rowLengths(points[1:] - points[:-1])
+            # the middle point is far away from the chord when the spline bends
+            # and far away from the chord center when the speed changes
+            deviations = rowLengths(middlePoints - (points[:-1] + points[1:]) / 2)
+            needsSubdivision = deviations > chordLengths * cls.flatnessTolerance
+            if not needsSubdivision.any(): break
+
+            insertIndices = numpy.flatnonzero(needsSubdivision) + 1
+            parameters = numpy.insert(parameters, insertIndices, middleParameters[needsSubdivision])
+            points = numpy.insert(points, insertIndices, middlePoints[needsSubdivision], axis = 0)
+
+        middlePoints = spline.evaluateArray((parameters[:-1] + parameters[1:]) / 2)
+        return cls.fromPoints(parameters, points, middlePoints, resolution)
+
+    @classmethod
+    def fromPoints(cls, parameters, points, middlePoints, resolution = 0):
+        '''
+        points are (..., N, 3) arrays with the locations at the parameters,
+        middlePoints contain the locations between two parameters
+        '''
+        # combine the chord length with the length through the middle point (Richardson extrapolation)
+        chordLengths = rowLengths(points[..., 1:, :] - points[..., :-1, :])
+        halfChordLengths = (rowLengths(middlePoints - points[..., :-1, :]) +
+                            rowLengths(points[..., 1:, :] - middlePoints))
+        lengths = numpy.zeros(points.shape[:-1])
+        numpy.cumsum((4 * halfChordLengths - chordLengths) / 3, axis = -1, out = lengths[..., 1:])
+        return cls(parameters, lengths, resolution)
 
-# Mainly used to get parameters which have the same distance on the spline
-class ParameterConverter:
-    def __init__(self, parameterList):
-        self.parameters = parameterList
-        self.length = len(parameterList)
+    @property
+    def totalLength(self):
+        return self.lengths[..., -1]
 
     def lookUp(self, parameter):
-        maxIndex = self.length - 1
-        p = min(max(parameter * maxIndex, 0), maxIndex)
-        before = int(p)
-        after = min(before + 1, maxIndex)
-        influence = p - before
-        return self.parameters[before] * (1 - influence) + self.parameters[after] * influence
-
-    @property
-    def resolution(self):
-        return self.length - 1
+        return self.lookUpArray([parameter])[0].item()
+
+    def lookUpArray(self, parameters):
+        '''With one table per row the parameters need the same amount of rows'''
+        parameters = numpy.clip(numpy.asarray(parameters, dtype = "d"), 0.0, 1.0)
+        if self.lengths.ndim == 1:
+            return self.lookUpRows(self.lengths[numpy.newaxis], parameters[numpy.newaxis])[0]
+        return self.lookUpRows(self.lengths, parameters)
+
+    def lookUpRows(self, lengths, parameters):
+        rowAmount, tableSize = lengths.shape
+        totalLengths = lengths[:, -1:]
+        relativeLengths = lengths / numpy.where(totalLengths > 0, totalLengths, 1)
+
+        # search in all rows at once by moving every row into its own interval
+        rows = numpy.arange(rowAmount)[:, numpy.newaxis]
+        indices = numpy.searchsorted((relativeLengths + rows * 2).ravel(), (parameters + rows * 2).ravel(), side = "right")
+        indices = indices.reshape(parameters.shape) - rows * tableSize - 1
+        indices = numpy.clip(indices, 0, tableSize - 2)
+
+        intervalStarts = relativeLengths[rows, indices]
+        intervalLengths = relativeLengths[rows, indices + 1] - intervalStarts
+        safeLengths = numpy.where(intervalLengths > 0, intervalLengths, 1)
+        influences = numpy.clip((parameters - intervalStarts) / safeLengths, 0.0, 1.0)
+        result = self.parameters[indices] * (1 - influences) + self.parameters[indices + 1] * influences
+        result[totalLengths[:, 0] < 0.0001] = 0
+        return result
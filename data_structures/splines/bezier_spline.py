@@ -1,17 +1,19 @@
 import numpy
 from mathutils import Vector, Matrix
-from numpy.polynomial import Polynomial
 from . base_spline import Spline
+from .. vector_array import VectorArray, rowLengths, normalizeRows
 
 
 class BezierSpline(Spline):
+    evaluationAttributes = ("segmentCoefficients", "segmentAmount")
+
     def __init__(self):
         self.type = "BEZIER"
         self.points = []
         self.isCyclic = False
-        self.segments = []
         self.segmentAmount = 0
         self.isChanged = True
+        self.sharesPoints = False
 
     @staticmethod
     def fromLocations(locations):
@@ -24,10 +26,19 @@ class BezierSpline(Spline):
     def copy(self):
         spline = BezierSpline()
         spline.isCyclic = self.isCyclic
-        spline.points = [point.copy() for point in self.points]
+        # the points are copied when one of the splines is changed
+        spline.points = self.points
+        spline.sharesPoints = self.sharesPoints = True
+        spline.copyEvaluationData(self)
         return spline
 
+    def makePointsUnique(self):
+        if self.sharesPoints:
+            self.points = [point.copy() for point in self.points]
+            self.sharesPoints = False
+
     def transform(self, matrix):
+        self.makePointsUnique()
         for point in self.points:
             point.transform(matrix)
 
@@ -35,65 +46,75 @@ class BezierSpline(Spline):
         self.appendBezierPoint(coordinates, coordinates.copy(), coordinates.copy())
 
     def getPoints(self):
-        return [point.location for point in self.points]
+        return [point.location.copy() for point in self.points]
 
     def appendBezierPoint(self, location, leftHandle, rightHandle):
+        self.makePointsUnique()
         point = BezierPoint(location, leftHandle, rightHandle)
         self.points.append(point)
 
     def update(self):
-        def recreateSegments():
-            self.segments = []
-            if len(self.points) < 2: return
-            for left, right in zip(self.points[:-1], self.points[1:]):
-                self.segments.append(BezierSegment(left, right))
-            if self.isCyclic:
-                self.segments.append(BezierSegment(self.points[-1], self.points[0]))
-            self.segmentAmount = len(self.segments)
-
         if self.isChanged:
-            recreateSegments()
-            self.isEvaluable = len(self.segments) > 0
-            self.uniformParameterConverter = None
+            self.recalculateSegments()
+            self.isEvaluable = self.segmentAmount > 0
+            self.uniformConverter = None
             self.isChanged = False
 
+    def recalculateSegments(self):
+        points = self.points
+        if len(points) < 2:
+            self.segmentCoefficients = numpy.zeros((0, 4, 3))
+            self.segmentAmount = 0
+            return
+
+        locations = numpy.array([tuple(point.location) for point in points], dtype = "d")
+        leftHandles = numpy.array([tuple(point.leftHandle) for point in points], dtype = "d")
+        rightHandles = numpy.array([tuple(point.rightHandle) for point in points], dtype = "d")
+
+        if self.isCyclic: nextIndices = numpy.roll(numpy.arange(len(points)), -1)
+        else: nextIndices = numpy.arange(1, len(points))
+        indices = numpy.arange(len(nextIndices))
+
+        start = locations[indices]
+        startHandle = rightHandles[indices]
+        endHandle = leftHandles[nextIndices]
+        end = locations[nextIndices]
+
+        # polynomial coefficients of every segment: c0 + c1 * t + c2 * t^2 + c3 * t^3
+        coefficients = numpy.empty((len(indices), 4, 3))
+        coefficients[:, 0] = start
+        coefficients[:, 1] = start * (-3.0) + startHandle * (+3.0)
+        coefficients[:, 2] = start * (+3.0) + startHandle * (-6.0) + endHandle * (+3.0)
+        coefficients[:, 3] = start * (-1.0) + startHandle * (+3.0) + endHandle * (-3.0) + end
+        self.segmentCoefficients = coefficients
+        self.segmentAmount = len(indices)
+
     def getProjectedParameters(self, coordinates):
-        parameters = []
-        for i, segment in enumerate(self.segments):
-            for parameter in segment.findRootParameters(coordinates):
-                parameters.append((parameter + i) / len(self.segments))
-        return parameters
+        parameters = self.projectOnSegments(numpy.array([tuple(coordinates)]))[0]
+        return ((numpy.arange(self.segmentAmount) + parameters) / self.segmentAmount).tolist()
 
     def calculateSmoothHandles(self, strength = 0.3333):
-        neighborSegments = self.getNeighborSegments()
-        for segment in neighborSegments:
-            segment.calculateSmoothHandles(strength)
-
-    def getNeighborSegments(self):
-        points = self.points
-        if len(points) < 2: return []
-        neighborSegments = []
-        if self.isCyclic:
-            for i, point in enumerate(points):
-                segment = BezierNeighbors(points[i-2].location, points[i-1], point.location)
-                neighborSegments.append(segment)
-        else:
-            neighborSegments.append(BezierNeighbors(points[0].location, points[0], points[1].location))
-            neighborSegments.append(BezierNeighbors(points[-2].location, points[-1], points[-1].location))
-            for before, point, after in zip(points[:-2], points[1:-1], points[2:]):
-                neighborSegments.append(BezierNeighbors(before.location, point, after.location))
-        return neighborSegments
+        self.makePointsUnique()
+        if len(self.points) < 2: return
+        locations = numpy.array([tuple(point.location) for point in self.points], dtype = "d")
+        leftHandles, rightHandles, isSmooth = calculateSmoothHandlesArray(locations, self.isCyclic, strength)
+        for point, leftHandle, rightHandle, smooth in zip(self.points, leftHandles.tolist(), rightHandles.tolist(), isSmooth):
+            if smooth:
+                point.leftHandle = Vector(leftHandle)
+                point.rightHandle = Vector(rightHandle)
 
     # evaluation
     #############################
 
     def evaluate(self, parameter):
         index, p = self.toSegmentsIndexAndParameter(parameter)
-        return self.segments[index].evaluate(p)
+        c = self.segmentCoefficients[index]
+        return Vector(c[0] + p * (c[1] + p * (c[2] + p * c[3])))
 
     def evaluateTangent(self, parameter):
         index, p = self.toSegmentsIndexAndParameter(parameter)
-        return self.segments[index].evaluateTangent(p)
+        c = self.segmentCoefficients[index]
+        return Vector(c[1] + p * (c[2] * 2 + p * c[3] * 3))
 
     def toSegmentsIndexAndParameter(self, parameter):
         p = max(parameter, 0.0) * self.segmentAmount
@@ -103,6 +124,91 @@ class BezierSpline(Spline):
         else:
             return self.segmentAmount - 1, 1
 
+    def evaluateArray(self, parameters):
+        indices, p = self.toSegmentIndicesAndParameters(parameters)
+        return evaluateSegments(self.segmentCoefficients[indices], p)
+
+    def evaluateTangentArray(self, parameters):
+        indices, p = self.toSegmentIndicesAndParameters(parameters)
+        return evaluateSegmentTangents(self.segmentCoefficients[indices], p)
+
+    def toSegmentIndicesAndParameters(self, parameters):
+        p = numpy.maximum(numpy.asarray(parameters, dtype = "d"), 0.0) * self.segmentAmount
+        indices = p.astype("int64")
+        p = p - indices
+        isAtEnd = indices >= self.segmentAmount
+        indices[isAtEnd] = self.segmentAmount - 1
+        p[isAtEnd] = 1
+        return indices, p
+
+    def getSamples(self, amount, start = 0.0, end = 1.0):
+        return VectorArray(self.evaluateArray(self.getParameters(amount, start, end)))
+
+    def getTangentSamples(self, amount, start = 0.0, end = 1.0):
+        return VectorArray(self.evaluateTangentArray(self.getParameters(amount, start, end)))
+
+
+    # projection
+    #############################
+
+    def project(self, coordinates):
+        return self.projectArray([tuple(coordinates)])[0].item()
+
+    def projectArray(self, points, chunkSize = 2**18):
+        '''Parameter of the closest point on the spline for every point in the (N, 3) array'''
+        points = numpy.asarray(VectorArray.fromValue(points, "d").data, dtype = "d")
+        parameters = numpy.empty(len(points))
+        # limit the size of the (points, segments, samples) arrays
+        step = max(1, chunkSize // (max(self.segmentAmount, 1) * projectionSamples))
+        for i in range(0, len(points), step):
+            chunk = points[i:i + step]
+            localParameters = self.projectOnSegments(chunk)
+            offsets = evaluateSegments(self.segmentCoefficients, localParameters) - chunk[:, numpy.newaxis, :]
+            distances = numpy.einsum("ijk,ijk->ij", offsets, offsets)
+            indices = numpy.argmin(distances, axis = 1)
+            parameters[i:i + step] = (indices + localParameters[numpy.arange(len(chunk)), indices]) / self.segmentAmount
+        return parameters
+
+    def projectOnSegments(self, points):
+        '''
+        (N, segmentAmount) array with the parameter of the closest point on every segment.
+        Newton's method on the derivative of the squared distance is started at a few
+        samples per segment, so that all local minima are found, and the best one is used.
+        '''
+        c = self.segmentCoefficients[:, numpy.newaxis]
+        points = points[:, numpy.newaxis, numpy.newaxis, :]
+        t = numpy.tile(numpy.linspace(0.0, 1.0, projectionSamples), (len(points), self.segmentAmount, 1))
+
+        for _ in range(newtonIterations):
+            offsets = evaluateSegments(c, t) - points
+            tangents = evaluateSegmentTangents(c, t)
+            secondDerivatives = c[..., 2, :] * 2 + t[..., numpy.newaxis] * c[..., 3, :] * 6
+            derivative = numpy.einsum("...k,...k->...", offsets, tangents)
+            secondOrder = (numpy.einsum("...k,...k->...", tangents, tangents) +
+                           numpy.einsum("...k,...k->...", offsets, secondDerivatives))
+            isValid = secondOrder > 1e-12
+            t = numpy.clip(t - numpy.where(isValid, derivative / numpy.where(isValid, secondOrder, 1), 0), 0.0, 1.0)
+
+        offsets = evaluateSegments(c, t) - points
+        distances = numpy.einsum("...k,...k->...", offsets, offsets)
+        pointIndices, segmentIndices = numpy.indices(distances.shape[:2])
+        return t[pointIndices, segmentIndices, numpy.argmin(distances, axis = 2)]
+
+
+projectionSamples = 8
+newtonIterations = 6
+
+def evaluateSegments(coefficients, parameters):
+    '''coefficients has the shape (..., 4, 3) and parameters (...)'''
+    c = coefficients
+    p = numpy.asarray(parameters)[..., numpy.newaxis]
+    return c[..., 0, :] + p * (c[..., 1, :] + p * (c[..., 2, :] + p * c[..., 3, :]))
+
+def evaluateSegmentTangents(coefficients, parameters):
+    c = coefficients
+    p = numpy.asarray(parameters)[..., numpy.newaxis]
+    return c[..., 1, :] + p * (c[..., 2, :] * 2 + p * c[..., 3, :] * 3)
+
 
 class BezierPoint:
     __slots__ = ("location", "leftHandle", "rightHandle")
@@ -121,81 +227,26 @@ class BezierPoint:
         self.rightHandle = matrix * self.rightHandle
 
 
-class BezierSegment:
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-
-        self.coeffs = [
-            left.location,
-            left.location * (-3.0) + left.rightHandle * (+3.0),
-            left.location * (+3.0) + left.rightHandle * (-6.0) + right.leftHandle * (+3.0),
-            left.location * (-1.0) + left.rightHandle * (+3.0) + right.leftHandle * (-3.0) + right.location]
-
-    def evaluate(self, parameter):
-        c = self.coeffs
-        return c[0] + parameter * (c[1] + parameter * (c[2] + parameter * c[3]))
-
-    def evaluateTangent(self, parameter):
-        c = self.coeffs
-        return c[1] + parameter * (c[2] * 2 + parameter * c[3] * 3)
-
-    # http://jazzros.blogspot.be/2011/03/projecting-point-on-bezier-curve.html
-    # calculate possible parameters which can be the closest to a given point
-    def findRootParameters(self, coordinates):
-        left = self.left
-        right = self.right
-
-        p0 = left.location - coordinates
-        p1 = left.rightHandle - coordinates
-        p2 = right.leftHandle - coordinates
-        p3 = right.location - coordinates
-
-        a = p3 - 3 * p2 + 3 * p1 - p0
-        b = 3 * p2 - 6 * p1 + 3 * p0
-        c = 3 * (p1 - p0)
-
-        coeffs = [0] * 6
-        coeffs[0] = c.dot(p0)
-        coeffs[1] = c.dot(c) + b.dot(p0) * 2.0
-        coeffs[2] = b.dot(c) * 3.0 + a.dot(p0) * 3.0
-        coeffs[3] = a.dot(c) * 4.0 + b.dot(b) * 2.0
-        coeffs[4] = a.dot(b) * 5.0
-        coeffs[5] = a.dot(a) * 3.0
-
-        poly = Polynomial(coeffs, [0.0, 1.0], [0.0, 1.0])
-        roots = poly.roots()
-        realRoots = [float(min(max(root.real, 0), 1)) for root in roots]
-
-        return realRoots
-
-
-class BezierNeighbors:
-    def __init__(self, leftLocation, point, rightLocation):
-        self.point = point
-        self.leftLocation = leftLocation
-        self.rightLocation = rightLocation
-
-    # http://stackoverflow.com/questions/13037606/how-does-inkscape-calculate-the-coordinates-for-control-points-for-smooth-edges/13425159#13425159
-    def calculateSmoothHandles(self, strength = 0.3333):
-        vecLeft = self.leftLocation - self.point.location
-        vecRight = self.rightLocation - self.point.location
-
-        lenLeft = vecLeft.length
-        lenRight = vecRight.length
-
-        if lenLeft > 0 and lenRight > 0:
-            dir = ((lenLeft / lenRight) * vecRight - vecLeft).normalized()
-
-            self.point.leftHandle = self.point.location - dir * lenLeft * strength
-            self.point.rightHandle = self.point.location + dir * lenRight * strength
-
-    # http://www.antigrain.com/research/bezier_interpolation/
-    def calculateSmoothHandlesOLD(self, strength = 1):
-        co = self.point.location
-        distanceBefore = (co - self.leftLocation).length
-        distanceAfter = (co - self.rightLocation).length
-        proportion = distanceBefore / max(distanceBefore + distanceAfter, 0.00001)
-        handleDirection = (self.rightLocation - self.leftLocation).normalized()
-        self.point.leftHandle = co - handleDirection * proportion * strength
-        self.point.rightHandle = co + handleDirection * proportion * strength
+# http://stackoverflow.com/questions/13037606/how-does-inkscape-calculate-the-coordinates-for-control-points-for-smooth-edges/13425159#13425159
+def calculateSmoothHandlesArray(locations, cyclic, strength = 0.3333):
+    '''
+    locations is a (..., N, 3) array, every row along the second last axis is one spline.
+    Returns the left handles, the right handles and a mask of the points that got new handles.
+    The handles of the other points are at their locations.
+    '''
+    vecLeft = numpy.roll(locations, 1, axis = -2) - locations
+    vecRight = numpy.roll(locations, -1, axis = -2) - locations
+    lenLeft = rowLengths(vecLeft)
+    lenRight = rowLengths(vecRight)
+
+    isSmooth = (lenLeft > 0) & (lenRight > 0)
+    if not cyclic:
+        # the end points only have one neighbor
+        isSmooth[..., [0, -1]] = False
+
+    ratios = lenLeft / numpy.where(isSmooth, lenRight, 1)
+    directions = normalizeRows(ratios[..., numpy.newaxis] * vecRight - vecLeft)
+
+    leftHandles = locations - directions * (lenLeft * strength * isSmooth)[..., numpy.newaxis]
+    rightHandles = locations + directions * (lenRight * strength * isSmooth)[..., numpy.newaxis]
+    return leftHandles, rightHandles, isSmooth
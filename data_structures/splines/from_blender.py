@@ -1,4 +1,9 @@
+import zlib
+import numpy
 from mathutils import Vector
+from collections import OrderedDict
+from ... utils.handlers import eventHandler
+from .. vector_array import VectorArray
 from . bezier_spline import BezierSpline, BezierPoint
 from . poly_spline import PolySpline
 
@@ -15,36 +20,109 @@ def createSplinesFromBlenderObject(object):
     return splines
 
 def createSplineFromBlenderSpline(bSpline):
+    return createSplineFromData(readSplineData(bSpline))
+
+def readSplineData(bSpline):
+    '''(type, isCyclic, buffers) with the point data as float32 arrays'''
     if bSpline.type == "BEZIER":
-        return createBezierSpline(bSpline)
+        bPoints = bSpline.bezier_points
+        buffers = []
+        for attribute in ("co", "handle_left", "handle_right"):
+            data = numpy.zeros(len(bPoints) * 3, dtype = "f")
+            bPoints.foreach_get(attribute, data)
+            buffers.append(data)
     elif bSpline.type == "POLY":
-        return createPolySpline(bSpline)
-    return None
-
-def createBezierSpline(bSpline):
-    pointAmount = len(bSpline.bezier_points)
-    positionsData = [None] * (pointAmount * 3)
-    leftHandlesData = [None] * (pointAmount * 3)
-    rightHandlesData = [None] * (pointAmount * 3)
+        # points of poly splines have 4 values
+        data = numpy.zeros(len(bSpline.points) * 4, dtype = "f")
+        bSpline.points.foreach_get("co", data)
+        buffers = [data]
+    else:
+        buffers = []
+    return bSpline.type, bSpline.use_cyclic_u, buffers
 
-    bSpline.bezier_points.foreach_get("co", positionsData)
-    bSpline.bezier_points.foreach_get("handle_left", leftHandlesData)
-    bSpline.bezier_points.foreach_get("handle_right", rightHandlesData)
+def createSplineFromData(splineData):
+    type, isCyclic, buffers = splineData
+    if type == "BEZIER":
+        spline = createBezierSpline(*buffers)
+    elif type == "POLY":
+        spline = createPolySpline(buffers[0])
+    else:
+        return None
+    spline.isCyclic = isCyclic
+    return spline
 
-    # create (x, y, z) tuples from flattened position data
-    positionsIterator = map(Vector, zip(*([iter(positionsData)] * 3)))
-    leftHandlesIterator = map(Vector, zip(*([iter(leftHandlesData)] * 3)))
-    rightHandlesIterator = map(Vector, zip(*([iter(rightHandlesData)] * 3)))
+def createBezierSpline(positionsData, leftHandlesData, rightHandlesData):
+    positionsIterator = map(Vector, positionsData.reshape(-1, 3).tolist())
+    leftHandlesIterator = map(Vector, leftHandlesData.reshape(-1, 3).tolist())
+    rightHandlesIterator = map(Vector, rightHandlesData.reshape(-1, 3).tolist())
 
     bezierSpline = BezierSpline()
     bezierSpline.points = list(map(BezierPoint, positionsIterator, leftHandlesIterator, rightHandlesIterator))
-    bezierSpline.isCyclic = bSpline.use_cyclic_u
-
     return bezierSpline
 
-def createPolySpline(bSpline):
+def createPolySpline(pointsData):
     polySpline = PolySpline()
-    polySpline.isCyclic = bSpline.use_cyclic_u
-    for bPoint in bSpline.points:
-        polySpline.points.append(Vector((bPoint.co[:3])))
+    polySpline.points = VectorArray(pointsData.reshape(-1, 4)[:, :3].astype("d"))
     return polySpline
+
+
+
+# Spline Cache
+##################################
+# Reading the curve data is cheap compared to creating the spline objects,
+# updating them and calculating their arc length tables. The updated
+# splines are kept for every curve and reused until its data changes.
+# Only copies leave the cache. They share the evaluation data and the points
+# of bezier splines are only copied when the spline is changed.
+
+maxCachedCurves = 32
+splineCache = OrderedDict()
+
+@eventHandler("FILE_LOAD_POST")
+def clearSplineCache():
+    splineCache.clear()
+
+def getCachedSplinesFromBlenderObject(object, useWorldSpace = False):
+    if object is None: return []
+    if object.type != "CURVE": return []
+    return [spline.copy() for spline in getCachedSplines(object, useWorldSpace) if spline is not None]
+
+def getCachedSplineFromBlenderObject(object, index, useWorldSpace = False):
+    '''None when the index is out of range or the spline type is not supported'''
+    if object is None: return None
+    if object.type != "CURVE": return None
+    splines = getCachedSplines(object, useWorldSpace)
+    if 0 <= index < len(splines) and splines[index] is not None:
+        return splines[index].copy()
+    return None
+
+def getCachedSplines(object, useWorldSpace):
+    splinesData = [readSplineData(bSpline) for bSpline in object.data.splines]
+    matrix = object.matrix_world if useWorldSpace else None
+
+    # objects can share the curve, but the world space splines are different
+    key = (object.data.as_pointer(), object.as_pointer() if useWorldSpace else 0)
+    fingerprint = calculateFingerprint(splinesData, matrix)
+
+    cachedFingerprint, splines = splineCache.get(key, (None, None))
+    if cachedFingerprint != fingerprint:
+        splines = [createSplineFromData(splineData) for splineData in splinesData]
+        for spline in splines:
+            if spline is None: continue
+            if matrix is not None: spline.transform(matrix)
+            spline.update()
+        splineCache[key] = (fingerprint, splines)
+
+    splineCache.move_to_end(key)
+    while len(splineCache) > maxCachedCurves:
+        splineCache.popitem(last = False)
+    return splines
+
+def calculateFingerprint(splinesData, matrix):
+    checksum = 0
+    for _, _, buffers in splinesData:
+        for data in buffers:
+            checksum = zlib.crc32(data, checksum)
+    pointAmounts = tuple((type, isCyclic, sum(map(len, buffers))) for type, isCyclic, buffers in splinesData)
+    matrixValues = None if matrix is None else tuple(map(tuple, matrix))
+    return pointAmounts, checksum, matrixValues
@@ -11,7 +11,7 @@ def connectSplines(splines):
     for spline in splines:
         if spline.type == "BEZIER":
             for bezierPoint in spline.points:
-                newSpline.points.append(bezierPoint)
+                newSpline.points.append(bezierPoint.copy())
         elif spline.type == "POLY":
             newSpline.appendPoints(spline.points)
         
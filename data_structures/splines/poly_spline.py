@@ -1,13 +1,22 @@
+import numpy
+from mathutils import Vector
 from . base_spline import Spline
-from . utils import findNearestParameterOnLine
+from .. vector_array import VectorArray
 
+'''
+The points are stored in a VectorArray. update() calculates the
+start, end, direction and length of every segment as numpy arrays,
+so that many parameters can be evaluated with a few numpy calls.
+'''
 
 class PolySpline(Spline):
+    evaluationAttributes = ("segmentStarts", "segmentEnds", "segmentDirections",
+                            "segmentLengths", "cumulativeLengths", "segmentAmount")
+
     def __init__(self):
         self.type = "POLY"
         self.points = []
         self.isCyclic = False
-        self.segments = []
         self.segmentAmount = 0
         self.isChanged = True
 
@@ -17,55 +26,63 @@ class PolySpline(Spline):
         spline.points = locations
         return spline
 
+    @property
+    def points(self):
+        return self._points
+
+    @points.setter
+    def points(self, points):
+        points = VectorArray.fromValue(points, "d")
+        # fromValue keeps the type of existing arrays
+        if points.dtype != numpy.float64:
+            points = VectorArray(points.data.astype("d"))
+        self._points = points
+
     def copy(self):
         spline = PolySpline()
         spline.isCyclic = self.isCyclic
-        spline.points = [point.copy() for point in self.points]
+        spline.points = self.points.copy()
+        spline.copyEvaluationData(self)
         return spline
 
     def transform(self, matrix):
-        newPoints = []
-        for point in self.points:
-            newPoints.append(matrix * point)
-        self.points = newPoints
+        self.points = self.points.transform(matrix)
 
     def appendPoints(self, points):
-        self.points.extend(points)
+        self.points.extend(VectorArray.fromValue(points, "d"))
 
     def appendPoint(self, coordinates):
-        self.points.append(coordinates)
+        self.points.extend(VectorArray.fromElements([coordinates], "d"))
 
     def getPoints(self):
-        return self.points
+        return self.points.copy()
 
     def update(self):
-        def recreateSegments():
-            self.segments = []
-            if len(self.points) < 2: return
-            for left, right in zip(self.points[:-1], self.points[1:]):
-                self.segments.append(PolySegment(left, right))
-            if self.isCyclic:
-                self.segments.append(PolySegment(self.points[-1], self.points[0]))
-            self.segmentAmount = len(self.segments)
-
         if self.isChanged:
-            recreateSegments()
-            self.isEvaluable = len(self.segments) > 0
-            self.uniformParameterConverter = None
+            self.recalculateSegments()
+            self.isEvaluable = self.segmentAmount > 0
+            self.uniformConverter = None
             self.isChanged = False
 
-    def getLength(self, resolution = 0):
-        length = 0
-        for segment in self.segments:
-            length += segment.getLength()
-        return length
+    def recalculateSegments(self):
+        points = numpy.asarray(self.points.data, dtype = "d")
+        if len(points) < 2:
+            starts = ends = numpy.zeros((0, 3))
+        elif self.isCyclic:
+            starts, ends = points, numpy.roll(points, -1, axis = 0)
+        else:
+            starts, ends = points[:-1], points[1:]
 
-    def getProjectedParameters(self, coordinates):
-        parameters = []
-        for i, segment in enumerate(self.segments):
-            parameter = segment.project(coordinates)
-            parameters.append((parameter + i) / len(self.segments))
-        return parameters
+        self.segmentStarts = starts
+        self.segmentEnds = ends
+        self.segmentDirections = ends - starts
+        self.segmentLengths = numpy.sqrt(numpy.einsum("ij,ij->i", self.segmentDirections, self.segmentDirections))
+        self.cumulativeLengths = numpy.concatenate(([0.0], numpy.cumsum(self.segmentLengths)))
+        self.segmentAmount = len(starts)
+
+    def getLength(self, resolution = 0):
+        if not self.isEvaluable: return 0.0
+        return self.cumulativeLengths[-1].item()
 
 
     # evaluation
@@ -73,11 +90,11 @@ class PolySpline(Spline):
 
     def evaluate(self, parameter):
         index, p = self.toSegmentsIndexAndParameter(parameter)
-        return self.segments[index].evaluate(p)
+        return Vector(self.segmentStarts[index] * (1 - p) + self.segmentEnds[index] * p)
 
     def evaluateTangent(self, parameter):
         index, p = self.toSegmentsIndexAndParameter(parameter)
-        return self.segments[index].tangent
+        return Vector(self.segmentDirections[index])
 
     def toSegmentsIndexAndParameter(self, parameter):
         p = max(parameter, 0.0) * self.segmentAmount
@@ -87,70 +104,107 @@ class PolySpline(Spline):
         else:
             return self.segmentAmount - 1, 1
 
+    def evaluateArray(self, parameters):
+        '''(N, 3) array with the positions at all parameters'''
+        indices, p = self.toSegmentIndicesAndParameters(parameters)
+        p = p[:, numpy.newaxis]
+        return self.segmentStarts[indices] * (1 - p) + self.segmentEnds[indices] * p
+
+    def evaluateTangentArray(self, parameters):
+        indices, _ = self.toSegmentIndicesAndParameters(parameters)
+        return self.segmentDirections[indices]
+
+    def toSegmentIndicesAndParameters(self, parameters):
+        p = numpy.maximum(numpy.asarray(parameters, dtype = "d"), 0.0) * self.segmentAmount
+        indices = p.astype("int64")
+        p = p - indices
+        isAtEnd = indices >= self.segmentAmount
+        indices[isAtEnd] = self.segmentAmount - 1
+        p[isAtEnd] = 1
+        return indices, p
+
+    def getSamples(self, amount, start = 0.0, end = 1.0):
+        return VectorArray(self.evaluateArray(self.getParameters(amount, start, end)))
+
+    def getTangentSamples(self, amount, start = 0.0, end = 1.0):
+        return VectorArray(self.evaluateTangentArray(self.getParameters(amount, start, end)))
+
 
     # point distribution
     #############################
 
+    # the exact lengths of all segments are known, so no converter is needed
+    def ensureUniformConverter(self, resolution = 100):
+        pass
+
+    def toUniformParameter(self, parameter):
+        return self.toUniformParameterArray([parameter])[0].item()
+
+    def toUniformParameters(self, amount, start = 0.0, end = 1.0):
+        return self.toUniformParameterArray(self.getParameters(amount, start, end)).tolist()
+
+    def toUniformParameterArray(self, parameters):
+        '''Parameters that have the given fraction of the total length before them'''
+        parameters = numpy.clip(numpy.asarray(parameters, dtype = "d"), 0.0, 1.0)
+        totalLength = self.cumulativeLengths[-1]
+        if totalLength < 0.0001: return numpy.zeros(len(parameters))
+
+        distances = parameters * totalLength
+        indices = numpy.searchsorted(self.cumulativeLengths, distances, side = "right") - 1
+        indices = numpy.clip(indices, 0, self.segmentAmount - 1)
+
+        lengths = self.segmentLengths[indices]
+        safeLengths = numpy.where(lengths > 0, lengths, 1)
+        localParameters = numpy.clip((distances - self.cumulativeLengths[indices]) / safeLengths, 0.0, 1.0)
+        return (indices + localParameters) / self.segmentAmount
+
+    def getUniformSamples(self, amount, start = 0.0, end = 1.0, resolution = 100):
+        parameters = self.toUniformParameterArray(self.getParameters(amount, start, end))
+        return VectorArray(self.evaluateArray(parameters))
+
+    def getUniformTangentSamples(self, amount, start = 0.0, end = 1.0, resolution = 100):
+        parameters = self.toUniformParameterArray(self.getParameters(amount, start, end))
+        return VectorArray(self.evaluateTangentArray(parameters))
+
     def getEqualDistanceParameters(self, amount):
         if amount < 2: return [0.0]
         if not self.isEvaluable: return [0.0]
+        if self.getLength() < 0.0001: return [0.0] * amount
+        return self.toUniformParameterArray(numpy.linspace(0.0, 1.0, amount + 1)).tolist()
 
-        totalLength = self.getLength()
-        if totalLength < 0.0001: return [0.0] * amount
-        distancePerStep = totalLength / amount
-
-        parameters = [0.0]
-        lastControlPoint = self.points[0]
-        lastVector = self.points[0]
-        previousDistance = 0.0
-
-        targetPoints = self.points[1:]
-        targetPointAmount = len(targetPoints)
-
-        for i, point in enumerate(targetPoints):
-            if point == lastVector: continue
-
-            while True:
-                distanceToLastVector = (point - lastVector).length
-                totalDistance = distanceToLastVector + previousDistance
-                if totalDistance >= distancePerStep:
-                    # find vector with correct distance
-                    surplusDistance = totalDistance - distancePerStep
-                    influence = surplusDistance / distanceToLastVector
-                    sampledVector = lastVector * influence + point * (1 - influence)
-
-                    # calculate parameter of the sampled vector
-                    d1 = (sampledVector - lastControlPoint).length
-                    d2 = (point - lastControlPoint).length
-
-                    parameter = (i + d1 / d2) / targetPointAmount
-                    parameters.append(parameter)
-
-                    previousDistance = 0.0
-                    lastVector = sampledVector
-                else:
-                    previousDistance += distanceToLastVector
-                    lastVector = point
-                    break
-            lastControlPoint = point
-
-        # append parameter 1.0 sometimes because of math inaccuracy
-        if parameters[-1] < 0.999999:
-            parameters.append(1.0)
-        return parameters
 
+    # projection
+    #############################
 
-class PolySegment:
-    def __init__(self, left, right):
-        self.left = left
-        self.right = right
-        self.tangent = self.right - self.left
-
-    def evaluate(self, parameter):
-        return self.left * (1 - parameter) + self.right * parameter
+    def project(self, coordinates):
+        return self.projectArray([tuple(coordinates)])[0].item()
 
-    def getLength(self):
-        return (self.left - self.right).length
+    def getProjectedParameters(self, coordinates):
+        localParameters = self.projectOnSegments(numpy.array([tuple(coordinates)]))[0]
+        return ((numpy.arange(self.segmentAmount) + localParameters) / self.segmentAmount).tolist()
+
+    def projectArray(self, points, chunkSize = 2**20):
+        '''Parameter of the closest point on the spline for every point in the (N, 3) array'''
+        points = numpy.asarray(VectorArray.fromValue(points, "d").data, dtype = "d")
+        parameters = numpy.empty(len(points))
+        # limit the size of the (points, segments) arrays
+        step = max(1, chunkSize // max(self.segmentAmount, 1))
+        for i in range(0, len(points), step):
+            chunk = points[i:i + step]
+            localParameters = self.projectOnSegments(chunk)
+            p = localParameters[..., numpy.newaxis]
+            closestPoints = self.segmentStarts * (1 - p) + self.segmentEnds * p
+            offsets = closestPoints - chunk[:, numpy.newaxis, :]
+            distances = numpy.einsum("ijk,ijk->ij", offsets, offsets)
+            indices = numpy.argmin(distances, axis = 1)
+            parameters[i:i + step] = (indices + localParameters[numpy.arange(len(chunk)), indices]) / self.segmentAmount
+        return parameters
 
-    def project(self, coordinates):
-        return findNearestParameterOnLine(self.left, self.tangent, coordinates)
+    def projectOnSegments(self, points):
+        '''(N, segmentAmount) array with the parameter of the closest point on every segment'''
+        directions = self.segmentDirections
+        squaredLengths = numpy.einsum("ij,ij->i", directions, directions)
+        offsets = points[:, numpy.newaxis, :] - self.segmentStarts
+        dotProducts = numpy.einsum("ijk,jk->ij", offsets, directions)
+        safeLengths = numpy.where(squaredLengths > 0, squaredLengths, 1)
+        return numpy.clip(dotProducts / safeLengths, 0.0, 1.0)
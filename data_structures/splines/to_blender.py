@@ -1,43 +1,82 @@
+import numpy
 from itertools import chain
-from mathutils import Vector
+
+'''
+The point data of all splines is collected in a few numpy arrays first.
+The existing Blender splines are reused when they have the same types and
+point amounts, so only their coordinates have to be set.
+'''
 
 def setSplinesOnBlenderObject(object, splines):
     if object is None: return
     if object.type != "CURVE": return
 
+    # every Blender spline has at least one point
+    splines = [spline for spline in splines if spline.type in ("BEZIER", "POLY") and len(spline.points) > 0]
+
     bSplines = object.data.splines
-    bSplines.clear()
-    for spline in splines:
-        if spline.type == "BEZIER":
-            appendBezierSpline(bSplines, spline)
-        if spline.type == "POLY":
-            appendPolySpline(bSplines, spline)
+    if not canReuseBlenderSplines(bSplines, splines):
+        createBlenderSplines(bSplines, splines)
+    setSplineData(bSplines, splines)
+    # foreach_set doesn't tag the curve for an update
+    object.data.update_tag()
 
 
-def appendBezierSpline(bSplines, spline):
-    bSpline = bSplines.new("BEZIER")
-    bSpline.use_cyclic_u = spline.isCyclic
+def canReuseBlenderSplines(bSplines, splines):
+    if len(bSplines) != len(splines): return False
+    for bSpline, spline in zip(bSplines, splines):
+        if bSpline.type != spline.type: return False
+        if len(getBlenderPoints(bSpline)) != len(spline.points): return False
+    return True
 
-    # one point is already there
-    bSpline.bezier_points.add(len(spline.points) - 1)
+def createBlenderSplines(bSplines, splines):
+    bSplines.clear()
+    for spline in splines:
+        bSpline = bSplines.new(spline.type)
+        # one point is already there
+        getBlenderPoints(bSpline).add(len(spline.points) - 1)
 
-    locations = tuple(chain.from_iterable(point.location for point in spline.points))
-    leftHandles = tuple(chain.from_iterable(point.leftHandle for point in spline.points))
-    rightHandles = tuple(chain.from_iterable(point.rightHandle for point in spline.points))
+def getBlenderPoints(bSpline):
+    if bSpline.type == "BEZIER": return bSpline.bezier_points
+    return bSpline.points
 
-    bSpline.bezier_points.foreach_set("co", locations)
-    bSpline.bezier_points.foreach_set("handle_left", leftHandles)
-    bSpline.bezier_points.foreach_set("handle_right", rightHandles)
 
+def setSplineData(bSplines, splines):
+    bezierSplines = [spline for spline in splines if spline.type == "BEZIER"]
+    polySplines = [spline for spline in splines if spline.type == "POLY"]
+    locations, leftHandles, rightHandles = getBezierPointData(bezierSplines)
+    polyPoints = getPolyPointData(polySplines)
 
-def appendPolySpline(bSplines, spline):
-    bSpline = bSplines.new("POLY")
-    bSpline.use_cyclic_u = spline.isCyclic
+    bezierStart = polyStart = 0
+    for bSpline, spline in zip(bSplines, splines):
+        if bSpline.use_cyclic_u != spline.isCyclic:
+            bSpline.use_cyclic_u = spline.isCyclic
+
+        if spline.type == "BEZIER":
+            end = bezierStart + len(spline.points)
+            bPoints = bSpline.bezier_points
+            bPoints.foreach_set("co", locations[bezierStart:end].ravel())
+            bPoints.foreach_set("handle_left", leftHandles[bezierStart:end].ravel())
+            bPoints.foreach_set("handle_right", rightHandles[bezierStart:end].ravel())
+            bezierStart = end
+        elif spline.type == "POLY":
+            end = polyStart + len(spline.points)
+            bSpline.points.foreach_set("co", polyPoints[polyStart:end].ravel())
+            polyStart = end
 
-    # one point is already there
-    bSpline.points.add(len(spline.points) - 1)
+def getBezierPointData(splines):
+    points = list(chain.from_iterable(spline.points for spline in splines))
+    def toArray(vectors):
+        data = numpy.fromiter(chain.from_iterable(vectors), dtype = "f", count = len(points) * 3)
+        return data.reshape(-1, 3)
+    return (toArray(point.location for point in points),
+            toArray(point.leftHandle for point in points),
+            toArray(point.rightHandle for point in points))
 
-    # points of poly splines have 4 values
-    nullList = [0]
-    locations = tuple(chain.from_iterable(list(point) + nullList for point in spline.points))
-    bSpline.points.foreach_set("co", locations)
+def getPolyPointData(splines):
+    # points of poly splines have 4 values, the last one is 0
+    amount = sum(len(spline.points) for spline in splines)
+    data = numpy.zeros((amount, 4), dtype = "f")
+    if amount > 0:
+        data[:, :3] = numpy.concatenate([spline.points.data for spline in splines])
+    return data
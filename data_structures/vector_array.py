@@ -0,0 +1,113 @@
+import numpy
+from mathutils import Vector
+from . column_list import ColumnList
+
+class VectorArray(ColumnList):
+    '''
+    List of 3D vectors that is stored in a (N, 3) numpy array.
+    Element access returns a new mathutils.Vector, so changing
+    it does not change the array. Use setElement for that.
+    '''
+    __slots__ = ("data", )
+
+    @classmethod
+    def fromElements(cls, vectors, dtype = "f"):
+        if len(vectors) == 0: return VectorArray(numpy.zeros((0, 3), dtype = dtype))
+        return VectorArray(numpy.array([tuple(vector) for vector in vectors], dtype = dtype))
+
+    @classmethod
+    def fromValue(cls, value, dtype = "f"):
+        '''Create a VectorArray from another VectorArray or a list of vectors without copying if possible'''
+        if isinstance(value, VectorArray): return value
+        return cls.fromElements(value, dtype)
+
+    @classmethod
+    def join(cls, vectorArrays):
+        return VectorArray(numpy.concatenate([vectors.data for vectors in vectorArrays]))
+
+    def __init__(self, data):
+        data = numpy.asarray(data)
+        if data.dtype not in (numpy.float32, numpy.float64):
+            data = data.astype("f")
+        self.data = data.reshape(-1, 3)
+
+    def __len__(self):
+        return len(self.data)
+
+    def getElement(self, index):
+        return Vector(self.data[index])
+
+    def setElement(self, index, vector):
+        self.data[index] = vector
+
+    def take(self, indices):
+        return VectorArray(self.data[indices])
+
+    def copy(self):
+        return VectorArray(self.data.copy())
+
+    def toList(self):
+        return list(map(Vector, self.data.tolist()))
+
+    @property
+    def dtype(self):
+        return self.data.dtype
+
+
+    # Vectorized Operations
+    ##########################################################
+
+    def transform(self, matrix):
+        return VectorArray(transformVectors(self.data, matrix))
+
+    def offset(self, vector):
+        return VectorArray(self.data + asVectorData(vector, self.dtype))
+
+    def scale(self, factor):
+        return VectorArray(self.data * factor)
+
+    def lengths(self):
+        return numpy.sqrt(numpy.einsum("ij,ij->i", self.data, self.data))
+
+    def normalized(self, length = 1):
+        lengths = self.lengths()
+        # zero vectors stay zero like in mathutils
+        lengths[lengths == 0] = 1
+        return VectorArray(self.data * (length / lengths)[:, numpy.newaxis])
+
+    def dot(self, other):
+        other = asVectorData(other, self.dtype)
+        if other.ndim == 1: return numpy.dot(self.data, other)
+        return numpy.einsum("ij,ij->i", self.data, other)
+
+    def cross(self, other):
+        return VectorArray(numpy.cross(self.data, asVectorData(other, self.dtype)))
+
+    def sum(self):
+        return Vector(self.data.sum(axis = 0))
+
+    def average(self):
+        if len(self) == 0: return Vector((0, 0, 0))
+        return Vector(self.data.mean(axis = 0))
+
+
+def asVectorData(value, dtype = "f"):
+    '''Returns a (3, ) array for a single vector or a (N, 3) array for a vector list'''
+    if isinstance(value, VectorArray): return value.data
+    array = numpy.array(value, dtype = dtype)
+    if array.size == 0: return array.reshape(0, 3)
+    return array
+
+def transformVectors(vectors, matrix):
+    '''Same as matrix * vector for a 4x4 matrix and every row of a (N, 3) array'''
+    matrix = numpy.array(matrix, dtype = vectors.dtype)
+    return numpy.dot(vectors, matrix[:3, :3].T) + matrix[:3, 3]
+
+def rowLengths(vectors):
+    '''Lengths of the vectors in an (..., 3) array'''
+    return numpy.sqrt(numpy.einsum("...k,...k->...", vectors, vectors))
+
+def normalizeRows(vectors):
+    # zero vectors stay zero like in mathutils
+    lengths = rowLengths(vectors)[..., numpy.newaxis]
+    return vectors / numpy.where(lengths > 0, lengths, 1)
@@ -3,6 +3,7 @@ import itertools
 from . import problems
 from . update import updateEverything
 from . utils.recursion import noRecursion
+from . utils.id_reference import validateObjectNameIndex
 from . tree_info import iterSocketsThatNeedUpdate
 from . utils.nodes import iterNodesInAnimationNodeTrees, getAnimationNodeTrees
 from . execution.units import setupExecutionUnits, finishExecutionUnits
@@ -14,6 +15,8 @@ def update(events):
         print("Skip event: cannot write to ID classes")
         return
 
+    validateObjectNameIndex()
+
     if didNameChange() or events.intersection({"File", "Addon", "Tree"}):
         updateEverything()
 
@@ -24,7 +27,7 @@ def update(events):
         if len(nodeTrees) > 0:
             setupExecutionUnits()
             executeNodeTrees(nodeTrees)
-            afterExecution()
+            afterExecution(nodeTrees)
             finishExecutionUnits()
 
 
@@ -1,5 +1,9 @@
 import bpy
+import time
 from .. import problems
+from .. utils.timing import prettyTime
+from .. utils.handlers import eventHandler
+from . output_writes import getWrittenScenes
 from .. preferences import getPreferences
 from .. utils.blender_ui import redrawAll
 from .. utils.nodes import getAnimationNodeTrees
@@ -14,12 +18,66 @@ def executeNodeTrees(nodeTrees):
     for nodeTree in nodeTrees:
         nodeTree.autoExecute()
 
-def afterExecution():
+# redraws are not needed more often than the display can show them
+minRedrawInterval = 1 / 60
+
+class PostExecutionInfo:
+    def __init__(self):
+        self.totalTime = 0
+        self.updatedScenes = 0
+        self.redraws = 0
+        self.skippedRedraws = 0
+
+    def __repr__(self):
+        return "{} - Updated Scenes: {} - Redraws: {} - Skipped Redraws: {}".format(
+            prettyTime(self.totalTime), self.updatedScenes, self.redraws, self.skippedRedraws)
+
+postExecutionInfo = PostExecutionInfo()
+lastRedrawTime = 0
+redrawIsPending = False
+
+def afterExecution(nodeTrees):
+    start = time.perf_counter()
+
     prefs = getPreferences()
     if prefs.sceneUpdateAfterAutoExecution:
-        for scene in bpy.data.scenes:
+        # the scenes of the trees are always updated because
+        # not all nodes report what they changed
+        scenes = getWrittenScenes(bpy.data.scenes)
+        for nodeTree in nodeTrees:
+            if nodeTree.scene not in scenes:
+                scenes.append(nodeTree.scene)
+        for scene in scenes:
             scene.update()
+        postExecutionInfo.updatedScenes = len(scenes)
 
     from .. events import isRendering
     if prefs.redrawAllAfterAutoExecution and not isRendering():
-        redrawAll()
+        requestRedraw()
+
+    postExecutionInfo.totalTime = time.perf_counter() - start
+
+def getPostExecutionInfo():
+    return postExecutionInfo
+
+def requestRedraw():
+    global redrawIsPending
+    if time.perf_counter() - lastRedrawTime >= minRedrawInterval:
+        redraw()
+    else:
+        redrawIsPending = True
+        postExecutionInfo.skippedRedraws += 1
+
+@eventHandler("SCENE_UPDATE_POST")
+def redrawWhenPending(scene):
+    if not redrawIsPending: return
+    from .. events import isRendering
+    if not isRendering() and time.perf_counter() - lastRedrawTime >= minRedrawInterval:
+        redraw()
+
+def redraw():
+    global lastRedrawTime, redrawIsPending
+    redrawAll()
+    lastRedrawTime = time.perf_counter()
+    redrawIsPending = False
+    postExecutionInfo.redraws += 1
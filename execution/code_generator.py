@@ -29,7 +29,9 @@ def getInitialVariables(nodes):
 def iterSetupCodeLines(nodes, variables):
     yield from iter_Imports(nodes)
     yield get_LoadRandomNumberCache()
+    yield get_LoadRandomNumberFunction()
     yield get_LoadMeasurementsDict()
+    yield get_LoadShouldWriteFunction()
     yield from iter_GetNodeReferences(nodes)
     yield from iter_GetSocketValues(nodes, variables)
 
@@ -38,6 +40,7 @@ def iter_Imports(nodes):
     yield "from mathutils import Vector, Matrix, Quaternion, Euler"
     yield "from time import perf_counter as getCurrentTime"
     yield "animation_nodes = sys.modules.get({})".format(repr(addonName))
+    yield "ColumnList = animation_nodes.data_structures.column_list.ColumnList"
 
 def get_ImportModules(nodes):
     neededModules = {"bpy", "sys"}
@@ -54,9 +57,15 @@ def getModulesNeededByNodes(nodes):
 def get_LoadRandomNumberCache():
     return "random_number_cache = animation_nodes.algorithms.random.getRandomNumberCache()"
 
+def get_LoadRandomNumberFunction():
+    return "random_number = animation_nodes.algorithms.random.randomNumber"
+
 def get_LoadMeasurementsDict():
     return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
 
+def get_LoadShouldWriteFunction():
+    return "should_write = animation_nodes.execution.output_writes.shouldWrite"
+
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
     for node in nodes:
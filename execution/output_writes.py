@@ -0,0 +1,105 @@
+import bpy
+from collections import defaultdict
+
+'''
+Output nodes set the same values in most executions. Every write tags
+the ID for an update, so that Blender evaluates it again even though
+nothing changed. The generated code of output nodes therefore compares
+the new value with the value that is currently stored before writing it.
+
+The stored value is used instead of a separate cache of the last written
+values, because it also contains changes of fcurves, drivers and the user.
+'''
+
+class WriteCounts:
+    __slots__ = ("performed", "skipped")
+
+    def __init__(self):
+        self.performed = 0
+        self.skipped = 0
+
+# counts of the last execution by data path
+writeCountsByPath = defaultdict(WriteCounts)
+
+# hashes of the objects and scenes that have been changed in the last execution,
+# only the hashes are stored because the data might be removed later
+writtenObjectHashes = set()
+writtenSceneHashes = set()
+allScenesWritten = False
+
+def resetWriteCounts():
+    global allScenesWritten
+    writeCountsByPath.clear()
+    writtenObjectHashes.clear()
+    writtenSceneHashes.clear()
+    allScenesWritten = False
+
+def getWriteCounts():
+    return writeCountsByPath
+
+def shouldWrite(owner, currentValue, newValue, path):
+    if valuesAreEqual(currentValue, newValue):
+        writeCountsByPath[path].skipped += 1
+        return False
+    else:
+        writeCountsByPath[path].performed += 1
+        markAsWritten(owner.id_data)
+        return True
+
+def countWrites(path, performed, skipped, objects = ()):
+    counts = writeCountsByPath[path]
+    counts.performed += performed
+    counts.skipped += skipped
+    if performed > 0:
+        markObjectsAsWritten(object for object in objects if object is not None)
+
+def markAsWritten(id):
+    global allScenesWritten
+    if isinstance(id, bpy.types.Object): markObjectsAsWritten((id, ))
+    else: allScenesWritten = True
+
+def markObjectsAsWritten(objects):
+    global allScenesWritten
+    if allScenesWritten: return
+    # object.users_scene has to search every scene, so it is avoided when possible
+    sceneAmount = len(bpy.data.scenes)
+    if sceneAmount <= 1:
+        allScenesWritten = True
+        return
+
+    for object in objects:
+        objectHash = hash(object)
+        if objectHash in writtenObjectHashes: continue
+        writtenObjectHashes.add(objectHash)
+        writtenSceneHashes.update(hash(scene) for scene in object.users_scene)
+        if len(writtenSceneHashes) >= sceneAmount:
+            allScenesWritten = True
+            return
+
+def getWrittenScenes(scenes):
+    '''Scenes that contain changed objects, all scenes when other data has been changed'''
+    if allScenesWritten: return list(scenes)
+    return [scene for scene in scenes if hash(scene) in writtenSceneHashes]
+
+def valuesAreEqual(currentValue, newValue):
+    # float properties only have single precision
+    if type(currentValue) is float and type(newValue) in (float, int):
+        return abs(currentValue - newValue) <= abs(newValue) * 1e-7
+    try: return bool(currentValue == newValue)
+    except (TypeError, ValueError): return False
+
+def iterWriteCodeLines(target, path, value, indent = ""):
+    '''Code that sets target.path to value when it changed'''
+    expression = target + path if path.startswith("[") else target + "." + path
+    # custom properties might not exist yet and don't trigger updates anyway
+    if "[\"" in path or "['" in path:
+        yield "{}{} = {}".format(indent, expression, value)
+        return
+
+    # the value expression should only be evaluated once
+    if not value.isidentifier():
+        yield "{}_write_value = {}".format(indent, value)
+        value = "_write_value"
+
+    yield "{}if should_write({}, {}, {}, {}):".format(indent, target, expression, value, repr(path))
+    yield "{}    {} = {}".format(indent, expression, value)
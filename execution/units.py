@@ -3,6 +3,7 @@ from .. import problems
 from collections import defaultdict
 from . cache import clearExecutionCache
 from . measurements import resetMeasurements
+from . output_writes import resetWriteCounts
 from . main_execution_unit import MainExecutionUnit
 from . loop_execution_unit import LoopExecutionUnit
 from . group_execution_unit import GroupExecutionUnit
@@ -54,6 +55,7 @@ def setupExecutionUnits():
         if len(getAnimationNodeTrees()) == 0: return
         if not problems.canExecute(): return
 
+        resetWriteCounts()
         for unit in getExecutionUnits():
             unit.setup()
 
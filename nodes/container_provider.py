@@ -1,4 +1,5 @@
 import bpy
+from .. utils.id_reference import findObjectByName
 from .. utils.names import getPossibleNodeName
 
 mainObjectContainerName = "Animation Nodes Object Container"
@@ -6,7 +7,7 @@ helperMaterialName = "Helper Material for Animation Nodes"
 
 
 def getMainObjectContainer(scene):
-    objectContainer = bpy.data.objects.get(mainObjectContainerName)
+    objectContainer = findObjectByName(mainObjectContainerName)
     if objectContainer is None:
         objectContainer = newMainObjectContainer()
     if objectContainer.name not in scene.objects:
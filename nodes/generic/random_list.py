@@ -0,0 +1,106 @@
+import bpy
+import random
+from math import radians
+from bpy.props import *
+from mathutils import Euler, Quaternion
+from ... events import propertyChanged
+from ... sockets.info import toListDataType
+from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
+from ... data_structures.number_array import NumberArray
+from ... algorithms.random import randomNumberRows, getColorsFromHues
+
+nodeTypes = {
+    "Float" : "Random Float List",
+    "Vector" : "Random Vector List",
+    "Euler" : "Random Euler List",
+    "Quaternion" : "Random Quaternion List",
+    "Color" : "Random Color List" }
+
+class RandomListNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_RandomListNode"
+    bl_label = "Random List"
+    dynamicLabelType = "ALWAYS"
+
+    onlySearchTags = True
+    searchTags = [(tag, {"dataType" : repr(type)}) for type, tag in nodeTypes.items()]
+
+    def dataTypeChanged(self, context):
+        self.generateSockets()
+
+    dataType = StringProperty(default = "Float", update = dataTypeChanged)
+    nodeSeed = IntProperty(name = "Node Seed", update = propertyChanged, min = 0)
+
+    def create(self):
+        self.generateSockets()
+        self.randomizeNodeSeed()
+
+    def draw(self, layout):
+        layout.prop(self, "nodeSeed")
+
+    def drawLabel(self):
+        return nodeTypes[self.dataType]
+
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+
+        self.newInput("Integer", "Seed", "seed")
+        self.newInput("Integer", "Amount", "amount", value = 5, minValue = 0)
+        if self.dataType == "Float":
+            self.newInput("Float", "Min", "minValue", value = 0.0)
+            self.newInput("Float", "Max", "maxValue", value = 1.0)
+        elif self.dataType == "Vector":
+            self.newInput("Float", "Scale", "scale", value = 2.0)
+        elif self.dataType == "Euler":
+            self.newInput("Float", "Scale", "scale", value = radians(30))
+        elif self.dataType == "Quaternion":
+            self.newInput("Float", "Scale", "scale", value = 0.3)
+        elif self.dataType == "Color":
+            self.newInput("Float", "Saturation", "saturation", value = 1.0, minValue = 0, maxValue = 1)
+            self.newInput("Float", "Value", "value", value = 1.0, minValue = 0, maxValue = 1)
+        self.newOutput(toListDataType(self.dataType), "List", "list")
+
+    def getExecutionCode(self):
+        if self.dataType == "Float":
+            return "list = self.execute_Float(seed, amount, minValue, maxValue)"
+        if self.dataType == "Vector":
+            return "list = self.execute_Vector(seed, amount, scale)"
+        if self.dataType == "Euler":
+            return "list = self.execute_Euler(seed, amount, scale)"
+        if self.dataType == "Quaternion":
+            return "list = self.execute_Quaternion(seed, amount, scale)"
+        if self.dataType == "Color":
+            return "list = self.execute_Color(seed, amount, saturation, value)"
+
+    def execute_Float(self, seed, amount, minValue, maxValue):
+        numbers = self.getRandomNumbers(seed, amount, 1)[:, 0]
+        return NumberArray(minValue + numbers * (maxValue - minValue))
+
+    def execute_Vector(self, seed, amount, scale):
+        return VectorArray(self.getRandomVectorData(seed, amount, scale))
+
+    def execute_Euler(self, seed, amount, scale):
+        return list(map(Euler, self.getRandomVectorData(seed, amount, scale).tolist()))
+
+    def execute_Quaternion(self, seed, amount, scale):
+        data = self.getRandomVectorData(seed, amount, scale)
+        return [Quaternion((1, x, y, z)) for x, y, z in data.tolist()]
+
+    def execute_Color(self, seed, amount, saturation, value):
+        hues = self.getRandomNumbers(seed, amount, 1)[:, 0]
+        return getColorsFromHues(hues, saturation, value).tolist()
+
+    def getRandomVectorData(self, seed, amount, scale):
+        # same range as the single value random nodes
+        return (self.getRandomNumbers(seed, amount, 3) - 0.5) * scale
+
+    def getRandomNumbers(self, seed, amount, rowLength):
+        # every node seed has its own part of the random sequence for this seed
+        return randomNumberRows(seed, amount, rowLength, offset = self.nodeSeed * 2**32)
+
+    def duplicate(self, sourceNode):
+        self.randomizeNodeSeed()
+
+    def randomizeNodeSeed(self):
+        self.nodeSeed = int(random.random() * 100)
@@ -1,15 +1,44 @@
 import bpy
+from bpy.props import *
+from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
+from ... algorithms.interpolation import evaluateInterpolationArray
 
 class EvaluateInterpolationNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_EvaluateInterpolationNode"
     bl_label = "Evaluate Interpolation"
     bl_width_default = 150
 
+    def useListChanged(self, context):
+        self.generateSockets()
+
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Evaluate the interpolation for every position in a list",
+        update = useListChanged)
+
     def create(self):
-        self.newInput("Float", "Position", "position").setRange(0, 1)
+        self.generateSockets()
+
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        if self.useList:
+            self.newInput("Float List", "Positions", "positions")
+        else:
+            self.newInput("Float", "Position", "position").setRange(0, 1)
         self.newInput("Interpolation", "Interpolation", "interpolation", defaultDrawType = "PROPERTY_ONLY")
-        self.newOutput("Float", "Value", "value")
+        self.newOutput("Float List" if self.useList else "Float", "Value", "value")
 
     def getExecutionCode(self):
+        if self.useList:
+            return "value = self.evaluateList(positions, interpolation)"
         return "value = interpolation(max(min(position, 1.0), 0.0))"
+
+    def evaluateList(self, positions, interpolation):
+        positions = NumberArray.fromValue(positions, "d").clamp(0.0, 1.0)
+        return NumberArray(evaluateInterpolationArray(interpolation, positions.data))
@@ -1,4 +1,5 @@
 import bpy
+import numpy
 from bpy.props import *
 from collections import defaultdict
 from ... sockets.info import isList
@@ -8,6 +9,7 @@ from ... utils.names import toVariableName
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
 from ... utils.enum_items import enumItemsFromDicts
+from ... data_structures.mesh import PolygonList
 from mathutils.geometry import distance_point_to_plane
 
 class SortingTemplate:
@@ -100,6 +102,11 @@ class SortPolygonListWithDirectionTemplate(bpy.types.PropertyGroup, SortingTempl
         node.newInput("Vector", "Direction", "direction", value = (0, 0, 1))
 
     def sort(self, polygons, reverse, direction):
+        if isinstance(polygons, PolygonList):
+            keys = numpy.dot(polygons.centers, numpy.array(direction, dtype = "f"))
+            if reverse: keys = -keys
+            return polygons.take(numpy.argsort(keys, kind = "mergesort"))
+
         distance = distance_point_to_plane
         keyFunction = lambda polygon: distance(polygon.center, (0, 0, 0), direction)
         return sorted(polygons, key = keyFunction, reverse = reverse)
@@ -240,7 +247,7 @@ class SortListNode(bpy.types.Node, AnimationNode):
         yield "self.errorMessage = ''"
         templateParameters = ", ".join(socket.identifier for socket in self.inputs)
         yield "output = self.activeTemplate.sort({})".format(templateParameters)
-        yield "if isinstance(output, list):"
+        yield "if isinstance(output, (list, ColumnList)):"
         yield "    outList = output"
         yield "    self.errorMessage = ''"
         yield "else:"
@@ -0,0 +1,24 @@
+import bpy
+from ... base_types.node import AnimationNode
+from ... data_structures.matrix_array import MatrixArray
+
+class ComposeMatrixListNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_ComposeMatrixListNode"
+    bl_label = "Compose Matrix List"
+
+    def create(self):
+        self.newInput("Vector List", "Translations", "translations")
+        self.newInput("Euler List", "Rotations", "rotations")
+        self.newInput("Vector List", "Scales", "scales")
+        self.newOutput("Matrix List", "Matrices", "matrices")
+
+    def execute(self, translations, rotations, scales):
+        # empty lists are ignored, the others are cut to the same length
+        lengths = [len(values) for values in (translations, rotations, scales) if len(values) > 0]
+        if len(lengths) == 0: return MatrixArray.identity(0)
+        amount = min(lengths)
+
+        def prepare(values):
+            return values[:amount] if len(values) > 0 else None
+
+        return MatrixArray.compose(prepare(translations), prepare(rotations), prepare(scales), amount)
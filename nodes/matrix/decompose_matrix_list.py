@@ -0,0 +1,29 @@
+import bpy
+from mathutils import Euler
+from ... base_types.node import AnimationNode
+from ... data_structures.matrix_array import MatrixArray
+
+class DecomposeMatrixListNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_DecomposeMatrixListNode"
+    bl_label = "Decompose Matrix List"
+
+    def create(self):
+        self.newInput("Matrix List", "Matrices", "matrices")
+        self.newOutput("Vector List", "Translations", "translations")
+        self.newOutput("Euler List", "Rotations", "rotations")
+        self.newOutput("Vector List", "Scales", "scales")
+
+    def getExecutionCode(self):
+        isLinked = self.getLinkedOutputsDict()
+        if not any(isLinked.values()): return
+
+        yield "_matrices = self.toMatrixArray(matrices)"
+        if isLinked["translations"]: yield "translations = _matrices.getTranslations()"
+        if isLinked["rotations"]:    yield "rotations = self.getRotations(_matrices)"
+        if isLinked["scales"]:       yield "scales = _matrices.getScales()"
+
+    def toMatrixArray(self, matrices):
+        return MatrixArray.fromValue(matrices)
+
+    def getRotations(self, matrices):
+        return list(map(Euler, matrices.getRotations().tolist()))
@@ -1,8 +1,6 @@
 import bpy
-import operator
-import functools
-from mathutils import Matrix
 from ... base_types.node import AnimationNode
+from ... data_structures.matrix_array import MatrixArray
 
 class MatrixCombineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MatrixCombineNode"
@@ -13,4 +11,4 @@ class MatrixCombineNode(bpy.types.Node, AnimationNode):
         self.newOutput("Matrix", "Result", "result")
 
     def execute(self, matrices):
-        return functools.reduce(operator.mul, reversed(matrices), Matrix.Identity(4))
+        return MatrixArray.fromValue(matrices).combine()
@@ -0,0 +1,53 @@
+import bpy
+from bpy.props import *
+from ... tree_info import keepNodeState
+from ... base_types.node import AnimationNode
+from ... data_structures.matrix_array import MatrixArray
+
+operationItems = [
+    ("LIST_MATRIX", "List * Matrix", "Multiply every matrix in the list with the matrix from the right", "", 0),
+    ("MATRIX_LIST", "Matrix * List", "Multiply every matrix in the list with the matrix from the left", "", 1),
+    ("LIST_LIST", "List * List", "Multiply the matrices with the same index", "", 2),
+    ("INVERT", "Invert", "Invert every matrix; singular matrices become the identity", "", 3) ]
+
+class MatrixListMathNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_MatrixListMathNode"
+    bl_label = "Matrix List Math"
+
+    def operationChanged(self, context):
+        self.generateSockets()
+
+    operation = EnumProperty(name = "Operation", items = operationItems,
+        default = "LIST_MATRIX", update = operationChanged)
+
+    def create(self):
+        self.generateSockets()
+        self.newOutput("Matrix List", "Matrices", "result")
+
+    def draw(self, layout):
+        layout.prop(self, "operation", text = "")
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.newInput("Matrix List", "Matrices", "matrices")
+        if self.operation in ("LIST_MATRIX", "MATRIX_LIST"):
+            self.newInput("Matrix", "Matrix", "matrix")
+        elif self.operation == "LIST_LIST":
+            self.newInput("Matrix List", "Matrices B", "matricesB")
+
+    def getExecutionCode(self):
+        op = self.operation
+        if op == "LIST_MATRIX": return "result = self.toMatrixArray(matrices).multiply(matrix)"
+        if op == "MATRIX_LIST": return "result = self.toMatrixArray(matrices).multiplyLeft(matrix)"
+        if op == "LIST_LIST": return "result = self.execute_MultiplyLists(matrices, matricesB)"
+        if op == "INVERT": return "result = self.toMatrixArray(matrices).inverted()"
+
+    def execute_MultiplyLists(self, matricesA, matricesB):
+        matricesA = MatrixArray.fromValue(matricesA)
+        matricesB = MatrixArray.fromValue(matricesB)
+        amount = min(len(matricesA), len(matricesB))
+        return matricesA[:amount].multiply(matricesB[:amount])
+
+    def toMatrixArray(self, matrices):
+        return MatrixArray.fromValue(matrices)
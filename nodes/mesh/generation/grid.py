@@ -3,7 +3,8 @@ from bpy.props import *
 from mathutils import Vector
 from .... base_types.node import AnimationNode
 from .... algorithms.mesh_generation.indices_utils import gridQuadPolygonIndices, gridQuadEdgeIndices
-from .... algorithms.mesh_generation.basic_shapes import gridVertices
+from .... data_structures.vector_array import VectorArray
+from .... algorithms.mesh_generation.basic_shapes import gridVertexArray
 from .... events import executionCodeChanged
 
 class GridMeshNode(bpy.types.Node, AnimationNode):
@@ -34,7 +35,7 @@ class GridMeshNode(bpy.types.Node, AnimationNode):
         offset.x -= (xDivisions - 1) * xDistance / 2 if self.centerGrid else 0
         offset.y -= (yDivisions - 1) * yDistance / 2 if self.centerGrid else 0
 
-        vertices = gridVertices(xDivisions, yDivisions, xDistance, yDistance, offset) if self.outputs[0].isLinked else []
+        vertices = VectorArray(gridVertexArray(xDivisions, yDivisions, xDistance, yDistance, offset)) if self.outputs[0].isLinked else []
         edgeIndices = gridQuadEdgeIndices(xDivisions, yDivisions) if self.outputs[1].isLinked else []
         polygonIndices = gridQuadPolygonIndices(xDivisions, yDivisions) if self.outputs[2].isLinked else []
 
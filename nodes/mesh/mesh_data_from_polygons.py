@@ -1,6 +1,6 @@
 import bpy
 from ... base_types.node import AnimationNode
-from ... data_structures.mesh import MeshData
+from ... data_structures.mesh import MeshData, PolygonList
 
 class MeshDataFromPolygonsNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MeshDataFromPolygonsNode"
@@ -11,6 +11,9 @@ class MeshDataFromPolygonsNode(bpy.types.Node, AnimationNode):
         self.newOutput("Mesh Data", "Mesh Data", "meshData")
 
     def execute(self, polygons):
+        if isinstance(polygons, PolygonList):
+            return polygons.toMeshData()
+
         vertices = []
         extendVertices = vertices.extend
         polygonIndices = []
@@ -1,9 +1,11 @@
 import bpy
+import numpy
 from bpy.props import *
 from ... events import isRendering
 from ... utils.math import extractRotation
 from ... base_types.node import AnimationNode
-from ... data_structures.mesh import Polygon, Vertex
+from ... data_structures.vector_array import VectorArray
+from ... data_structures.mesh import PolygonList, VertexList
 
 class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectMeshDataNode"
@@ -31,8 +33,8 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         yield "    mesh = self.getMesh(object, useModifiers, scene)"
         yield "    meshName = mesh.name"
 
-        if isLinked["vertexLocations"] or isLinked["polygons"]:
-            yield "    vertexLocations = self.getVertexLocations(mesh, object, useWorldSpace, {})".format(repr(isLinked["vertexLocations"]))
+        if isLinked["vertexLocations"]:
+            yield "    vertexLocations = self.getVertexLocations(mesh, object, useWorldSpace)"
         if isLinked["edgeIndices"]:
             yield "    edgeIndices = self.getEdgeIndices(mesh)"
         if isLinked["polygonIndices"]:
@@ -40,7 +42,7 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         if isLinked["vertices"]:
             yield "    vertices = self.getVertices(mesh, object, useWorldSpace)"
         if isLinked["polygons"]:
-            yield "    polygons = self.getPolygons(mesh, vertexLocations, object, useWorldSpace)"
+            yield "    polygons = self.getPolygons(mesh, object, useWorldSpace)"
 
         yield "    self.clearMesh(mesh, useModifiers, scene)"
         yield "else: vertexLocations, edgeIndices, polygonIndices, vertices, polygons = [], [], [], [], []"
@@ -56,13 +58,13 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         if useModifiers and scene is not None: bpy.data.meshes.remove(mesh)
 
 
-    def getVertexLocations(self, mesh, object, useWorldSpace, copyVertices):
+    def getVertexLocations(self, mesh, object, useWorldSpace):
+        locations = numpy.empty(len(mesh.vertices) * 3, dtype = "f")
+        mesh.vertices.foreach_get("co", locations)
+        vertexLocations = VectorArray(locations)
         if useWorldSpace:
-            matrix = object.matrix_world
-            return [matrix * v.co for v in mesh.vertices]
-        else:
-            if copyVertices: return [v.co.copy() for v in mesh.vertices]
-            else: return [v.co for v in mesh.vertices]
+            return vertexLocations.transform(object.matrix_world)
+        return vertexLocations
 
     def getEdgeIndices(self, mesh):
         return [tuple(edge.vertices) for edge in mesh.edges]
@@ -71,22 +73,18 @@ class ObjectMeshDataNode(bpy.types.Node, AnimationNode):
         return [tuple(face.vertices) for face in mesh.polygons]
 
     def getVertices(self, mesh, object, useWorldSpace):
-        vertices = []
         if useWorldSpace:
             matrix = object.matrix_world
             rotation = extractRotation(matrix)
-            vertices = [Vertex.fromMeshVertexInWorldSpace(meshVertex, matrix, rotation) for meshVertex in mesh.vertices]
+            return VertexList.fromMeshVertices(mesh.vertices, matrix, rotation)
         else:
-            vertices = [Vertex.fromMeshVertexInLocalSpace(meshVertex) for meshVertex in mesh.vertices]
-        return vertices
+            return VertexList.fromMeshVertices(mesh.vertices)
 
-    def getPolygons(self, mesh, vertexLocations, object, useWorldSpace):
-        polygons = []
+    def getPolygons(self, mesh, object, useWorldSpace):
         if useWorldSpace:
             matrix = object.matrix_world
             rotation = extractRotation(matrix)
             scale = matrix.median_scale
-            polygons = [Polygon.fromMeshPolygonInWorldSpace(meshPolygon, vertexLocations, matrix, rotation, scale) for meshPolygon in mesh.polygons]
+            return PolygonList.fromMesh(mesh, matrix, rotation, scale)
         else:
-            polygons = [Polygon.fromMeshPolygonInLocalSpace(meshPolygon, vertexLocations) for meshPolygon in mesh.polygons]
-        return polygons
+            return PolygonList.fromMesh(mesh)
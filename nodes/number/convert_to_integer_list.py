@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 originTypeItems = [
     ("Edge Indices", "Edge Indices", "", "NONE", 0),
@@ -39,7 +40,10 @@ class ConvertToIntegerListNode(bpy.types.Node, AnimationNode):
         if "Indices" in self.originType:
             yield "integerList = list(inList)"
         elif self.originType == "Float List":
-            yield "integerList = list(map(int, inList))"
+            yield "integerList = self.convertFloatList(inList)"
+
+    def convertFloatList(self, numbers):
+        return NumberArray.fromValue(numbers, "d").toIntegers()
 
     @keepNodeState
     def recreateInput(self):
@@ -1,24 +1,49 @@
 import bpy
 from bpy.props import *
-from ... tree_info import keepNodeLinks
+from ... tree_info import keepNodeLinks, keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 class FloatClampNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatClampNode"
     bl_label = "Clamp"
     dynamicLabelType = "HIDDEN_ONLY"
 
+    def useListChanged(self, context):
+        self.generateSockets()
+
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Clamp every number in a list",
+        update = useListChanged)
+
     def create(self):
-        self.newInput("Float", "Value", "value")
+        self.generateSockets()
+
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        valueType = "Float List" if self.useList else "Float"
+        self.newInput(valueType, "Value", "value")
         self.newInput("Float", "Min", "minValue", value = 0.0)
         self.newInput("Float", "Max", "maxValue", value = 1.0)
-        self.newOutput("Float", "Value", "outValue")
+        self.newOutput(valueType, "Value", "outValue")
 
     def getExecutionCode(self):
+        if self.useList:
+            yield "outValue = self.clampList(value, minValue, maxValue)"
+            return
+
         yield "outValue = min(max(value, minValue), maxValue)"
         if self.outputs[0].dataType == "Integer":
             yield "outValue = int(outValue)"
 
+    def clampList(self, numbers, minValue, maxValue):
+        return NumberArray.fromValue(numbers, "d").clamp(minValue, maxValue)
+
     def drawLabel(self):
         label = "clamp(min, max)"
         if self.minValueSocket.isUnlinked:
@@ -28,6 +53,7 @@ class FloatClampNode(bpy.types.Node, AnimationNode):
         return label
 
     def edit(self):
+        if self.useList: return
         output = self.outputs[0]
         if output.dataType == "Float":
             if output.shouldBeIntegerSocket(): self.setOutputType("Integer")
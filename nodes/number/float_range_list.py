@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... sockets.info import toListDataType
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 class FloatRangeListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_FloatRangeListNode"
@@ -34,6 +35,9 @@ class FloatRangeListNode(bpy.types.Node, AnimationNode):
 
     def getExecutionCode(self):
         if self.dataType == "Float":
-            return "list = [start + i * step for i in range(amount)]"
+            return "list = self.createRange(amount, start, step, 'd')"
         if self.dataType == "Integer":
-            return "list = [int(start + i * step) for i in range(amount)]"
+            return "list = self.createRange(amount, start, step, 'int64')"
+
+    def createRange(self, amount, start, step, dtype):
+        return NumberArray.range(amount, start, step, dtype)
@@ -0,0 +1,20 @@
+from bpy.props import *
+from ... events import executionCodeChanged
+
+class LegacyRandomBase:
+    '''
+    Random nodes that existed before the counter based random numbers can
+    still use the numbers of older versions so that existing files don't change.
+    Has to come before AnimationNode in the base classes to overwrite drawAdvanced.
+    '''
+
+    legacyRandom = BoolProperty(name = "Legacy Random Numbers", default = True,
+        description = "Use the random numbers of older versions so that existing files do not change",
+        update = executionCodeChanged)
+
+    def disableLegacyRandom(self):
+        # only nodes loaded from older files keep the default
+        self.legacyRandom = False
+
+    def drawAdvanced(self, layout):
+        layout.prop(self, "legacyRandom")
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 operationItems = [
     ("ADD", "Add", "", "", 0),
@@ -25,11 +26,12 @@ class NumberListMathNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "operation", text = "")
 
     def getExecutionCode(self):
-        if self.operation in ("ADD", "AVERAGE"): yield "result = functools.reduce(operator.add, numbers, 0)"
-        if self.operation == "MULTIPLY": yield "result = functools.reduce(operator.mul, numbers, 1)"
-        if self.operation == "MIN": yield "result = min(numbers) if len(numbers) > 0 else 0"
-        if self.operation == "MAX": yield "result = max(numbers) if len(numbers) > 0 else 0"
-        if self.operation == "AVERAGE": yield "if len(numbers) > 0: result /= len(numbers)"
+        yield "_numbers = self.toNumberArray(numbers)"
+        if self.operation == "ADD": yield "result = _numbers.sum()"
+        if self.operation == "MULTIPLY": yield "result = _numbers.product()"
+        if self.operation == "MIN": yield "result = _numbers.min()"
+        if self.operation == "MAX": yield "result = _numbers.max()"
+        if self.operation == "AVERAGE": yield "result = _numbers.average()"
 
-    def getUsedModules(self):
-        return ["operator", "functools"]
+    def toNumberArray(self, numbers):
+        return NumberArray.fromValue(numbers)
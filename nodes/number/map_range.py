@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 class MapRangeNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_MapRangeNode"
@@ -19,14 +20,20 @@ class MapRangeNode(bpy.types.Node, AnimationNode):
         description = "Don't use the normal linear interpolation between Min and Max (only available when clamp is turned on)",
         update = settingChanged)
 
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Map every number in a list",
+        update = settingChanged)
+
     def create(self):
         self.recreateInputs()
-        self.newOutput("Float", "Value", "newValue")
 
     @keepNodeState
     def recreateInputs(self):
         self.inputs.clear()
-        self.newInput("Float", "Value", "value")
+        self.outputs.clear()
+        valueType = "Float List" if self.useList else "Float"
+        self.newOutput(valueType, "Value", "newValue")
+        self.newInput(valueType, "Value", "value")
         self.newInput("Float", "Input Min", "inMin", value = 0)
         self.newInput("Float", "Input Max", "inMax", value = 1)
         self.newInput("Float", "Output Min", "outMin", value = 0)
@@ -43,7 +50,16 @@ class MapRangeNode(bpy.types.Node, AnimationNode):
         subcol.active = self.clampInput
         subcol.prop(self, "useInterpolation")
 
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
     def getExecutionCode(self):
+        if self.useList:
+            useInterpolation = self.useInterpolation and self.clampInput
+            yield "newValue = self.mapList(value, inMin, inMax, outMin, outMax, {}, {})".format(
+                repr(self.clampInput), "interpolation" if useInterpolation else "None")
+            return
+
         yield "if inMin == inMax: newValue = 0"
         yield "else:"
         if self.clampInput:
@@ -54,3 +70,7 @@ class MapRangeNode(bpy.types.Node, AnimationNode):
                 yield "    newValue = outMin + (_value - inMin) / (inMax - inMin) * (outMax - outMin)"
         else:
             yield "    newValue = outMin + (value - inMin) / (inMax - inMin) * (outMax - outMin)"
+
+    def mapList(self, numbers, inMin, inMax, outMin, outMax, clamp, interpolation):
+        numbers = NumberArray.fromValue(numbers, "d")
+        return numbers.mapRange(inMin, inMax, outMin, outMax, clamp, interpolation)
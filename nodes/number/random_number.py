@@ -3,8 +3,9 @@ import random
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from . legacy_random_base import LegacyRandomBase
 
-class RandomNumberNode(bpy.types.Node, AnimationNode):
+class RandomNumberNode(bpy.types.Node, LegacyRandomBase, AnimationNode):
     bl_idname = "an_RandomNumberNode"
     bl_label = "Random Number"
 
@@ -15,13 +16,17 @@ class RandomNumberNode(bpy.types.Node, AnimationNode):
         self.newInput("Float", "Min", "minValue").value = 0.0
         self.newInput("Float", "Max", "maxValue").value = 1.0
         self.newOutput("Float", "Number", "number")
+        self.disableLegacyRandom()
         self.randomizeNodeSeed()
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed", text = "Node Seed")
 
     def getExecutionCode(self):
-        yield "number = random_number_cache[(seed + self.nodeSeed * 123259) % len(random_number_cache)]"
+        if self.legacyRandom:
+            yield "number = random_number_cache[(seed + self.nodeSeed * 123259) % len(random_number_cache)]"
+        else:
+            yield "number = random_number(seed, self.nodeSeed)"
         yield "number = number * (maxValue - minValue) + minValue"
 
     def duplicate(self, sourceNode):
@@ -0,0 +1,36 @@
+from bpy.props import *
+from ... tree_info import keepNodeState
+
+class WiggleNodeBase:
+    '''
+    Sockets and the list option of the wiggle nodes.
+    Subclasses define dataType, outputName and amplitudeDefault.
+    Has to come before AnimationNode in the base classes to overwrite create and drawAdvanced.
+    '''
+
+    def useListChanged(self, context):
+        self.generateSockets()
+
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Calculate one value for every seed in a list",
+        update = useListChanged)
+
+    def create(self):
+        self.generateSockets()
+
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        if self.useList: self.newInput("Float List", "Seeds", "seeds")
+        else: self.newInput("Float", "Seed", "seed")
+        self.newInput("Float", "Evolution", "evolution")
+        self.newInput("Float", "Speed", "speed", value = 1, minValue = 0)
+        self.newInput(self.dataType, "Amplitude", "amplitude", value = self.amplitudeDefault)
+        self.newInput("Integer", "Octaves", "octaves", value = 2)
+        self.newInput("Float", "Persistance", "persistance", value = 0.3)
+        if self.useList: self.newOutput(self.dataType + " List", self.outputName + "s", self.outputName.lower() + "s")
+        else: self.newOutput(self.dataType, self.outputName, self.outputName.lower())
@@ -3,6 +3,7 @@ from bpy.props import *
 from ... utils.code import isCodeValid
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
+from ... execution.output_writes import iterWriteCodeLines
 
 class ObjectAttributeOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectAttributeOutputNode"
@@ -25,16 +26,14 @@ class ObjectAttributeOutputNode(bpy.types.Node, AnimationNode):
             layout.label(self.errorMessage, icon = "ERROR")
 
     def getExecutionCode(self):
-        code = self.evaluationExpression
-
-        if not isCodeValid(code):
+        if not isCodeValid(self.evaluationExpression):
             self.errorMessage = "Invalid Syntax"
             return
         else: self.errorMessage = ""
 
         yield "try:"
         yield "    self.errorMessage = ''"
-        yield "    " + code
+        yield from iterWriteCodeLines("object", self.attribute, "value", "    ")
         yield "except AttributeError:"
         yield "    if object: self.errorMessage = 'Attribute not found'"
         yield "except KeyError:"
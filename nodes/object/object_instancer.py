@@ -6,6 +6,7 @@ from ... utils.names import getRandomString
 from ... base_types.node import AnimationNode
 from ... utils.enum_items import enumItemsFromDicts
 from ... utils.blender_ui import iterActiveSpacesByType
+from ... utils.id_reference import findObjectByName, findObjectsByNames, invalidateObjectNameIndex
 from ... nodes.container_provider import getMainObjectContainer
 from ... utils.names import (getPossibleMeshName,
                              getPossibleCameraName,
@@ -31,6 +32,7 @@ emptyDrawTypeItems = enumItemsFromDicts(emptyDrawTypes)
 
 class an_ObjectNamePropertyGroup(bpy.types.PropertyGroup):
     objectName = StringProperty(name = "Object Name", default = "", update = propertyChanged)
+    # not used anymore, objects are found with the shared object name index
     objectIndex = IntProperty(name = "Object Index", default = 0, update = propertyChanged)
 
 class ObjectInstancerNode(bpy.types.Node, AnimationNode):
@@ -47,6 +49,13 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
         self.resetInstances = True
         propertyChanged()
 
+    def usePoolingChanged(self, context):
+        # the hidden instances would be used again without making them visible
+        if not self.usePooling:
+            self.removePooledObjects()
+            self.activeInstancesAmount = len(self.linkedObjects)
+        propertyChanged()
+
     linkedObjects = CollectionProperty(type = an_ObjectNamePropertyGroup)
     resetInstances = BoolProperty(default = False, update = propertyChanged)
 
@@ -73,7 +82,15 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     emptyDrawType = EnumProperty(name = "Empty Draw Type", default = "PLAIN_AXES",
         items = emptyDrawTypeItems, update = resetInstancesEvent)
 
+    # older nodes keep removing the objects, new nodes enable it in create()
+    usePooling = BoolProperty(name = "Pool Instances", default = False,
+        description = "Hide unused instances instead of removing them, so that they can be reused when the amount grows again",
+        update = usePoolingChanged)
+
+    activeInstancesAmount = IntProperty(default = 0, min = 0)
+
     def create(self):
+        self.usePooling = True
         self.updateInputSockets()
         self.newOutput("an_ObjectListSocket", "Objects", "objects")
 
@@ -98,7 +115,12 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     def drawAdvanced(self, layout):
         layout.prop(self, "parentInstances")
         layout.prop(self, "removeAnimationData")
+        layout.prop(self, "usePooling")
 
+        if self.usePooling:
+            self.invokeFunction(layout, "removePooledObjects",
+                text = "Remove Hidden Instances",
+                description = "Remove the instances that are currently not used")
         self.invokeFunction(layout, "resetObjectDataOnAllInstances",
             text = "Reset Source Data",
             description = "Reset the source data on all instances")
@@ -154,8 +176,8 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
             self.removeAllObjects()
             self.resetInstances = False
 
-        while instancesAmount < len(self.linkedObjects):
-            self.removeLastObject()
+        if not self.usePooling:
+            self.removeObjectsFromItemIndex(instancesAmount)
 
         return self.getOutputObjects(instancesAmount, sourceObject, scenes)
 
@@ -163,11 +185,9 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     def getOutputObjects(self, instancesAmount, sourceObject, scenes):
         objects = []
 
-        self.updateFastListAccess()
-
         indicesToRemove = []
-        for i, item in enumerate(self.linkedObjectsList):
-            object = self.getObjectFromItem(item)
+        linkedObjects = findObjectsByNames([item.objectName for item in self.linkedObjects])
+        for i, object in enumerate(linkedObjects):
             if object is None: indicesToRemove.append(i)
             else: objects.append(object)
 
@@ -177,43 +197,43 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
         newObjects = self.createNewObjects(missingAmount, sourceObject, scenes)
         objects.extend(newObjects)
 
+        if self.usePooling:
+            # removed items shift the indices, so the visibility of every object has to be set again
+            self.updatePool(objects, instancesAmount, isStateKnown = len(indicesToRemove) == 0)
+            return objects[:instancesAmount]
         return objects
 
-    def updateFastListAccess(self):
-        self.linkedObjectsList = list(self.linkedObjects)
-        self.objectList = list(bpy.data.objects)
-        self.objectNameList = None
-
-    # at first try to get the object by index, because it's faster and then search by name
-    def getObjectFromItem(self, item):
-        if item.objectIndex < len(self.objectList):
-            object = self.objectList[item.objectIndex]
-            if object.name == item.objectName:
-                return object
-
-        try:
-            if self.objectNameList is None:
-                self.objectNameList = list(bpy.data.objects.keys())
-            index = self.objectNameList.index(item.objectName)
-            item.objectIndex = index
-            return self.objectList[index]
-        except:
-            return None
+    # The first 'activeInstancesAmount' objects are visible, the others are
+    # hidden and can be reused when the amount of instances grows again.
+    def updatePool(self, objects, instancesAmount, isStateKnown = True):
+        activeAmount = self.activeInstancesAmount if isStateKnown else len(objects)
+        for object in objects[instancesAmount:activeAmount]:
+            setInstanceVisibility(object, False)
+        for object in objects[activeAmount if isStateKnown else 0:instancesAmount]:
+            setInstanceVisibility(object, True)
+        if self.activeInstancesAmount != instancesAmount:
+            self.activeInstancesAmount = instancesAmount
 
     def removeAllObjects(self):
-        objectNames = []
-        for item in self.linkedObjects:
-            objectNames.append(item.objectName)
+        self.removeObjectsFromItemIndex(0)
+        self.activeInstancesAmount = 0
 
-        for name in objectNames:
-            object = bpy.data.objects.get(name)
-            if object is not None:
-                self.removeObject(object)
+    def removePooledObjects(self):
+        self.removeObjectsFromItemIndex(self.activeInstancesAmount)
 
-        self.linkedObjects.clear()
+    def removeObjectsFromItemIndex(self, start):
+        items = self.linkedObjects
+        if start >= len(items): return
 
-    def removeLastObject(self):
-        self.removeObjectFromItemIndex(len(self.linkedObjects)-1)
+        objectNames = [item.objectName for item in items[start:]]
+        for index in reversed(range(start, len(items))):
+            items.remove(index)
+
+        # find all objects before the first removal changes the object index
+        objects = findObjectsByNames(objectNames)
+        for object in objects:
+            if object is not None:
+                self.removeObject(object)
 
     def removeObjectFromItemIndices(self, indices):
         for offset, index in enumerate(indices):
@@ -223,7 +243,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
         item = self.linkedObjects[itemIndex]
         objectName = item.objectName
         self.linkedObjects.remove(itemIndex)
-        object = bpy.data.objects.get(objectName)
+        object = findObjectByName(objectName)
         if object is not None:
             self.removeObject(object)
 
@@ -234,6 +254,7 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
             type = object.type
             self.removeShapeKeys(object)
             bpy.data.objects.remove(object)
+            invalidateObjectNameIndex()
             self.removeObjectData(data, type)
 
     def removeObjectData(self, data, type):
@@ -268,24 +289,30 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
 
 
     def createNewObjects(self, amount, sourceObject, scenes):
-        objects = []
+        if amount <= 0: return []
+
+        scenes = [scene for scene in scenes if scene is not None]
+        parent = None
+        if self.parentInstances and len(scenes) > 0:
+            parent = getMainObjectContainer(scenes[0])
+
         nameSuffix = "instance_{}_".format(getRandomString(5))
-        for i in range(amount):
-            name = nameSuffix + str(i)
-            newObject = self.appendNewObject(name, sourceObject, scenes)
-            objects.append(newObject)
-        return objects
+        objects = [self.newInstance(nameSuffix + str(i), sourceObject, parent) for i in range(amount)]
 
-    def appendNewObject(self, name, sourceObject, scenes):
-        object = self.newInstance(name, sourceObject, scenes)
         for scene in scenes:
-            if scene is not None: scene.objects.link(object)
-        linkedItem = self.linkedObjects.add()
-        linkedItem.objectName = object.name
-        linkedItem.objectIndex = bpy.data.objects.find(object.name)
-        return object
+            link = scene.objects.link
+            for object in objects:
+                link(object)
 
-    def newInstance(self, name, sourceObject, scenes):
+        self.appendLinkedItems(objects)
+        return objects
+
+    def appendLinkedItems(self, objects):
+        for object in objects:
+            linkedItem = self.linkedObjects.add()
+            linkedItem.objectName = object.name
+
+    def newInstance(self, name, sourceObject, parent = None):
         instanceData = self.getSourceObjectData(sourceObject)
         if self.copyObjectProperties and self.copyFromSource:
             newObject = sourceObject.copy()
@@ -293,11 +320,8 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
         else:
             newObject = self.createObject(name, instanceData)
 
-        if self.parentInstances:
-            for scene in scenes:
-                if scene is not None:
-                    newObject.parent = getMainObjectContainer(scene)
-                    break
+        if parent is not None:
+            newObject.parent = parent
         if self.removeAnimationData and newObject.animation_data is not None:
             newObject.animation_data.action = None
         newObject.select = False
@@ -334,15 +358,17 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
     def unlinkInstance(self, object):
         if bpy.context.mode != "OBJECT" and bpy.context.active_object == object:
             bpy.ops.object.mode_set(mode = "OBJECT")
-        for scene in bpy.data.scenes:
-            if object.name in scene.objects:
-                scene.objects.unlink(object)
+        # only the scenes that use the object instead of a name lookup in every scene
+        for scene in object.users_scene:
+            scene.objects.unlink(object)
 
     def resetObjectDataOnAllInstances(self):
         self.resetInstances = True
 
     def unlinkInstancesFromNode(self):
+        self.removePooledObjects()
         self.linkedObjects.clear()
+        self.activeInstancesAmount = 0
         self.inputs.get("Instances").number = 0
 
     def delete(self):
@@ -350,7 +376,12 @@ class ObjectInstancerNode(bpy.types.Node, AnimationNode):
 
     def duplicate(self, sourceNode):
         self.linkedObjects.clear()
+        self.activeInstancesAmount = 0
 
     def hideRelationshipLines(self):
         for space in iterActiveSpacesByType("VIEW_3D"):
             space.show_relationship_lines = False
+
+def setInstanceVisibility(object, visible):
+    object.hide = not visible
+    object.hide_render = not visible
@@ -1,7 +1,11 @@
 import bpy
 from bpy.props import *
+from ... tree_info import keepNodeState
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
+from ... utils.object_transforms import setObjectVectors
+from ... execution.output_writes import iterWriteCodeLines, countWrites
+from ... data_structures.vector_array import asVectorData
 
 class an_ObjectTransformsOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectTransformsOutputNode"
@@ -15,12 +19,33 @@ class an_ObjectTransformsOutputNode(bpy.types.Node, AnimationNode):
     useRotation = BoolVectorProperty(update = checkedPropertiesChanged)
     useScale = BoolVectorProperty(update = checkedPropertiesChanged)
 
+    def useListChanged(self, context):
+        self.generateSockets()
+        executionCodeChanged()
+
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Set the transforms of every object in a list at once",
+        update = useListChanged)
+
     def create(self):
-        self.newInput("Object", "Object", "object", defaultDrawType = "PROPERTY_ONLY")
-        self.newInput("Vector", "Location", "location")
-        self.newInput("Euler", "Rotation", "rotation")
-        self.newInput("Vector", "Scale", "scale", value = (1, 1, 1))
-        self.newOutput("Object", "Object", "object")
+        self.generateSockets()
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        if self.useList:
+            self.newInput("Object List", "Objects", "objects")
+            self.newInput("Vector List", "Locations", "locations")
+            self.newInput("Euler List", "Rotations", "rotations")
+            self.newInput("Vector List", "Scales", "scales")
+            self.newOutput("Object List", "Objects", "objects")
+        else:
+            self.newInput("Object", "Object", "object", defaultDrawType = "PROPERTY_ONLY")
+            self.newInput("Vector", "Location", "location")
+            self.newInput("Euler", "Rotation", "rotation")
+            self.newInput("Vector", "Scale", "scale", value = (1, 1, 1))
+            self.newOutput("Object", "Object", "object")
         self.updateSocketVisibility()
 
     def draw(self, layout):
@@ -42,10 +67,13 @@ class an_ObjectTransformsOutputNode(bpy.types.Node, AnimationNode):
         row.prop(self, "useScale", index = 1, text = "Y")
         row.prop(self, "useScale", index = 2, text = "Z")
 
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
     def updateSocketVisibility(self):
-        self.inputs["Location"].hide = not (self.useLocation[0] or self.useLocation[1] or self.useLocation[2])
-        self.inputs["Rotation"].hide = not (self.useRotation[0] or self.useRotation[1] or self.useRotation[2])
-        self.inputs["Scale"].hide = not (self.useScale[0] or self.useScale[1] or self.useScale[2])
+        self.inputs[1].hide = not (self.useLocation[0] or self.useLocation[1] or self.useLocation[2])
+        self.inputs[2].hide = not (self.useRotation[0] or self.useRotation[1] or self.useRotation[2])
+        self.inputs[3].hide = not (self.useScale[0] or self.useScale[1] or self.useScale[2])
 
     def getExecutionCode(self):
         useLoc = self.useLocation
@@ -55,31 +83,49 @@ class an_ObjectTransformsOutputNode(bpy.types.Node, AnimationNode):
         if not any((*useLoc, *useRot, *useScale)):
             return
 
+        if self.useList:
+            yield "self.setTransformsOfList(objects, locations, rotations, scales)"
+            return
+
         yield "if object is not None:"
 
         # Location
         if all((*useLoc, )):
-            yield "    object.location = location"
+            yield from iterWriteCodeLines("object", "location", "location", "    ")
         else:
             for i in range(3):
-                if useLoc[i]: yield "    object.location["+str(i)+"] = location["+str(i)+"]"
+                if useLoc[i]: yield from iterWriteCodeLines("object", "location["+str(i)+"]", "location["+str(i)+"]", "    ")
 
         # Rotation
         if all((*useRot, )):
-            yield "    object.rotation_euler = rotation"
+            yield from iterWriteCodeLines("object", "rotation_euler", "rotation", "    ")
         else:
             for i in range(3):
-                if useRot[i]: yield "    object.rotation_euler["+str(i)+"] = rotation["+str(i)+"]"
+                if useRot[i]: yield from iterWriteCodeLines("object", "rotation_euler["+str(i)+"]", "rotation["+str(i)+"]", "    ")
 
         # Scale
         if all((*useScale, )):
-            yield "    object.scale = scale"
+            yield from iterWriteCodeLines("object", "scale", "scale", "    ")
         else:
             for i in range(3):
-                if useScale[i]: yield "    object.scale["+str(i)+"] = scale["+str(i)+"]"
+                if useScale[i]: yield from iterWriteCodeLines("object", "scale["+str(i)+"]", "scale["+str(i)+"]", "    ")
+
+    def setTransformsOfList(self, objects, locations, rotations, scales):
+        for attribute, values, use in (("location", locations, self.useLocation),
+                                       ("rotation_euler", rotations, self.useRotation),
+                                       ("scale", scales, self.useScale)):
+            components = [i for i in range(3) if use[i]]
+            if len(components) > 0:
+                vectors = asVectorData(values, "f").reshape(-1, 3)
+                performed = setObjectVectors(objects, attribute, vectors, components)
+                countWrites(attribute, performed, min(len(objects), len(vectors)) - performed, objects)
 
     def getBakeCode(self):
-        yield "if object is not None:"
+        if self.useList:
+            yield "for object in objects:"
+            yield "    if object is None: continue"
+        else:
+            yield "if object is not None:"
 
         for i in range(3):
             if self.useLocation[i]:
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
+from ... execution.output_writes import iterWriteCodeLines
 
 class ObjectVisibilityOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ObjectVisibilityOutputNode"
@@ -32,13 +33,13 @@ class ObjectVisibilityOutputNode(bpy.types.Node, AnimationNode):
         yield "if object is not None:"
 
         s = self.inputs
-        if s["Hide"].isUsed:        yield "    object.hide = hide"
-        if s["Hide Render"].isUsed: yield "    object.hide_render = hideRender"
-        if s["Hide Select"].isUsed: yield "    object.hide_select = hideSelect"
+        if s["Hide"].isUsed:        yield from iterWriteCodeLines("object", "hide", "hide", "    ")
+        if s["Hide Render"].isUsed: yield from iterWriteCodeLines("object", "hide_render", "hideRender", "    ")
+        if s["Hide Select"].isUsed: yield from iterWriteCodeLines("object", "hide_select", "hideSelect", "    ")
 
-        if s["Show Name"].isUsed:   yield "    object.show_name = showName"
-        if s["Show Axis"].isUsed:   yield "    object.show_axis = showAxis"
-        if s["Show X-Ray"].isUsed:  yield "    object.show_x_ray = showXRay"
+        if s["Show Name"].isUsed:   yield from iterWriteCodeLines("object", "show_name", "showName", "    ")
+        if s["Show Axis"].isUsed:   yield from iterWriteCodeLines("object", "show_axis", "showAxis", "    ")
+        if s["Show X-Ray"].isUsed:  yield from iterWriteCodeLines("object", "show_x_ray", "showXRay", "    ")
 
         yield "    pass"
 
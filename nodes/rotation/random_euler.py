@@ -4,8 +4,9 @@ from math import radians
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from .. number.legacy_random_base import LegacyRandomBase
 
-class RandomEulerNode(bpy.types.Node, AnimationNode):
+class RandomEulerNode(bpy.types.Node, LegacyRandomBase, AnimationNode):
     bl_idname = "an_RandomEulerNode"
     bl_label = "Random Euler"
 
@@ -15,15 +16,22 @@ class RandomEulerNode(bpy.types.Node, AnimationNode):
         self.newInput("Integer", "Seed", "seed")
         self.newInput("Float", "Scale", "scale", value = radians(30))
         self.newOutput("Euler", "Euler", "randomEuler")
+        self.disableLegacyRandom()
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed")
 
     def getExecutionCode(self):
-        yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
-        yield ("randomEuler = mathutils.Euler(( (random_number_cache[startSeed] - 0.5) * scale, "
-                                                "(random_number_cache[startSeed + 1] - 0.5) * scale, "
-                                                "(random_number_cache[startSeed + 2] - 0.5) * scale))")
+        if self.legacyRandom:
+            yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
+            yield ("randomEuler = mathutils.Euler(( (random_number_cache[startSeed] - 0.5) * scale, "
+                                                    "(random_number_cache[startSeed + 1] - 0.5) * scale, "
+                                                    "(random_number_cache[startSeed + 2] - 0.5) * scale))")
+        else:
+            yield "startIndex = self.nodeSeed * 3"
+            yield ("randomEuler = mathutils.Euler(( (random_number(seed, startIndex) - 0.5) * scale, "
+                                                    "(random_number(seed, startIndex + 1) - 0.5) * scale, "
+                                                    "(random_number(seed, startIndex + 2) - 0.5) * scale))")
 
     def getUsedModules(self):
         return ["mathutils"]
@@ -3,8 +3,9 @@ import random
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from .. number.legacy_random_base import LegacyRandomBase
 
-class RandomQuaternionNode(bpy.types.Node, AnimationNode):
+class RandomQuaternionNode(bpy.types.Node, LegacyRandomBase, AnimationNode):
     bl_idname = "an_RandomQuaternionNode"
     bl_label = "Random Quaternion"
 
@@ -14,16 +15,24 @@ class RandomQuaternionNode(bpy.types.Node, AnimationNode):
         self.newInput("Integer", "Seed", "seed")
         self.newInput("Float", "Scale", "scale").value = 0.3
         self.newOutput("Quaternion", "Quaternion", "randomQuaternion")
+        self.disableLegacyRandom()
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed")
 
     def getExecutionCode(self):
-        yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
-        yield ("randomQuaternion = mathutils.Quaternion(( 1,"
-                                    "(random_number_cache[startSeed] - 0.5) * scale, "
-                                    "(random_number_cache[startSeed + 1] - 0.5) * scale, "
-                                    "(random_number_cache[startSeed + 2] - 0.5) * scale))")
+        if self.legacyRandom:
+            yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
+            yield ("randomQuaternion = mathutils.Quaternion(( 1,"
+                                        "(random_number_cache[startSeed] - 0.5) * scale, "
+                                        "(random_number_cache[startSeed + 1] - 0.5) * scale, "
+                                        "(random_number_cache[startSeed + 2] - 0.5) * scale))")
+        else:
+            yield "startIndex = self.nodeSeed * 3"
+            yield ("randomQuaternion = mathutils.Quaternion(( 1,"
+                                        "(random_number(seed, startIndex) - 0.5) * scale, "
+                                        "(random_number(seed, startIndex + 1) - 0.5) * scale, "
+                                        "(random_number(seed, startIndex + 2) - 0.5) * scale))")
 
     def getUsedModules(self):
         return ["mathutils"]
@@ -1,30 +1,30 @@
 import bpy
+import numpy
 from bpy.props import *
 from math import radians
 from mathutils import Euler
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
-from ... algorithms.perlin_noise import perlinNoise
+from .. number.wiggle_base import WiggleNodeBase
+from ... data_structures.number_array import NumberArray
+from ... algorithms.perlin_noise import perlinNoise, wiggleVectorArray
 
-class EulerWiggleNode(bpy.types.Node, AnimationNode):
+class EulerWiggleNode(bpy.types.Node, WiggleNodeBase, AnimationNode):
     bl_idname = "an_EulerWiggleNode"
     bl_label = "Euler Wiggle"
 
-    nodeSeed = IntProperty(update = propertyChanged)
+    dataType = "Euler"
+    outputName = "Euler"
+    amplitudeDefault = [radians(30), radians(30), radians(30)]
 
-    def create(self):
-        self.newInput("Float", "Seed", "seed")
-        self.newInput("Float", "Evolution", "evolution")
-        self.newInput("Float", "Speed", "speed", value = 1, minValue = 0)
-        self.newInput("Euler", "Amplitude", "amplitude", value = [radians(30), radians(30), radians(30)])
-        self.newInput("Integer", "Octaves", "octaves", value = 2)
-        self.newInput("Float", "Persistance", "persistance", value = 0.3)
-        self.newOutput("Euler", "Euler", "euler")
+    nodeSeed = IntProperty(update = propertyChanged)
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed", text = "Node Seed")
 
     def execute(self, seed, evolution, speed, amplitude, octaves, persistance):
+        if self.useList:
+            return self.executeList(seed, evolution, speed, amplitude, octaves, persistance)
         euler = Euler()
         evolution = evolution * max(speed, 0) / 20 + 2541 * seed + 823 * self.nodeSeed
         euler[0] = perlinNoise(evolution, persistance, octaves) * amplitude[0]
@@ -33,3 +33,9 @@ class EulerWiggleNode(bpy.types.Node, AnimationNode):
         evolution += 263
         euler[2] = perlinNoise(evolution, persistance, octaves) * amplitude[2]
         return euler
+
+    def executeList(self, seeds, evolution, speed, amplitude, octaves, persistance):
+        seeds = NumberArray.fromValue(seeds, "d").data
+        evolutions = evolution * max(speed, 0) / 20 + 2541 * seeds + 823 * self.nodeSeed
+        noise = wiggleVectorArray(evolutions, persistance, octaves)
+        return list(map(Euler, (noise * numpy.array(amplitude)).tolist()))
@@ -1,29 +1,29 @@
 import bpy
+import numpy
 from bpy.props import *
 from mathutils import Quaternion
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
-from ... algorithms.perlin_noise import perlinNoise
+from .. number.wiggle_base import WiggleNodeBase
+from ... data_structures.number_array import NumberArray
+from ... algorithms.perlin_noise import perlinNoise, wiggleVectorArray
 
-class QuaternionWiggleNode(bpy.types.Node, AnimationNode):
+class QuaternionWiggleNode(bpy.types.Node, WiggleNodeBase, AnimationNode):
     bl_idname = "an_QuaternionWiggleNode"
     bl_label = "Quaternion Wiggle"
 
-    nodeSeed = IntProperty(update = propertyChanged)
+    dataType = "Quaternion"
+    outputName = "Quaternion"
+    amplitudeDefault = [1, 0.3, 0.3, 0.3]
 
-    def create(self):
-        self.newInput("Float", "Seed", "seed")
-        self.newInput("Float", "Evolution", "evolution")
-        self.newInput("Float", "Speed", "speed", value = 1, minValue = 0)
-        self.newInput("Quaternion", "Amplitude", "amplitude", value = [1, 0.3, 0.3, 0.3])
-        self.newInput("Integer", "Octaves", "octaves", value = 2)
-        self.newInput("Float", "Persistance", "persistance", value = 0.3)
-        self.newOutput("Quaternion", "Quaternion", "quaternion")
+    nodeSeed = IntProperty(update = propertyChanged)
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed", text = "Node Seed")
 
     def execute(self, seed, evolution, speed, amplitude, octaves, persistance):
+        if self.useList:
+            return self.executeList(seed, evolution, speed, amplitude, octaves, persistance)
         quaternion = Quaternion()
         quaternion[0] = amplitude[0]
         evolution = evolution * max(speed, 0) / 20 + 2541 * seed + 823 * self.nodeSeed
@@ -33,3 +33,10 @@ class QuaternionWiggleNode(bpy.types.Node, AnimationNode):
         evolution += 263
         quaternion[3] = perlinNoise(evolution, persistance, octaves) * amplitude[3]
         return quaternion
+
+    def executeList(self, seeds, evolution, speed, amplitude, octaves, persistance):
+        seeds = NumberArray.fromValue(seeds, "d").data
+        evolutions = evolution * max(speed, 0) / 20 + 2541 * seeds + 823 * self.nodeSeed
+        noise = wiggleVectorArray(evolutions, persistance, octaves)
+        noise *= numpy.array(amplitude[1:])
+        return [Quaternion((amplitude[0], x, y, z)) for x, y, z in noise.tolist()]
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... utils.layout import writeText
 from ... base_types.node import AnimationNode
+from ... execution.output_writes import iterWriteCodeLines
 
 class ShapeKeyOutputNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ShapeKeyOutputNode"
@@ -38,9 +39,9 @@ class ShapeKeyOutputNode(bpy.types.Node, AnimationNode):
         yield "if shapeKey is not None:"
 
         s = self.inputs
-        if s["Value"].isUsed:      yield "    shapeKey.value = value"
-        if s["Slider Min"].isUsed: yield "    shapeKey.slider_min = sliderMin"
-        if s["Slider Max"].isUsed: yield "    shapeKey.slider_max = sliderMax"
-        if s["Name"].isUsed:       yield "    shapeKey.name = name"
-        if s["Mute"].isUsed:       yield "    shapeKey.mute = mute"
+        if s["Value"].isUsed:      yield from iterWriteCodeLines("shapeKey", "value", "value", "    ")
+        if s["Slider Min"].isUsed: yield from iterWriteCodeLines("shapeKey", "slider_min", "sliderMin", "    ")
+        if s["Slider Max"].isUsed: yield from iterWriteCodeLines("shapeKey", "slider_max", "sliderMax", "    ")
+        if s["Name"].isUsed:       yield from iterWriteCodeLines("shapeKey", "name", "name", "    ")
+        if s["Mute"].isUsed:       yield from iterWriteCodeLines("shapeKey", "mute", "mute", "    ")
         yield "    pass"
@@ -1,12 +1,20 @@
 import bpy
 import os
+import zlib
+import tempfile
+import base64
+import itertools
+import numpy
 from bpy.props import *
 from ... utils.names import getRandomString
+from ... utils.handlers import eventHandler
 from ... tree_info import getNodeByIdentifier
 from ... base_types.node import AnimationNode
-from ... utils.blender_ui import getDpiFactor
+from ... utils.blender_ui import getDpiFactor, redrawAll
 from ... utils.path import getAbsolutePathOfSound
-from ... utils.fcurve import getSingleFCurveWithDataPath
+from ... preferences import getSoundCacheSettings
+from ... algorithms.sound.cache import SoundFile, AnalysisCache, analyseSoundFileCached
+from ... algorithms.sound.analysis_job import SoundAnalysisJob
 from ... utils.sequence_editor import getOrCreateSequencer, getEmptyChannel
 
 class SoundFrequencyRange(bpy.types.PropertyGroup):
@@ -151,11 +159,9 @@ class SoundBakeNode(bpy.types.Node, AnimationNode):
         sound, low, high, attack, release = self.sound, self.low, self.high, self.attack, self.release
         if getSingleDataItem(sound, low, high, attack, release): return
 
-        soundData = bake(sound, low, high, attack, release)
+        soundData = bakeFrequencyRanges(sound, [(low, high)], attack, release)[0]
         bakeDataItem = createSingleDataItem(sound, low, high, attack, release)
-        addSavedSample = bakeDataItem.samples.add
-        for data in soundData:
-            addSavedSample().strength = data
+        bakeDataItem.setSamples(soundData)
 
     def bakeEqualizerData(self):
         bpy.ops.an.bake_sound_equalizer_data("INVOKE_DEFAULT",
@@ -250,50 +256,58 @@ class BakeEqualizerData(bpy.types.Operator):
             self.report({"INFO"}, "There has to be at least one frequency range")
             return {"FINISHED"}
 
-        try: self.node = getNodeByIdentifier(self.nodeIdentifier)
-        except: self.node = None
-        self.sound = bpy.data.sounds[self.soundName]
-        self.currentIndex = 0
-        self.equalizerData = []
-        self.counter = 0
+        # Blender data is only accessed here and when the result is committed,
+        # the analysis itself runs in a background thread
+        self.job = SoundAnalysisJob(getSoundFile(bpy.data.sounds[self.soundName]),
+            [(item.low, item.high) for item in self.frequencyRanges],
+            self.attack, self.release, getFrameRate(context.scene), getSoundAnalysisCache())
+        self.job.start()
+
         context.window_manager.modal_handler_add(self)
-        self.timer = context.window_manager.event_timer_add(0.001, context.window)
-        self.setNodeMessage("Baking Started")
+        self.timer = context.window_manager.event_timer_add(0.1, context.window)
+        self.setNodeMessage("Baking (ESC to cancel)")
         return {"RUNNING_MODAL"}
 
+    def modal(self, context, event):
+        if event.type == "ESC" and not self.job.isCancelled:
+            self.job.cancel()
+            self.setNodeMessage("Cancelling")
+        if event.type != "TIMER":
+            return {"PASS_THROUGH"}
+
+        if self.job.isFinished:
+            self.commitResult()
+            return self.finish()
+
+        if self.job.progress > 0 and not self.job.isCancelled:
+            self.setNodeMessage("Baking {}% (ESC to cancel)".format(int(self.job.progress * 100)))
+        return {"PASS_THROUGH"}
+
+    def commitResult(self):
+        if self.job.error is not None:
+            self.report({"ERROR"}, "Baking failed: {}".format(self.job.error))
+            return
+        sound = bpy.data.sounds.get(self.soundName)
+        if self.job.result is None or sound is None: return
+
+        equalizerItem = sound.equalizerData.add()
+        equalizerItem.attack = self.attack
+        equalizerItem.release = self.release
+        equalizerItem.frequencyAmount = len(self.frequencyRanges)
+        equalizerItem.identifier = getRandomString(10)
+        equalizerItem.setSamples(self.job.result.T)
+
     def finish(self):
         bpy.context.window_manager.event_timer_remove(self.timer)
         self.setNodeMessage("")
         return {"FINISHED"}
 
-    def modal(self, context, event):
-        if "ESC" == event.type: return self.finish()
-        self.counter += 1
-        if self.counter % 20 != 0: return {"RUNNING_MODAL"}
-
-        if self.currentIndex < len(self.frequencyRanges):
-            item = self.frequencyRanges[self.currentIndex]
-            data = bake(self.sound, item.low, item.high, self.attack, self.release)
-            self.equalizerData.append(data)
-            self.currentIndex += 1
-            self.setNodeMessage("Frequency range {}-{} baked".format(item.low, item.high))
-        else:
-            equalizerItem = self.sound.equalizerData.add()
-            equalizerItem.attack = self.attack
-            equalizerItem.release = self.release
-            equalizerItem.frequencyAmount = len(self.frequencyRanges)
-            equalizerItem.identifier = getRandomString(10)
-            for equalizerSampleData in zip(*self.equalizerData):
-                equalizerSampleItem = equalizerItem.samples.add()
-                for sample in equalizerSampleData:
-                    equalizerSampleItem.samples.add().strength = sample
-            return self.finish()
-
-        context.area.tag_redraw()
-        return {"RUNNING_MODAL"}
-
     def setNodeMessage(self, message):
-        if self.node: self.node.bakeProgress = message
+        # the node can be removed while baking
+        try: node = getNodeByIdentifier(self.nodeIdentifier)
+        except: return
+        node.bakeProgress = message
+        redrawAll()
 
 
 # Sound Baking
@@ -301,55 +315,29 @@ class BakeEqualizerData(bpy.types.Operator):
 
 def bake(sound, low = 0.0, high = 100000, attack = 0.005, release = 0.2):
     '''Returns a float list containing the sampled data'''
-    object = createObjectWithFCurveAsTarget()
-    oldFrame = setCurrentFrame(0)
-    oldArea = switchArea("GRAPH_EDITOR")
-    usedUnpacking, filepath = getRealFilePath(sound)
-
-    bpy.ops.graph.sound_bake(
-        filepath = filepath,
-        low = low,
-        high = high,
-        attack = attack,
-        release = release)
-
-    if usedUnpacking: os.remove(filepath)
-    soundData = getSamplesFromFCurve(object)
-    removeObject(object)
-    setCurrentFrame(oldFrame)
-    switchArea(oldArea)
-    return soundData
-
-def createObjectWithFCurveAsTarget():
-    bpy.ops.object.add()
-    object = bpy.context.active_object
-    object.keyframe_insert(frame = 0, data_path = "location", index = 0)
-    return object
-
-def removeObject(object):
-    bpy.context.scene.objects.unlink(object)
-    bpy.data.objects.remove(object)
-
-def setCurrentFrame(frame):
-    oldFrame = bpy.context.scene.frame_current
-    bpy.context.scene.frame_current = frame
-    return oldFrame
-
-def switchArea(targetType):
-    area = bpy.context.area
-    oldType = area.type
-    area.type = targetType
-    return oldType
-
-def getRealFilePath(sound):
+    return bakeFrequencyRanges(sound, [(low, high)], attack, release)[0].tolist()
+
+def bakeFrequencyRanges(sound, frequencyRanges, attack, release):
+    '''(len(frequencyRanges), frameAmount) array, the first value belongs to frame 0'''
+    return analyseSoundFileCached(getSoundFile(sound), frequencyRanges, attack, release,
+        getFrameRate(bpy.context.scene), getSoundAnalysisCache())
+
+def getSoundFile(sound):
     filepath = getAbsolutePathOfSound(sound)
-    if os.path.exists(filepath): return False, filepath
+    if os.path.exists(filepath): return SoundFile(filepath)
     if not sound.packed_file: raise Exception("Sound file not found")
-    path = os.path.join(os.path.dirname(__file__), "TEMPORARY SOUND FILE")
-    file = open(path, "w+b")
-    file.write(sound.packed_file.data)
-    file.close()
-    return True, path
+    return SoundFile(filepath, packedData = bytes(sound.packed_file.data))
+
+def getSoundAnalysisCache():
+    settings = getSoundCacheSettings()
+    if settings.directory == "":
+        directory = os.path.join(tempfile.gettempdir(), "animation_nodes_sound_cache")
+    else:
+        directory = bpy.path.abspath(settings.directory)
+    return AnalysisCache(directory, settings.maxSize * 2**20)
+
+def getFrameRate(scene):
+    return scene.render.fps / scene.render.fps_base
 
 def createSingleDataItem(sound, low, high, attack, release):
     item = sound.singleData.add()
@@ -360,10 +348,6 @@ def createSingleDataItem(sound, low, high, attack, release):
     item.identifier = getRandomString(10)
     return item
 
-def getSamplesFromFCurve(object):
-    fcurve = getSingleFCurveWithDataPath(object, "location")
-    return [sample.co.y for sample in fcurve.sampled_points]
-
 
 
 # Bake Equalizer Data
@@ -435,6 +419,69 @@ def getSingleDataItem(sound, low, high, attack, release):
 
 
 
+# Packed Samples
+################################
+# Baked samples are stored as compressed float32 data in a string property.
+# Creating one property group per sample made baking, saving and loading slow.
+# Reading the string copies it, so the decoded arrays are cached.
+
+unpackedSamplesCache = {}
+
+def packSamples(samples):
+    data = numpy.ascontiguousarray(samples, dtype = "<f4").tobytes()
+    return base64.b64encode(zlib.compress(data)).decode("ascii")
+
+def unpackSamples(text):
+    if text == "": return numpy.zeros(0, dtype = "f")
+    return numpy.frombuffer(zlib.decompress(base64.b64decode(text)), dtype = "<f4")
+
+def setPackedSamples(item, samples):
+    samples = numpy.array(samples, dtype = "f", order = "C").ravel()
+    item.packedSamples = packSamples(samples)
+    cacheUnpackedSamples(item, samples)
+
+def getUnpackedSamples(item):
+    samples = unpackedSamplesCache.get(getCacheKey(item))
+    if samples is None:
+        if item.packedSamples == "" and len(item.samples) > 0:
+            samples = numpy.array(item.getLegacySamples(), dtype = "f").ravel()
+        else:
+            samples = unpackSamples(item.packedSamples)
+        samples = cacheUnpackedSamples(item, samples)
+    return samples
+
+def cacheUnpackedSamples(item, samples):
+    samples.flags.writeable = False
+    key = getCacheKey(item)
+    if key is not None:
+        unpackedSamplesCache[key] = samples
+    return samples
+
+def getCacheKey(item):
+    if item.identifier != "":
+        return item.identifier
+    sound = item.id_data
+    # linked sounds can't get an identifier
+    if sound.library is not None:
+        return (sound.library.filepath, sound.name, item.path_from_id())
+    return None
+
+@eventHandler("FILE_LOAD_POST")
+def packLegacySamples():
+    unpackedSamplesCache.clear()
+    for sound in bpy.data.sounds:
+        for item in itertools.chain(sound.singleData, sound.equalizerData):
+            if len(item.samples) > 0:
+                if sound.library is not None:
+                    # data from libraries is read-only, so it is only converted in memory
+                    getUnpackedSamples(item)
+                    continue
+                if item.identifier == "": item.identifier = getRandomString(10)
+                item.setSamples(item.getLegacySamples())
+                item.samples.clear()
+
+
+
 # Register
 ################################
 
@@ -452,17 +499,43 @@ class SingleData(bpy.types.PropertyGroup):
     high = IntProperty(name = "High")
     attack = FloatProperty(name = "Attack", precision = 3)
     release = FloatProperty(name = "Release", precision = 3)
-    samples = CollectionProperty(name = "Samples", type = SingleFrequencySample)
+    packedSamples = StringProperty(name = "Packed Samples", default = "")
     identifier = StringProperty(name = "Identifier", default = "")
 
+    # only used to load files that have been baked with older versions
+    samples = CollectionProperty(name = "Samples", type = SingleFrequencySample)
+
+    def setSamples(self, samples):
+        setPackedSamples(self, samples)
+
+    def getSamples(self):
+        '''Read-only float32 array with one strength per frame'''
+        return getUnpackedSamples(self)
+
+    def getLegacySamples(self):
+        return [sample.strength for sample in self.samples]
+
 class EqualizerData(bpy.types.PropertyGroup):
     bl_idname = "an_SoundEqualizerData"
     attack = FloatProperty(name = "Attack", precision = 3)
     release = FloatProperty(name = "Release", precision = 3)
     frequencyAmount = IntProperty(name = "Frequency Amount")
-    samples = CollectionProperty(name = "Samples", type = MultipleFrequenciesSample)
+    packedSamples = StringProperty(name = "Packed Samples", default = "")
     identifier = StringProperty(name = "Identifier", default = "")
 
+    # only used to load files that have been baked with older versions
+    samples = CollectionProperty(name = "Samples", type = MultipleFrequenciesSample)
+
+    def setSamples(self, samples):
+        setPackedSamples(self, samples)
+
+    def getSamples(self):
+        '''Read-only (frameAmount, frequencyAmount) float32 array'''
+        return getUnpackedSamples(self).reshape(-1, max(self.frequencyAmount, 1))
+
+    def getLegacySamples(self):
+        return [[sample.strength for sample in frameItem.samples] for frameItem in self.samples]
+
 def register():
     bpy.types.Sound.singleData = CollectionProperty(name = "Bake Data", type = SingleData)
     bpy.types.Sound.equalizerData = CollectionProperty(name = "Equalizer Data", type = EqualizerData)
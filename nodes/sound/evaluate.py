@@ -1,7 +1,10 @@
 import bpy
+import numpy
 from bpy.props import *
 from ... events import propertyChanged
+from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.number_array import NumberArray
 
 frameTypes = [
     ("OFFSET", "Offset", ""),
@@ -17,12 +20,14 @@ class EvaluateSoundNode(bpy.types.Node, AnimationNode):
     bl_width_default = 185
 
     def frameTypeChanged(self, context):
-        self.inputs["Frame"].hide = False
+        self.inputs[1].hide = False
         propertyChanged()
 
     def soundTypeChanged(self, context):
-        self.outputs["Strength"].hide = self.soundType != "SINGLE"
-        self.outputs["Strengths"].hide = self.soundType != "EQUALIZER"
+        self.updateSocketVisibility()
+
+    def useListChanged(self, context):
+        self.generateSockets()
 
     frameType = EnumProperty(
         name = "Frame Type", default = "OFFSET",
@@ -33,23 +38,65 @@ class EvaluateSoundNode(bpy.types.Node, AnimationNode):
         description = "Changing this has only impact on the UI",
         items = soundTypeItems, update = soundTypeChanged)
 
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Evaluate the sound for every frame in a list",
+        update = useListChanged)
+
     def create(self):
-        self.newInput("Sound", "Sound", "sound")
-        self.newInput("Float", "Frame", "frame", hide = True)
-        self.newOutput("Float", "Strength", "strength")
-        self.newOutput("Float List", "Strengths", "strengths", hide = True)
+        self.generateSockets()
 
     def draw(self, layout):
         layout.prop(self, "soundType", text = "Type")
         layout.prop(self, "frameType", text = "Frame")
 
     def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
         layout.prop(bpy.context.scene, "sync_mode")
 
-    def execute(self, sound, frame):
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        self.newInput("Sound", "Sound", "sound")
+        if self.useList:
+            self.newInput("Float List", "Frames", "frames")
+            self.newInput("Integer", "Frequency Index", "frequencyIndex")
+            self.newOutput("Float List", "Strengths", "strengths")
+        else:
+            self.newInput("Float", "Frame", "frame", hide = True)
+            self.newOutput("Float", "Strength", "strength")
+            self.newOutput("Float List", "Strengths", "strengths", hide = True)
+        self.updateSocketVisibility()
+
+    def updateSocketVisibility(self):
+        if self.useList:
+            self.inputs["Frequency Index"].hide = self.soundType != "EQUALIZER"
+        else:
+            self.outputs["Strength"].hide = self.soundType != "SINGLE"
+            self.outputs["Strengths"].hide = self.soundType != "EQUALIZER"
+
+    def getExecutionCode(self):
+        if self.useList:
+            return "strengths = self.evaluateList(sound, frames, frequencyIndex)"
+        return "strength, strengths = self.evaluateFrame(sound, frame)"
+
+    def evaluateFrame(self, sound, frame):
         if sound is None: return 0, []
         if self.frameType == "OFFSET":
             frame += self.nodeTree.scene.frame_current_final
         strength = sound.evaluate(frame) if sound.type == "SINGLE" else 0
         strengths = sound.evaluate(frame) if sound.type == "EQUALIZER" else []
         return strength, strengths
+
+    def evaluateList(self, sound, frames, frequencyIndex):
+        frames = NumberArray.fromValue(frames, "d").data
+        if sound is None: return NumberArray(numpy.zeros(len(frames)))
+        if self.frameType == "OFFSET":
+            frames = frames + self.nodeTree.scene.frame_current_final
+
+        if sound.type == "SINGLE":
+            return NumberArray(sound.evaluateMany(frames))
+        strengths = sound.evaluateMany(frames)
+        if strengths.shape[1] == 0: return NumberArray(numpy.zeros(len(frames)))
+        index = min(max(frequencyIndex, 0), strengths.shape[1] - 1)
+        return NumberArray(strengths[:, index].copy())
@@ -1,4 +1,5 @@
 import bpy
+import numpy
 from bpy.props import *
 from ... utils.layout import writeText
 from ... base_types.node import AnimationNode
@@ -39,52 +40,86 @@ class SingleSoundEvaluator:
     type = "SINGLE"
 
     def __init__(self, sequences, index):
-        self.sequenceData = [(sequence, sequence.sound.singleData[index]) for sequence in sequences if getattr(sequence, "type", "") == "SOUND"]
+        self.sequenceData = [SequenceSamples(sequence, sequence.sound.singleData[index].getSamples())
+                             for sequence in sequences if getattr(sequence, "type", "") == "SOUND"]
 
     def evaluate(self, frame):
         intFrame = int(frame)
-        if intFrame == frame:
-            return self.evaluateInt(intFrame)
-        else:
-            before = self.evaluateInt(intFrame)
-            after = self.evaluateInt(intFrame + 1)
-            influence = frame - intFrame
-            return before * (1 - influence) + after * influence
+        before = self.evaluateInt(intFrame)
+        if intFrame == frame: return before
+        after = self.evaluateInt(intFrame + 1)
+        influence = frame - intFrame
+        return before * (1 - influence) + after * influence
 
+    # a single frame is faster without creating arrays
     def evaluateInt(self, frame):
-        evaluate = self.evaluateSequence
-        return sum([evaluate(sequence, data, frame) for sequence, data in self.sequenceData])
+        strength = 0.0
+        for data in self.sequenceData:
+            if data.firstFrame <= frame < data.endFrame:
+                strength += data.samples[frame - data.frameStart].item()
+        return strength
 
-    def evaluateSequence(self, sequence, data, frame):
-        if useSequenceForFrame(sequence, data, frame):
-            return data.samples[frame - sequence.frame_start].strength
-        return 0
+    def evaluateMany(self, frames):
+        '''Summed strength of all sequences for every frame'''
+        return evaluateSequenceSamples(self.sequenceData, frames, ())
 
 class EqualizerSoundEvaluator:
     type = "EQUALIZER"
 
     def __init__(self, sequences, index):
-        self.sequenceData = [(sequence, sequence.sound.equalizerData[index]) for sequence in sequences if getattr(sequence, "type", "") == "SOUND"]
+        self.sequenceData = [SequenceSamples(sequence, sequence.sound.equalizerData[index].getSamples())
+                             for sequence in sequences if getattr(sequence, "type", "") == "SOUND"]
+        # only the frequencies that all sequences have are used
+        self.frequencyAmount = min([data.samples.shape[1] for data in self.sequenceData], default = 0)
 
     def evaluate(self, frame):
         intFrame = int(frame)
-        if intFrame == frame:
-            return self.evaluateInt(intFrame)
-        else:
-            before = self.evaluateInt(intFrame)
-            after = self.evaluateInt(intFrame + 1)
-            influence = frame - intFrame
-            return [a * (1 - influence) + b * influence for a, b in zip(before, after)]
+        before = self.evaluateInt(intFrame)
+        if intFrame == frame: return before
+        after = self.evaluateInt(intFrame + 1)
+        influence = frame - intFrame
+        return [a * (1 - influence) + b * influence for a, b in zip(before, after)]
 
     def evaluateInt(self, frame):
-        evaluate = self.evaluateSequence
-        strengths = [evaluate(sequence, data, frame) for sequence, data in self.sequenceData]
-        return [sum(s) for s in zip(*strengths)]
-
-    def evaluateSequence(self, sequence, data, frame):
-        if useSequenceForFrame(sequence, data, frame):
-            return [sample.strength for sample in data.samples[frame - sequence.frame_start].samples]
-        return [0.0] * data.frequencyAmount
-
-def useSequenceForFrame(sequence, data, frame):
-    return sequence.frame_final_start <= frame < min(sequence.frame_start + len(data.samples), sequence.frame_final_end)
+        amount = self.frequencyAmount
+        strengths = [0.0] * amount
+        for data in self.sequenceData:
+            if data.firstFrame <= frame < data.endFrame:
+                samples = data.samples[frame - data.frameStart, :amount].tolist()
+                strengths = [a + b for a, b in zip(strengths, samples)]
+        return strengths
+
+    def evaluateMany(self, frames):
+        '''(len(frames), frequencyAmount) array with the summed strengths of all sequences'''
+        return evaluateSequenceSamples(self.sequenceData, frames, (self.frequencyAmount, ))
+
+
+class SequenceSamples:
+    '''Baked samples of a sequence together with the frames in which they are used'''
+
+    def __init__(self, sequence, samples):
+        self.samples = samples
+        self.frameStart = sequence.frame_start
+        self.firstFrame = sequence.frame_final_start
+        self.endFrame = min(sequence.frame_start + len(samples), sequence.frame_final_end)
+
+def evaluateSequenceSamples(sequenceData, frames, valueShape):
+    frames = numpy.asarray(frames, dtype = "d").reshape(-1)
+    # same rounding as int(frame)
+    intFrames = numpy.trunc(frames)
+    influences = (frames - intFrames).reshape((-1, ) + (1, ) * len(valueShape))
+    intFrames = intFrames.astype("int64")
+
+    before = sumSamplesAtFrames(sequenceData, intFrames, valueShape)
+    if not influences.any(): return before
+    after = sumSamplesAtFrames(sequenceData, intFrames + 1, valueShape)
+    return before * (1 - influences) + after * influences
+
+def sumSamplesAtFrames(sequenceData, frames, valueShape):
+    result = numpy.zeros((len(frames), ) + valueShape)
+    for data in sequenceData:
+        isUsed = (frames >= data.firstFrame) & (frames < data.endFrame)
+        samples = data.samples[frames[isUsed] - data.frameStart]
+        if len(valueShape) > 0: samples = samples[:, :valueShape[0]]
+        result[isUsed] += samples
+    return result
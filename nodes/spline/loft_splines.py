@@ -2,7 +2,9 @@ import bpy
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
 from ... algorithms.mesh_generation.from_splines import loftSplines
+from ... algorithms.mesh_generation.indices_utils import indexArrayToTuples
 
 interpolationTypeItems = [
     ("LINEAR", "Linear", ""),
@@ -83,5 +85,5 @@ class LoftSplinesNode(bpy.types.Node, AnimationNode):
                                              surfaceDistributionType = self.surfaceDistributionType,
                                              startSurfaceParameter = start,
                                              endSurfaceParameter = end)
-            return vertices, polygons
+            return VectorArray(vertices), indexArrayToTuples(polygons)
         else: return [], []
@@ -1,33 +1,63 @@
 import bpy
+import numpy
 from bpy.props import *
 from mathutils import Vector
 from ... events import propertyChanged
+from ... tree_info import keepNodeState
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
+from ... data_structures.number_array import NumberArray
 
 class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_ProjectOnSplineNode"
     bl_label = "Project on Spline"
 
     def settingChanged(self, context):
-        self.outputs["Parameter"].hide = self.extended
+        self.outputs[2].hide = self.extended
         propertyChanged()
 
+    def useListChanged(self, context):
+        self.generateSockets()
+
     extended = BoolProperty(
         name = "Extended Spline",
         description = "Project point on extended spline. If this is turned on the parameter is not computable.",
         update = settingChanged)
 
+    useList = BoolProperty(name = "Use List", default = False,
+        description = "Project every location in a list",
+        update = useListChanged)
+
     def create(self):
-        self.newInput("Spline", "Spline", "spline", defaultDrawType = "PROPERTY_ONLY")
-        self.newInput("Vector", "Location", "location")
-        self.newOutput("Vector", "Position", "position")
-        self.newOutput("Vector", "Tangent", "tangent")
-        self.newOutput("Float", "Parameter", "parameter")
+        self.generateSockets()
 
     def draw(self, layout):
         layout.prop(self, "extended", text = "Extended")
 
+    def drawAdvanced(self, layout):
+        layout.prop(self, "useList")
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+        self.newInput("Spline", "Spline", "spline", defaultDrawType = "PROPERTY_ONLY")
+        if self.useList:
+            self.newInput("Vector List", "Locations", "locations")
+            self.newOutput("Vector List", "Positions", "positions")
+            self.newOutput("Vector List", "Tangents", "tangents")
+            self.newOutput("Float List", "Parameters", "parameters")
+        else:
+            self.newInput("Vector", "Location", "location")
+            self.newOutput("Vector", "Position", "position")
+            self.newOutput("Vector", "Tangent", "tangent")
+            self.newOutput("Float", "Parameter", "parameter")
+        self.outputs[2].hide = self.extended
+
     def execute(self, spline, location):
+        if self.useList:
+            return self.executeList(spline, location)
+
         spline.update()
         if spline.isEvaluable:
             if self.extended:
@@ -40,3 +70,20 @@ class ProjectOnSplineNode(bpy.types.Node, AnimationNode):
             return position, tangent, parameter
         else:
             return Vector((0, 0, 0)), Vector((0, 0, 0)), 0.0
+
+    def executeList(self, spline, locations):
+        spline.update()
+        if not spline.isEvaluable:
+            amount = len(locations)
+            return VectorArray(numpy.zeros((amount, 3))), VectorArray(numpy.zeros((amount, 3))), NumberArray(numpy.zeros(amount))
+
+        if self.extended:
+            projections = [spline.projectExtended(location) for location in locations]
+            positions = VectorArray.fromElements([position for position, _ in projections], "d")
+            tangents = VectorArray.fromElements([tangent for _, tangent in projections], "d")
+            return positions, tangents, NumberArray(numpy.zeros(len(projections)))
+
+        parameters = spline.projectArray(locations)
+        positions = VectorArray(spline.evaluateArray(parameters))
+        tangents = VectorArray(spline.evaluateTangentArray(parameters))
+        return positions, tangents, NumberArray(parameters)
@@ -2,7 +2,9 @@ import bpy
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
 from ... algorithms.mesh_generation.from_splines import revolveProfileAroundAxis
+from ... algorithms.mesh_generation.indices_utils import indexArrayToTuples
 
 projectionTypeItems = [
     ("PARAMETER", "Same Parameter", ""),
@@ -40,5 +42,5 @@ class RevolveSplineNode(bpy.types.Node, AnimationNode):
 
         if canExecute():
             vertices, polygons = revolveProfileAroundAxis(axis, profile, splineSamples, surfaceSamples, self.projectionType)
-            return vertices, polygons
+            return VectorArray(vertices), indexArrayToTuples(polygons)
         else: return [], []
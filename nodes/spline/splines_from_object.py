@@ -4,7 +4,8 @@ from ... tree_info import keepNodeState
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
 from ... data_structures.splines.bezier_spline import BezierSpline
-from ... data_structures.splines.from_blender import createSplinesFromBlenderObject, createSplineFromBlenderSpline
+from ... data_structures.splines.from_blender import (getCachedSplinesFromBlenderObject,
+                                                      getCachedSplineFromBlenderObject)
 
 importTypeItems = [
     ("SINGLE", "Single", "Only load one spline from the object", "", 0),
@@ -56,9 +57,7 @@ class SplinesFromObjectNode(bpy.types.Node, AnimationNode):
         if 0 <= index < len(bSplines):
             bSpline = bSplines[index]
             if bSpline.type in ("POLY", "BEZIER"):
-                spline = createSplineFromBlenderSpline(bSpline)
-                if self.useWorldSpace: spline.transform(object.matrix_world)
-                return spline
+                return getCachedSplineFromBlenderObject(object, index, self.useWorldSpace)
             else:
                 self.errorMessage = "Spline type not supported: " + bSpline.type
                 return BezierSpline()
@@ -67,11 +66,7 @@ class SplinesFromObjectNode(bpy.types.Node, AnimationNode):
             return BezierSpline()
 
     def getAllSplines(self, object):
-        splines = createSplinesFromBlenderObject(object)
-        if self.useWorldSpace:
-            for spline in splines:
-                spline.transform(object.matrix_world)
-        return splines
+        return getCachedSplinesFromBlenderObject(object, self.useWorldSpace)
 
     @keepNodeState
     def recreateSockets(self):
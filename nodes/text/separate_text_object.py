@@ -5,6 +5,7 @@ from mathutils import Vector, Matrix
 from ... id_keys import setIDKeyData
 from ... base_types.node import AnimationNode
 from ... utils.blender_ui import executeInAreaType
+from ... utils.id_reference import findObjectByName, invalidateObjectNameIndex
 from ... nodes.container_provider import getMainObjectContainer
 
 idPropertyName = "text separation node id"
@@ -125,7 +126,7 @@ class SeparateTextObjectNode(bpy.types.Node, AnimationNode):
         return getattr(object, '["'+idPropertyName+'"]', -1) == self.currentID
 
     def getSourceObject(self):
-        source = bpy.data.objects.get(self.sourceObjectName)
+        source = findObjectByName(self.sourceObjectName)
         if getattr(source, "type", "") == "FONT": return source
         return None
 
@@ -197,6 +198,7 @@ def removeCurve(curve):
     curveData = curve.data
     bpy.context.scene.objects.unlink(curve)
     bpy.data.objects.remove(curve)
+    invalidateObjectNameIndex()
     bpy.data.curves.remove(curveData)
 
 @executeInAreaType("VIEW_3D")
@@ -213,6 +215,7 @@ def removeObject(object):
     objectType = object.type
     data = object.data
     bpy.data.objects.remove(object)
+    invalidateObjectNameIndex()
     if objectType == "FONT":
         bpy.data.curves.remove(data)
     elif objectType == "MESH":
@@ -3,8 +3,9 @@ import random
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
+from .. number.legacy_random_base import LegacyRandomBase
 
-class RandomVectorNode(bpy.types.Node, AnimationNode):
+class RandomVectorNode(bpy.types.Node, LegacyRandomBase, AnimationNode):
     bl_idname = "an_RandomVectorNode"
     bl_label = "Random Vector"
 
@@ -14,15 +15,22 @@ class RandomVectorNode(bpy.types.Node, AnimationNode):
         self.newInput("Integer", "Seed", "seed")
         self.newInput("Float", "Scale", "scale", value = 2.0)
         self.newOutput("Vector", "Vector", "randomVector")
+        self.disableLegacyRandom()
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed")
 
     def getExecutionCode(self):
-        yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
-        yield ("randomVector = scale * Vector((random_number_cache[startSeed]     - 0.5, "
-                                              "random_number_cache[startSeed + 1] - 0.5, "
-                                              "random_number_cache[startSeed + 2] - 0.5))")
+        if self.legacyRandom:
+            yield "startSeed = (seed + self.nodeSeed * 1000) % (len(random_number_cache) - 3)"
+            yield ("randomVector = scale * Vector((random_number_cache[startSeed]     - 0.5, "
+                                                  "random_number_cache[startSeed + 1] - 0.5, "
+                                                  "random_number_cache[startSeed + 2] - 0.5))")
+        else:
+            yield "startIndex = self.nodeSeed * 3"
+            yield ("randomVector = scale * Vector((random_number(seed, startIndex)     - 0.5, "
+                                                  "random_number(seed, startIndex + 1) - 0.5, "
+                                                  "random_number(seed, startIndex + 2) - 0.5))")
 
     def duplicate(self, sourceNode):
         self.nodeSeed = int(random.random() * 100)
@@ -1,5 +1,6 @@
 import bpy
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
 
 class TransformVectorListNode(bpy.types.Node, AnimationNode):
     bl_idname = "an_TransformVectorListNode"
@@ -10,5 +11,5 @@ class TransformVectorListNode(bpy.types.Node, AnimationNode):
         self.newInput("Matrix", "Matrix", "matrix")
         self.newOutput("Vector List", "Vectors List", "transformedVectors")
 
-    def getExecutionCode(self):
-        return "transformedVectors = [matrix * vector for vector in vectors]"
+    def execute(self, vectors, matrix):
+        return VectorArray.fromValue(vectors).transform(matrix)
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from ... events import executionCodeChanged
 from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
 
 operationItems = [
     ("ADD", "Add", "", "", 0),
@@ -22,10 +23,11 @@ class VectorListMathNode(bpy.types.Node, AnimationNode):
         layout.prop(self, "operation", text = "")
 
     def getExecutionCode(self):
-        if self.operation in ("ADD", "AVERAGE"):
-            yield "result = functools.reduce(operator.add, vectors, Vector((0, 0, 0)))"
-        if self.operation == "AVERAGE":
-            yield "if len(vectors) > 0: result /= len(vectors)"
+        if self.operation == "ADD": return "result = self.execute_Add(vectors)"
+        if self.operation == "AVERAGE": return "result = self.execute_Average(vectors)"
 
-    def getUsedModules(self):
-        return ["operator", "functools"]
+    def execute_Add(self, vectors):
+        return VectorArray.fromValue(vectors).sum()
+
+    def execute_Average(self, vectors):
+        return VectorArray.fromValue(vectors).average()
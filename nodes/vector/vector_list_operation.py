@@ -0,0 +1,98 @@
+import bpy
+from bpy.props import *
+from ... tree_info import keepNodeState
+from ... base_types.node import AnimationNode
+from ... data_structures.vector_array import VectorArray
+from ... data_structures.number_array import NumberArray
+
+operationItems = [
+    ("OFFSET", "Offset", "Add the same vector to every vector", "", 0),
+    ("NORMALIZE", "Normalize", "Scale every vector to a specific length", "", 1),
+    ("LENGTH", "Length", "Calculate the length of every vector", "", 2),
+    ("DOT", "Dot Product", "Calculate the dot product of every vector with B", "", 3),
+    ("CROSS", "Cross Product", "Calculate the cross product of every vector with B", "", 4) ]
+
+operationLabels = {
+    "OFFSET" : "A + Offset",
+    "NORMALIZE" : "normalize A",
+    "LENGTH" : "length A",
+    "DOT" : "A . B",
+    "CROSS" : "A x B" }
+
+operationsWithSecondVector = ["DOT", "CROSS"]
+operationsWithFloatListOutput = ["LENGTH", "DOT"]
+
+class VectorListOperationNode(bpy.types.Node, AnimationNode):
+    bl_idname = "an_VectorListOperationNode"
+    bl_label = "Vector List Operation"
+    dynamicLabelType = "HIDDEN_ONLY"
+
+    def settingChanged(self, context):
+        self.generateSockets()
+
+    operation = EnumProperty(name = "Operation", items = operationItems,
+        default = "OFFSET", update = settingChanged)
+
+    useListForB = BoolProperty(name = "Use List for B", default = False,
+        description = "Use a different B vector for every vector in A",
+        update = settingChanged)
+
+    def create(self):
+        self.generateSockets()
+
+    def draw(self, layout):
+        layout.prop(self, "operation", text = "")
+        if self.operation in operationsWithSecondVector:
+            layout.prop(self, "useListForB")
+
+    def drawLabel(self):
+        return operationLabels[self.operation]
+
+    @keepNodeState
+    def generateSockets(self):
+        self.inputs.clear()
+        self.outputs.clear()
+
+        self.newInput("Vector List", "A", "a")
+        if self.operation == "OFFSET":
+            self.newInput("Vector", "Offset", "offset")
+        elif self.operation == "NORMALIZE":
+            self.newInput("Float", "Length", "length", value = 1.0)
+        elif self.operation in operationsWithSecondVector:
+            if self.useListForB: self.newInput("Vector List", "B", "b")
+            else: self.newInput("Vector", "B", "b")
+
+        if self.operation in operationsWithFloatListOutput:
+            self.newOutput("Float List", "Result", "result")
+        else:
+            self.newOutput("Vector List", "Result", "result")
+
+    def getExecutionCode(self):
+        op = self.operation
+        if op == "OFFSET": return "result = self.toVectorArray(a).offset(offset)"
+        if op == "NORMALIZE": return "result = self.toVectorArray(a).normalized(length)"
+        if op == "LENGTH": return "result = self.execute_Length(a)"
+        if op == "DOT": return "result = self.execute_Dot(a, b)"
+        if op == "CROSS": return "result = self.execute_Cross(a, b)"
+
+    def execute_Length(self, a):
+        return NumberArray(self.toVectorArray(a).lengths())
+
+    def execute_Dot(self, a, b):
+        a, b = self.prepareVectors(a, b)
+        return NumberArray(a.dot(b))
+
+    def execute_Cross(self, a, b):
+        a, b = self.prepareVectors(a, b)
+        return a.cross(b)
+
+    def prepareVectors(self, a, b):
+        a = VectorArray.fromValue(a)
+        if self.useListForB:
+            b = VectorArray.fromValue(b)
+            amount = min(len(a), len(b))
+            return a[:amount], b[:amount]
+        return a, b
+
+    def toVectorArray(self, vectors):
+        return VectorArray.fromValue(vectors)
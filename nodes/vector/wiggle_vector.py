@@ -1,29 +1,30 @@
 import bpy
+import numpy
 from bpy.props import *
 from mathutils import Vector
 from ... events import propertyChanged
 from ... base_types.node import AnimationNode
-from ... algorithms.perlin_noise import perlinNoise
+from .. number.wiggle_base import WiggleNodeBase
+from ... data_structures.vector_array import VectorArray
+from ... data_structures.number_array import NumberArray
+from ... algorithms.perlin_noise import perlinNoise, wiggleVectorArray
 
-class VectorWiggleNode(bpy.types.Node, AnimationNode):
+class VectorWiggleNode(bpy.types.Node, WiggleNodeBase, AnimationNode):
     bl_idname = "an_VectorWiggleNode"
     bl_label = "Vector Wiggle"
 
-    nodeSeed = IntProperty(update = propertyChanged)
+    dataType = "Vector"
+    outputName = "Vector"
+    amplitudeDefault = [5, 5, 5]
 
-    def create(self):
-        self.newInput("Float", "Seed", "seed")
-        self.newInput("Float", "Evolution", "evolution")
-        self.newInput("Float", "Speed", "speed", value = 1, minValue = 0)
-        self.newInput("Vector", "Amplitude", "amplitude", value = [5, 5, 5])
-        self.newInput("Integer", "Octaves", "octaves", value = 2)
-        self.newInput("Float", "Persistance", "persistance", value = 0.3)
-        self.newOutput("Vector", "Vector", "vector")
+    nodeSeed = IntProperty(update = propertyChanged)
 
     def draw(self, layout):
         layout.prop(self, "nodeSeed", text = "Node Seed")
 
     def execute(self, seed, evolution, speed, amplitude, octaves, persistance):
+        if self.useList:
+            return self.executeList(seed, evolution, speed, amplitude, octaves, persistance)
         vector = Vector()
         evolution = evolution * max(speed, 0) / 20 + 2541 * seed + 823 * self.nodeSeed
         vector[0] = perlinNoise(evolution, persistance, octaves) * amplitude[0]
@@ -32,3 +33,9 @@ class VectorWiggleNode(bpy.types.Node, AnimationNode):
         evolution += 263
         vector[2] = perlinNoise(evolution, persistance, octaves) * amplitude[2]
         return vector
+
+    def executeList(self, seeds, evolution, speed, amplitude, octaves, persistance):
+        seeds = NumberArray.fromValue(seeds, "d").data
+        evolutions = evolution * max(speed, 0) / 20 + 2541 * seeds + 823 * self.nodeSeed
+        noise = wiggleVectorArray(evolutions, persistance, octaves)
+        return VectorArray(noise * numpy.array(amplitude))
@@ -99,6 +99,14 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         description = "Different execution codes can be useful in different contexts",
         update = settingChanged, items = executionCodeTypeItems)
 
+class SoundCacheProperties(bpy.types.PropertyGroup):
+
+    directory = StringProperty(name = "Directory", default = "", subtype = "DIR_PATH",
+        description = "Analysed sounds are stored here to make baking them again fast, the temporary directory is used when this is empty")
+
+    maxSize = IntProperty(name = "Max Size (MB)", default = 500, min = 0,
+        description = "Least recently used results are removed when the cache gets larger")
+
 class AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = addonName
 
@@ -106,11 +114,13 @@ class AddonPreferences(bpy.types.AddonPreferences):
         name = "Redraw All After Auto Execution", default = True)
 
     sceneUpdateAfterAutoExecution = BoolProperty(
-        name = "Scene Update After Auto Execution", default = True)
+        name = "Scene Update After Auto Execution", default = True,
+        description = "Update the scenes of the executed trees and the scenes that contain changed objects")
 
     nodeColors = PointerProperty(type = NodeColorProperties)
     developer = PointerProperty(type = DeveloperProperties)
     executionCode = PointerProperty(type = ExecutionCodeProperties)
+    soundCache = PointerProperty(type = SoundCacheProperties)
 
     def draw(self, context):
         layout = self.layout
@@ -133,6 +143,11 @@ class AddonPreferences(bpy.types.AddonPreferences):
         subcol.prop(self.nodeColors, "subprogramValue", slider = True)
         subcol.prop(self.nodeColors, "subprogramSaturation", slider = True)
 
+        col = layout.column(align = True)
+        col.label("Sound Cache:")
+        col.prop(self.soundCache, "directory")
+        col.prop(self.soundCache, "maxSize")
+
         layout.prop(self.developer, "debug")
 
 def getPreferences():
@@ -151,6 +166,9 @@ def getExecutionCodeType():
 def getColorSettings():
     return getPreferences().nodeColors
 
+def getSoundCacheSettings():
+    return getPreferences().soundCache
+
 def debuggingIsEnabled():
     return getPreferences().developer.debug
 
@@ -3,6 +3,7 @@ import sys
 from bpy.props import *
 from .. events import propertyChanged
 from .. base_types.socket import AnimationNodeSocket
+from .. data_structures.number_array import NumberArray
 
 def getValue(self):
     return min(max(self.minValue, self.get("value", 0)), self.maxValue)
@@ -96,6 +97,8 @@ class FloatListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, NumberArray):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, (float, int)) for element in value):
                 return value, 0
@@ -2,6 +2,7 @@ import bpy
 from bpy.props import *
 from .. events import propertyChanged
 from .. base_types.socket import AnimationNodeSocket
+from .. data_structures.number_array import NumberArray
 
 def getValue(self):
     return min(max(self.minValue, self.get("value", 0)), self.maxValue)
@@ -86,6 +87,9 @@ class IntegerListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, NumberArray):
+            if value.isInteger: return value, 0
+            return value.toIntegers(), 1
         if isinstance(value, list):
             if all(isinstance(element, int) for element in value):
                 return value, 0
@@ -1,6 +1,7 @@
 import bpy
 from mathutils import Matrix
 from .. base_types.socket import AnimationNodeSocket
+from .. data_structures.matrix_array import MatrixArray
 
 class MatrixSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_MatrixSocket"
@@ -48,10 +49,12 @@ class MatrixListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getCopyExpression(cls):
-        return "[element.copy() for element in value]"
+        return "value.copy() if isinstance(value, ColumnList) else [element.copy() for element in value]"
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, MatrixArray):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, Matrix) for element in value):
                 return value, 0
@@ -1,6 +1,6 @@
 import bpy
 from mathutils import Vector
-from .. data_structures.mesh import Polygon
+from .. data_structures.mesh import Polygon, PolygonList
 from .. base_types.socket import AnimationNodeSocket
 
 class PolygonSocket(bpy.types.NodeSocket, AnimationNodeSocket):
@@ -51,10 +51,12 @@ class PolygonListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getCopyExpression(cls):
-        return "[element.copy() for element in value]"
+        return "value.copy() if isinstance(value, ColumnList) else [element.copy() for element in value]"
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, PolygonList):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, Polygon) for element in value):
                 return value, 0
@@ -5,8 +5,8 @@ from .. base_types.socket import AnimationNodeSocket
 from .. utils.id_reference import tryToFindObjectReference
 from .. data_structures.splines.bezier_spline import BezierSpline
 from .. data_structures.splines.poly_spline import PolySpline
-from .. data_structures.splines.from_blender import (createSplinesFromBlenderObject,
-                                                     createSplineFromBlenderSpline)
+from .. data_structures.splines.from_blender import (getCachedSplinesFromBlenderObject,
+                                                     getCachedSplineFromBlenderObject)
 
 class SplineSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_SplineSocket"
@@ -37,19 +37,10 @@ class SplineSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     def getValue(self):
         object = self.getObject()
-        if getattr(object, "type", "") != "CURVE":
-            return BezierSpline()
-
-        bSplines = object.data.splines
-        if len(bSplines) > 0:
-            spline = createSplineFromBlenderSpline(bSplines[0])
-            # is None when the spline type is not supported
-            if spline is not None:
-                if self.useWorldSpace:
-                    spline.transform(object.matrix_world)
-                return spline
-
-        return BezierSpline()
+        spline = getCachedSplineFromBlenderObject(object, 0, self.useWorldSpace)
+        # is None when the spline type is not supported
+        if spline is None: return BezierSpline()
+        return spline
 
     def getObject(self):
         if self.objectName == "": return None
@@ -124,11 +115,7 @@ class SplineListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     def getValue(self):
         object = self.getObject()
-        splines = createSplinesFromBlenderObject(object)
-        if self.useWorldSpace:
-            for spline in splines:
-                spline.transform(object.matrix_world)
-        return splines
+        return getCachedSplinesFromBlenderObject(object, self.useWorldSpace)
 
     def getObject(self):
         if self.objectName == "": return None
@@ -3,6 +3,7 @@ from bpy.props import *
 from mathutils import Vector
 from .. events import propertyChanged
 from .. base_types.socket import AnimationNodeSocket
+from .. data_structures.vector_array import VectorArray
 
 class VectorSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_VectorSocket"
@@ -68,10 +69,12 @@ class VectorListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getCopyExpression(cls):
-        return "[element.copy() for element in value]"
+        return "value.copy() if isinstance(value, ColumnList) else [element.copy() for element in value]"
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, VectorArray):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, Vector) for element in value):
                 return value, 0
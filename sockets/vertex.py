@@ -1,6 +1,6 @@
 import bpy
 from mathutils import Vector
-from .. data_structures.mesh import Vertex
+from .. data_structures.mesh import Vertex, VertexList
 from .. base_types.socket import AnimationNodeSocket
 
 class VertexSocket(bpy.types.NodeSocket, AnimationNodeSocket):
@@ -49,10 +49,12 @@ class VertexListSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getCopyExpression(cls):
-        return "[element.copy() for element in value]"
+        return "value.copy() if isinstance(value, ColumnList) else [element.copy() for element in value]"
 
     @classmethod
     def correctValue(cls, value):
+        if isinstance(value, VertexList):
+            return value, 0
         if isinstance(value, list):
             if all(isinstance(element, Vertex) for element in value):
                 return value, 0
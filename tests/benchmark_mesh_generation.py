@@ -0,0 +1,79 @@
+import bpy
+import time
+from bpy.props import *
+from mathutils import Vector
+from .. utils.timing import prettyTime
+from .. algorithms.mesh_generation import basic_shapes, indices_utils
+
+class BenchmarkMeshGeneration(bpy.types.Operator):
+    bl_idname = "an.benchmark_mesh_generation"
+    bl_label = "Benchmark Mesh Generation"
+
+    sizes = StringProperty(name = "Sizes", default = "10, 100, 300, 1000",
+        description = "Comma separated amounts of divisions in both directions")
+
+    def execute(self, context):
+        sizes = [int(size) for size in self.sizes.split(",") if size.strip() != ""]
+
+        lines = []
+        for name, loopFunction, arrayFunction, adapterFunction in benchmarks:
+            for size in sizes:
+                loopTime = measure(loopFunction, size)
+                arrayTime = measure(arrayFunction, size)
+                adapterTime = measure(adapterFunction, size)
+                lines.append("{:<28} {:>5} - Loops: {:>14} - Array: {:>14} - Array as List: {:>14}".format(
+                    name, size, prettyTime(loopTime), prettyTime(arrayTime), prettyTime(adapterTime)))
+
+        print("\n".join(lines))
+        self.report(type = {"INFO"}, message = "Benchmarked {} functions, see the console for the results".format(len(benchmarks)))
+        return {"FINISHED"}
+
+def measure(function, size):
+    start = time.perf_counter()
+    function(size, size)
+    return time.perf_counter() - start
+
+
+# previous implementations to compare with
+##################################
+
+def gridVerticesWithLoops(xDivisions, yDivisions, xDistance = 1, yDistance = 1, offset = Vector((0, 0, 0))):
+    vertices = []
+    append = vertices.append
+    for x in range(xDivisions):
+        for y in range(yDivisions):
+            append(Vector((x * xDistance, y * yDistance, 0)) + offset)
+    return vertices
+
+def gridQuadPolygonIndicesWithLoops(xDivisions, yDivisions):
+    polygons = []
+    for i in range(0, (xDivisions - 1) * yDivisions, yDivisions):
+        for j in range(i, i + yDivisions - 1):
+            polygons.append((j, j + 1, j + yDivisions + 1, j + yDivisions))
+    return polygons
+
+def tubeQuadPolygonIndicesWithLoops(xDivisions, yDivisions):
+    polygons = gridQuadPolygonIndicesWithLoops(xDivisions, yDivisions)
+    for i in range(0, (xDivisions - 1) * yDivisions, yDivisions):
+        polygons.append((i, i + yDivisions, i + 2 * yDivisions - 1, i + yDivisions - 1))
+    return polygons
+
+def gridQuadEdgeIndicesWithLoops(xDivisions, yDivisions):
+    edges = []
+    for i in range((xDivisions - 1) * yDivisions):
+        edges.append((i, i + yDivisions))
+    for i in range(yDivisions - 1):
+        for j in range(xDivisions):
+            firstIndex = i + j * yDivisions
+            edges.append((firstIndex, firstIndex + 1))
+    return edges
+
+benchmarks = [
+    ("Grid Vertices", gridVerticesWithLoops, basic_shapes.gridVertexArray, basic_shapes.gridVertices),
+    ("Grid Quad Polygon Indices", gridQuadPolygonIndicesWithLoops,
+        indices_utils.gridQuadPolygonIndexArray, indices_utils.gridQuadPolygonIndices),
+    ("Tube Quad Polygon Indices", tubeQuadPolygonIndicesWithLoops,
+        indices_utils.tubeQuadPolygonIndexArray, indices_utils.tubeQuadPolygonIndices),
+    ("Grid Quad Edge Indices", gridQuadEdgeIndicesWithLoops,
+        indices_utils.gridQuadEdgeIndexArray, indices_utils.gridQuadEdgeIndices)
+]
@@ -0,0 +1,32 @@
+import bpy
+import time
+import numpy
+from bpy.props import *
+from .. utils.timing import prettyTime
+from .. algorithms.perlin_noise import perlinNoise, perlinNoiseArray
+
+class BenchmarkNoise(bpy.types.Operator):
+    bl_idname = "an.benchmark_noise"
+    bl_label = "Benchmark Noise"
+
+    amount = IntProperty(name = "Amount", default = 100000, min = 1)
+
+    def execute(self, context):
+        evolutions = numpy.random.uniform(-1e5, 1e5, self.amount)
+        persistance, octaves = 0.3, 2
+
+        # fill the noise cache before measuring
+        perlinNoiseArray(evolutions[:1], persistance, octaves)
+
+        start = time.perf_counter()
+        scalarResult = [perlinNoise(x, persistance, octaves) for x in evolutions.tolist()]
+        scalarTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        arrayResult = perlinNoiseArray(evolutions, persistance, octaves)
+        arrayTime = time.perf_counter() - start
+
+        maxDifference = numpy.abs(arrayResult - scalarResult).max()
+        self.report(type = {"INFO"}, message = "{} evaluations - Scalar: {} - Array: {} - Max Difference: {}".format(
+            self.amount, prettyTime(scalarTime), prettyTime(arrayTime), maxDifference))
+        return {"FINISHED"}
@@ -0,0 +1,48 @@
+import bpy
+import time
+from bpy.props import *
+from .. utils.timing import prettyTime
+
+class BenchmarkObjectInstancer(bpy.types.Operator):
+    bl_idname = "an.benchmark_object_instancer"
+    bl_label = "Benchmark Object Instancer"
+
+    amount = IntProperty(name = "Amount", default = 10000, min = 1)
+    steps = IntProperty(name = "Steps", default = 10, min = 1,
+        description = "Amount of executions to go from zero to the full amount and back")
+
+    def execute(self, context):
+        amounts = [int(self.amount * (i + 1) / self.steps) for i in range(self.steps)]
+        rampUp = amounts
+        rampDown = list(reversed(amounts[:-1])) + [0]
+
+        tree = bpy.data.node_groups.new("AN Benchmark", "an_AnimationNodeTree")
+        try:
+            node = tree.nodes.new("an_ObjectInstancerNode")
+            node.copyFromSource = False
+            node.objectType = "Empty"
+            scenes = {context.scene}
+
+            lines = []
+            for usePooling in (False, True):
+                node.usePooling = usePooling
+                upTime = measure(node, rampUp, scenes)
+                downTime = measure(node, rampDown, scenes)
+                # with pooling the objects are reused now
+                againTime = measure(node, rampUp, scenes)
+                node.removeAllObjects()
+                lines.append("{} - Ramp Up: {} - Ramp Down: {} - Ramp Up Again: {}".format(
+                    "Pooled" if usePooling else "Remove", prettyTime(upTime), prettyTime(downTime), prettyTime(againTime)))
+        finally:
+            bpy.data.node_groups.remove(tree)
+
+        print("\n".join(lines))
+        self.report(type = {"INFO"}, message = "{} instances in {} steps - {}".format(
+            self.amount, self.steps, " | ".join(lines)))
+        return {"FINISHED"}
+
+def measure(node, amounts, scenes):
+    start = time.perf_counter()
+    for amount in amounts:
+        node.getInstances_WithoutSource(amount, scenes)
+    return time.perf_counter() - start
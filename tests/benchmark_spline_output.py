@@ -0,0 +1,65 @@
+import bpy
+import time
+import numpy
+from bpy.props import *
+from itertools import chain
+from .. utils.timing import prettyTime
+from .. data_structures.splines.poly_spline import PolySpline
+from .. data_structures.splines.bezier_spline import BezierSpline
+from .. data_structures.splines.to_blender import setSplinesOnBlenderObject
+
+class BenchmarkSplineOutput(bpy.types.Operator):
+    bl_idname = "an.benchmark_spline_output"
+    bl_label = "Benchmark Spline Output"
+
+    splineAmount = IntProperty(name = "Spline Amount", default = 5000, min = 1)
+    pointAmount = IntProperty(name = "Points per Spline", default = 20, min = 1)
+
+    def execute(self, context):
+        splines = self.createTestSplines()
+        curve = bpy.data.curves.new("AN Benchmark", "CURVE")
+        object = bpy.data.objects.new("AN Benchmark", curve)
+
+        try:
+            oldTime = measure(setSplinesWithTuples, object, splines)
+            createTime = measure(setSplinesOnBlenderObject, object, splines)
+            reuseTime = measure(setSplinesOnBlenderObject, object, splines)
+        finally:
+            bpy.data.objects.remove(object)
+            bpy.data.curves.remove(curve)
+
+        self.report(type = {"INFO"}, message = "{} splines - Tuples: {} - NumPy: {} - NumPy (reused splines): {}".format(
+            len(splines), prettyTime(oldTime), prettyTime(createTime), prettyTime(reuseTime)))
+        return {"FINISHED"}
+
+    def createTestSplines(self):
+        splines = []
+        for i in range(self.splineAmount):
+            locations = numpy.random.uniform(-10, 10, (self.pointAmount, 3))
+            if i % 2 == 0:
+                splines.append(PolySpline.fromLocations(locations))
+            else:
+                splines.append(BezierSpline.fromLocations(PolySpline.fromLocations(locations).points.toList()))
+        return splines
+
+def measure(function, *args):
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+# the previous implementation to compare with
+def setSplinesWithTuples(object, splines):
+    bSplines = object.data.splines
+    bSplines.clear()
+    for spline in splines:
+        bSpline = bSplines.new(spline.type)
+        bSpline.use_cyclic_u = spline.isCyclic
+        if spline.type == "BEZIER":
+            bSpline.bezier_points.add(len(spline.points) - 1)
+            for attribute, name in (("co", "location"), ("handle_left", "leftHandle"), ("handle_right", "rightHandle")):
+                data = tuple(chain.from_iterable(getattr(point, name) for point in spline.points))
+                bSpline.bezier_points.foreach_set(attribute, data)
+        else:
+            bSpline.points.add(len(spline.points) - 1)
+            data = tuple(chain.from_iterable(list(point) + [0] for point in spline.points))
+            bSpline.points.foreach_set("co", data)
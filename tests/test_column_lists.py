@@ -0,0 +1,277 @@
+import bpy
+import numpy
+import random
+from mathutils import Vector, Matrix, Euler
+from .. data_structures.mesh import VertexList, PolygonList
+from .. data_structures.column_list import ColumnList
+from .. data_structures.vector_array import VectorArray
+from .. data_structures.matrix_array import MatrixArray
+from .. data_structures.number_array import NumberArray
+from .. utils.math import composeMatrix
+from .. algorithms.random import LegacyRandomNumberCache
+from .. nodes.sound.bake import packSamples, unpackSamples
+from .. algorithms.sound.analysis import calculateBandEnvelopes
+from .. utils.id_reference import (getObjectNameIndex, findObjectByName,
+                                   validateObjectNameIndex, invalidateObjectNameIndex)
+from .. execution.output_writes import (shouldWrite, countWrites, valuesAreEqual, getWriteCounts,
+                                        resetWriteCounts, getWrittenScenes, iterWriteCodeLines)
+from .. nodes.list.sort_list import SortPolygonListWithDirectionTemplate
+
+class TestColumnLists(bpy.types.Operator):
+    bl_idname = "an.test_column_lists"
+    bl_label = "Test Column Lists"
+
+    def execute(self, context):
+        tests = [testSortPolygonListByDirection, testSwapVertices, testShuffleVertices, testSwapPolygons,
+                 testChangeElementsInPlace, testVectorArrayOperations, testMatrixArrayOperations,
+                 testNumberArrayOperations, testLegacyRandomNumbers, testSoundAnalysis, testPackSoundSamples,
+                 testObjectNameIndex, testOutputWrites]
+        for test in tests:
+            test()
+        self.report(type = {"INFO"}, message = "{} tests passed".format(len(tests)))
+        return {"FINISHED"}
+
+def createPolygons(centers):
+    amount = len(centers)
+    return PolygonList(numpy.arange(amount * 9).reshape(-1, 3), None, [3] * amount,
+                       numpy.zeros((amount, 3)), centers, numpy.arange(amount), numpy.arange(amount))
+
+def testSortPolygonListByDirection():
+    polygons = createPolygons([(0, 0, 2), (0, 0, -1), (0, 0, 5), (0, 0, 0)])
+    output = SortPolygonListWithDirectionTemplate.sort(None, polygons, False, (0, 0, 1))
+
+    # same check as in the generated code of the Sort List node
+    assert isinstance(output, (list, ColumnList))
+    assert output.materialIndices.tolist() == [1, 3, 0, 2]
+    assert [polygon.center.z for polygon in output] == [-1, 0, 2, 5]
+
+    output = SortPolygonListWithDirectionTemplate.sort(None, polygons, True, (0, 0, 1))
+    assert output.materialIndices.tolist() == [2, 0, 3, 1]
+
+def testSwapVertices():
+    vertices = VertexList(numpy.arange(15).reshape(-1, 3), numpy.zeros((5, 3)))
+    vertices[0], vertices[4] = vertices[4], vertices[0]
+    assert vertices.locations[0].tolist() == [12, 13, 14]
+    assert vertices.locations[4].tolist() == [0, 1, 2]
+
+def testShuffleVertices():
+    vertices = VertexList(numpy.arange(15).reshape(-1, 3), numpy.zeros((5, 3)))
+    random.shuffle(vertices)
+    locations = sorted(map(tuple, vertices.locations.tolist()))
+    assert locations == [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 10, 11), (12, 13, 14)]
+
+def testSwapPolygons():
+    polygons = createPolygons([(0, 0, 0), (1, 0, 0), (2, 0, 0)])
+    polygons[0], polygons[2] = polygons[2], polygons[0]
+    assert polygons.materialIndices.tolist() == [2, 1, 0]
+    assert polygons.centers[:, 0].tolist() == [2, 1, 0]
+    assert polygons.vertexLocations[0].tolist() == [18, 19, 20]
+
+def testChangeElementsInPlace():
+    vertices = VertexList(numpy.arange(15).reshape(-1, 3), numpy.zeros((5, 3)))
+    assertRaises(TypeError, lambda: setattr(vertices[0].location, "x", 100))
+    assertRaises(TypeError, lambda: vertices[0].groupWeights.append(1))
+    assert vertices.locations[0].tolist() == [0, 1, 2]
+
+    vertex = vertices[0]
+    vertex.location = (7, 8, 9)
+    assert vertices.locations[0].tolist() == [7, 8, 9]
+
+    polygons = createPolygons([(0, 0, 0), (1, 0, 0)])
+    assertRaises(TypeError, lambda: setattr(polygons[0].center, "x", 5))
+    assertRaises(TypeError, lambda: polygons[0].vertexLocations.append((0, 0, 0)))
+
+    # copies can be changed
+    polygon = polygons[1].copy()
+    polygon.center.x = 5
+    polygon.vertexLocations.append(polygon.center)
+    assert polygons.centers[1].tolist() == [1, 0, 0]
+
+def assertRaises(exception, function):
+    try: function()
+    except exception: return
+    raise AssertionError("{} not raised".format(exception.__name__))
+
+def testVectorArrayOperations():
+    vectors = [Vector((random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5))) for _ in range(20)]
+    vectors.append(Vector((0, 0, 0)))
+    array = VectorArray.fromElements(vectors, "d")
+    matrix = Matrix.Translation((1, 2, 3)) * Euler((0.3, -1.2, 2.0)).to_matrix().to_4x4() * Matrix.Scale(2, 4)
+    other = Vector((0.5, -2, 1))
+
+    assertVectorsEqual(array.transform(matrix), [matrix * vector for vector in vectors])
+    assertVectorsEqual(array.offset(other), [vector + other for vector in vectors])
+    assertVectorsEqual(array.normalized(), [vector.normalized() for vector in vectors])
+    assertVectorsEqual(array.cross(other), [vector.cross(other) for vector in vectors])
+    assertValuesEqual(array.lengths(), [vector.length for vector in vectors])
+    assertValuesEqual(array.dot(other), [vector.dot(other) for vector in vectors])
+    assert array.toList() == vectors
+
+def testMatrixArrayOperations():
+    translations = [Vector((random.uniform(-5, 5), random.uniform(-5, 5), random.uniform(-5, 5))) for _ in range(20)]
+    rotations = [Euler((random.uniform(-3, 3), random.uniform(-3, 3), random.uniform(-3, 3))) for _ in range(20)]
+    scales = [Vector((random.uniform(0.5, 2), random.uniform(0.5, 2), random.uniform(0.5, 2))) for _ in range(20)]
+    matrices = [composeMatrix(*transforms) for transforms in zip(translations, rotations, scales)]
+
+    array = MatrixArray.compose(translations, rotations, scales, dtype = "d")
+    assertMatricesEqual(array, matrices)
+
+    translations, eulers, scales = array.decompose()
+    for matrix, translation, euler, scale in zip(matrices, translations, eulers, scales):
+        expectedTranslation, expectedRotation, expectedScale = matrix.decompose()
+        assert (translation - expectedTranslation).length <= 1e-5
+        assert (scale - expectedScale).length <= 1e-5
+        assertMatricesEqual([Euler(euler).to_matrix()], [expectedRotation.to_matrix()])
+
+    # very small scales are still invertible, singular matrices become the identity
+    matrices.append(Matrix.Scale(1e-4, 4))
+    matrices.append(Matrix.Scale(0, 4))
+    array = MatrixArray.fromElements(matrices, "d")
+    assertMatricesEqual(array.inverted(), [matrix.inverted(Matrix.Identity(4)) for matrix in matrices], tolerance = 1e-3)
+
+    expected = Matrix.Identity(4)
+    for matrix in matrices[:5]:
+        expected = matrix * expected
+    assertMatricesEqual([array[:5].combine()], [expected], tolerance = 1e-3)
+
+def testNumberArrayOperations():
+    numbers = [random.uniform(-5, 5) for _ in range(20)]
+    array = NumberArray.fromValue(numbers)
+    assert not array.isInteger
+    assert array.toList() == numbers
+
+    assert abs(array.sum() - sum(numbers)) <= 1e-9
+    assert array.min() == min(numbers) and array.max() == max(numbers)
+    assert abs(array.average() - sum(numbers) / len(numbers)) <= 1e-9
+    assert array.clamp(-1, 2).toList() == [min(max(number, -1), 2) for number in numbers]
+    assertValuesEqual(array.mapRange(-5, 5, 0, 1), [(number + 5) / 10 for number in numbers])
+    assert array.toIntegers().toList() == [int(number) for number in numbers]
+    assert NumberArray.fromValue([]).min(default = 3) == 3
+
+    integers = NumberArray.fromValue([3, -1, 4])
+    assert integers.isInteger
+    assert integers.product() == -12
+    assert NumberArray.range(4, 1, 0.5).toList() == [1, 1.5, 2, 2.5]
+
+def testLegacyRandomNumbers():
+    # numbers generated by older versions when the addon was loaded
+    expected = numpy.random.RandomState(1234).random_sample(10**6)
+    cache = LegacyRandomNumberCache()
+    cache.maxLoadedChunks = 2
+
+    indices = [0, 1, cache.chunkSize - 1, cache.chunkSize, 5 * cache.chunkSize + 7, 10**6 - 1, 3]
+    assert [cache[index] for index in indices] == expected[indices].tolist()
+    assert len(cache.chunks) == 2
+
+    indices = numpy.array([-cache.size + 5, 123456, cache.size + 2, 999999])
+    assert cache.take(indices).tolist() == expected[[5, 123456, 2, 999999]].tolist()
+
+    # the stored last number has to match the generated sequence
+    lastValue = cache[-1]
+    cache.knownValues = {}
+    assert cache[cache.size - 1] == lastValue
+
+def testSoundAnalysis():
+    sampleRate = 8000
+    times = numpy.arange(3 * sampleRate) / sampleRate
+    # loud 440 Hz tone in the first half and a quiet 60 Hz tone the whole time
+    samples = numpy.sin(2 * numpy.pi * 440 * times) * (times < 1.5) + 0.5 * numpy.sin(2 * numpy.pi * 60 * times)
+    frequencyRanges = [(0, 200), (200, 1000), (1000, 4000)]
+
+    envelopes = calculateBandEnvelopes(samples, sampleRate, frequencyRanges, 0.005, 0.2, 25)
+    assert envelopes.shape == (3, 75)
+    assert envelopes[1, 10] > 10 * envelopes[1, 60]
+    assert envelopes[0, 60] > 10 * envelopes[1, 60]
+
+    # the result must not depend on how the sound is split into windows
+    windowed = calculateBandEnvelopes(samples, sampleRate, frequencyRanges, 0.005, 0.2, 25, windowSize = 2000)
+    assert numpy.abs(envelopes - windowed).max() <= 1e-5
+    assert calculateBandEnvelopes([], sampleRate, frequencyRanges, 0.005, 0.2, 25).shape == (3, 0)
+
+def testPackSoundSamples():
+    samples = numpy.random.random_sample(1000).astype("f")
+    text = packSamples(samples)
+    assert isinstance(text, str)
+    assert unpackSamples(text).tolist() == samples.tolist()
+
+    # doubles are stored with single precision
+    samples = numpy.linspace(0, 1, 100)
+    assert unpackSamples(packSamples(samples)).tolist() == samples.astype("f").tolist()
+    assert len(unpackSamples(packSamples([]))) == 0
+    assert len(unpackSamples("")) == 0
+
+def testObjectNameIndex():
+    objects = [bpy.data.objects.new("AN Test " + name, None) for name in "ABC"]
+    try:
+        invalidateObjectNameIndex()
+        assertObjectPositions(getObjectNameIndex(), objects)
+
+        # renaming changes the order of the objects, but not the amount
+        index = getObjectNameIndex()
+        objects[0].name = "AN Test Z"
+        assert index.isValid()
+        assert not index.hasCurrentOrder()
+        assert findObjectByName("AN Test Z") == objects[0]
+        assert findObjectByName("AN Test A") is None
+        assertObjectPositions(getObjectNameIndex(), objects)
+
+        bpy.data.objects.remove(objects.pop(1))
+        validateObjectNameIndex()
+        assert findObjectByName("AN Test B") is None
+        assertObjectPositions(getObjectNameIndex(), objects)
+    finally:
+        for object in objects:
+            bpy.data.objects.remove(object)
+        invalidateObjectNameIndex()
+
+def assertObjectPositions(index, objects):
+    assert index.hasCurrentOrder()
+    assert [bpy.data.objects[position] for position in index.getPositions(objects)] == objects
+    assert [findObjectByName(object.name) for object in objects] == objects
+
+def testOutputWrites():
+    # float properties only have single precision
+    assert valuesAreEqual(0.1, 0.1 + 1e-9)
+    assert valuesAreEqual(2.0, 2)
+    assert not valuesAreEqual(1.0, 1.001)
+    assert valuesAreEqual(Vector((1, 2, 3)), Vector((1, 2, 3)))
+    assert not valuesAreEqual(Vector((1, 2, 3)), Vector((1, 2, 4)))
+    assert not valuesAreEqual(Vector((1, 2, 3)), "abc")
+    assert not valuesAreEqual(numpy.zeros(2), [0, 0, 0])
+
+    scene = bpy.context.scene
+    resetWriteCounts()
+    try:
+        assert not shouldWrite(scene, 1.0, 1.0, "test")
+        assert getWrittenScenes(bpy.data.scenes) == []
+        assert shouldWrite(scene, 1.0, 2.0, "test")
+        assert getWrittenScenes(bpy.data.scenes) == list(bpy.data.scenes)
+        countWrites("test", 2, 3)
+        counts = getWriteCounts()["test"]
+        assert (counts.performed, counts.skipped) == (3, 4)
+    finally:
+        resetWriteCounts()
+
+    lines = list(iterWriteCodeLines("object", "location", "vector"))
+    assert lines == ["if should_write(object, object.location, vector, 'location'):",
+                     "    object.location = vector"]
+    # the value expression is only evaluated once
+    lines = list(iterWriteCodeLines("object", "location", "a + b"))
+    assert lines[0] == "_write_value = a + b"
+    assert lines[2] == "    object.location = _write_value"
+    lines = list(iterWriteCodeLines("object", "[\"prop\"]", "value"))
+    assert lines == ["object[\"prop\"] = value"]
+
+def assertMatricesEqual(a, b, tolerance = 1e-5):
+    assert len(a) == len(b)
+    for x, y in zip(a, b):
+        assert all(abs(p - q) <= tolerance for rowX, rowY in zip(x, y) for p, q in zip(rowX, rowY)), (x, y)
+
+def assertVectorsEqual(array, vectors, tolerance = 1e-5):
+    assert len(array) == len(vectors)
+    for a, b in zip(array, vectors):
+        assert (a - b).length <= tolerance, (a, b)
+
+def assertValuesEqual(a, b, tolerance = 1e-5):
+    assert len(a) == len(b)
+    assert all(abs(x - y) <= tolerance for x, y in zip(a, b)), (a, b)
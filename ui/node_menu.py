@@ -71,6 +71,7 @@ class NumberMenu(bpy.types.Menu):
         insertNode(layout, "an_ParseNumberNode", "Parse Number")
         layout.separator()
         insertNode(layout, "an_RandomNumberNode", "Randomize")
+        insertNode(layout, "an_RandomListNode", "Random List", {"dataType" : repr("Float")})
         insertNode(layout, "an_FloatWiggleNode", "Wiggle")
         insertNode(layout, "an_MixDataNode", "Mix", {"dataType" : repr("Float")})
         insertNode(layout, "an_MapRangeNode", "Map Range")
@@ -94,6 +95,7 @@ class VectorMenu(bpy.types.Menu):
         insertNode(layout, "an_CreateListNode", "List", {"assignedType" : repr("Vector")})
         layout.separator()
         insertNode(layout, "an_RandomVectorNode", "Randomize")
+        insertNode(layout, "an_RandomListNode", "Random List", {"dataType" : repr("Vector")})
         insertNode(layout, "an_VectorWiggleNode", "Wiggle")
         insertNode(layout, "an_MixDataNode", "Mix", {"dataType" : repr("Vector")})
         layout.separator()
@@ -109,6 +111,7 @@ class VectorMenu(bpy.types.Menu):
         insertNode(layout, "an_VectorListMathNode", "List Math")
         insertNode(layout, "an_TransformVectorNode", "Transform Vector")
         insertNode(layout, "an_TransformVectorListNode", "Transform Vector List")
+        insertNode(layout, "an_VectorListOperationNode", "Vector List Operation")
 
 class RotationMenu(bpy.types.Menu):
     bl_idname = "an_rotation_menu"
@@ -127,6 +130,7 @@ class RotationMenu(bpy.types.Menu):
         insertNode(layout, "an_EulerMathNode", "Euler Math")
         insertNode(layout, "an_MixDataNode", "Euler Mix", {"dataType" : repr("Euler")})
         insertNode(layout, "an_RandomEulerNode", "Random Euler")
+        insertNode(layout, "an_RandomListNode", "Random Euler List", {"dataType" : repr("Euler")})
         insertNode(layout, "an_EulerWiggleNode", "Euler Wiggle")
         layout.separator()
         insertNode(layout, "an_SeparateQuaternionNode", "Separate Quaternion")
@@ -136,6 +140,7 @@ class RotationMenu(bpy.types.Menu):
         insertNode(layout, "an_QuaternionMathNode", "Quaternion Math")
         insertNode(layout, "an_MixDataNode", "Quaternion Mix", {"dataType" : repr("Quaternion")})
         insertNode(layout, "an_RandomQuaternionNode", "Random Quaternion")
+        insertNode(layout, "an_RandomListNode", "Random Quaternion List", {"dataType" : repr("Quaternion")})
         insertNode(layout, "an_QuaternionWiggleNode", "Quaternion Wiggle")
         layout.separator()
         insertNode(layout, "an_QuaternionListCombineNode", "Combine Quaternion Rotations")
@@ -149,6 +154,8 @@ class MatrixMenu(bpy.types.Menu):
         layout = self.layout
         insertNode(layout, "an_DecomposeMatrixNode", "Decompose")
         insertNode(layout, "an_ComposeMatrixNode", "Compose")
+        insertNode(layout, "an_DecomposeMatrixListNode", "Decompose List")
+        insertNode(layout, "an_ComposeMatrixListNode", "Compose List")
         insertNode(layout, "an_CreateListNode", "List", {"assignedType" : repr("Matrix")})
         layout.separator()
         insertNode(layout, "an_TranslationMatrixNode", "Translation")
@@ -160,6 +167,7 @@ class MatrixMenu(bpy.types.Menu):
         insertNode(layout, "an_MixDataNode", "Mix", {"dataType" : repr("Matrix")})
         insertNode(layout, "an_ChangeMatrixPivotNode", "Change Pivot")
         insertNode(layout, "an_MatrixMathNode", "Math")
+        insertNode(layout, "an_MatrixListMathNode", "List Math")
         insertNode(layout, "an_MatrixCombineNode", "Combine")
 
 class TextMenu(bpy.types.Menu):
@@ -216,6 +224,7 @@ class ColorMenu(bpy.types.Menu):
         insertNode(layout, "an_CombineColorNode", "Combine Color")
         insertNode(layout, "an_SeparateColorNode", "Separate Color")
         insertNode(layout, "an_MixDataNode", "Mix", {"dataType" : repr("Color")})
+        insertNode(layout, "an_RandomListNode", "Random Color List", {"dataType" : repr("Color")})
         insertNode(layout, "an_SetVertexColorNode", "Set Vertex Color")
 
 class ListMenu(bpy.types.Menu):
@@ -459,6 +468,7 @@ class InterpolationMenu(bpy.types.Menu):
         insertNode(layout, "an_MixInterpolationNode", "Mix")
         layout.separator()
         insertNode(layout, "an_EvaluateInterpolationNode", "Evaluate")
+        insertNode(layout, "an_EvaluateInterpolationNode", "Evaluate List", {"useList" : repr(True)})
         insertNode(layout, "an_MapRangeNode", "Map Range", {"useInterpolation" : repr(True)})
 
 class MaterialMenu(bpy.types.Menu):
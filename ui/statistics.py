@@ -4,6 +4,8 @@ from collections import defaultdict
 from .. graphics.table import Table
 from .. graphics.rectangle import Rectangle
 from .. utils.nodes import getAnimationNodeTrees
+from .. execution.output_writes import getWriteCounts
+from .. execution.auto_execution import getPostExecutionInfo
 from .. utils.blender_ui import getDpiFactor, getDpi
 from .. graphics.drawing_2d import drawText, setTextDrawingDpi
 
@@ -38,6 +40,7 @@ class StatisticsDrawer(bpy.types.Operator):
         self.statistics = NodeStatistics(getAnimationNodeTrees())
         self.nodeTreeTable = createNodeTreeTable(self.statistics)
         self.mostUsedNodesTable = createMostUsedNodesTable(self.statistics)
+        self.outputWritesTable = createOutputWritesTable(getWriteCounts())
 
     def modal(self, context, event):
         if context.area is not None:
@@ -80,12 +83,19 @@ class StatisticsDrawer(bpy.types.Operator):
         drawText(text, 10 * dpiFactor, region.height - 20 * dpiFactor,
             color = (0, 0, 0, 0.5), size = 11)
 
+        text = "After Auto Execution: {}".format(getPostExecutionInfo())
+        drawText(text, 10 * dpiFactor, 20 * dpiFactor,
+            color = (0, 0, 0, 0.5), size = 11)
+
         offset = self.drawOffset.copy()
         self.drawNodeTreeTable(offset, dpiFactor)
 
         offset.x += 500 * dpiFactor
         self.drawMostUsedNodesTable(offset, dpiFactor)
 
+        offset.x += 310 * dpiFactor
+        self.drawOutputWritesTable(offset, dpiFactor)
+
     def drawNodeTreeTable(self, location, dpiFactor):
         table = self.nodeTreeTable
 
@@ -119,6 +129,22 @@ class StatisticsDrawer(bpy.types.Operator):
         table.headerFontSize = 14
         table.draw(location)
 
+    def drawOutputWritesTable(self, location, dpiFactor):
+        table = self.outputWritesTable
+
+        table.clearColumns()
+        table.newColumn("Output", 150 * dpiFactor, "LEFT", font = 0)
+        table.newColumn("Written", 80 * dpiFactor, "RIGHT", font = 1)
+        table.newColumn("Skipped", 80 * dpiFactor, "RIGHT", font = 1)
+
+        table.rowHeight = 22 * dpiFactor
+        table.headerRowHeight = 30 * dpiFactor
+        table.lineThickness = 1 * dpiFactor
+        table.cellPadding = 5 * dpiFactor
+        table.dataFontSize = 11
+        table.headerFontSize = 14
+        table.draw(location)
+
 
 
 def createNodeTreeTable(statistics):
@@ -147,6 +173,24 @@ def createMostUsedNodesTable(statistics):
     return table
 
 
+def createOutputWritesTable(writeCounts):
+    table = Table()
+    items = sorted(writeCounts.items(), key = lambda x: x[1].performed + x[1].skipped, reverse = True)
+
+    for path, counts in items[:10]:
+        table.newRow({
+            "Output" : path,
+            "Written" : counts.performed,
+            "Skipped" : counts.skipped})
+
+    table.newRow({
+        "Output" : "Sum:",
+        "Written" : sum(counts.performed for counts in writeCounts.values()),
+        "Skipped" : sum(counts.skipped for counts in writeCounts.values())})
+
+    return table
+
+
 class NodeStatistics:
     def __init__(self, nodeTrees):
         self.nodeTreeAmount = len(nodeTrees)
@@ -2,6 +2,7 @@ import bpy
 from .. problems import canExecute
 from .. utils.layout import writeText
 from .. utils.timing import prettyTime
+from .. execution.auto_execution import getPostExecutionInfo
 
 class TreePanel(bpy.types.Panel):
     bl_idname = "an_tree_panel"
@@ -29,6 +30,7 @@ class TreePanel(bpy.types.Panel):
             layout.label("Look in the 'Problems' panel", icon = "INFO")
 
         layout.label(prettyTime(tree.lastExecutionInfo.executionTime), icon = "TIME")
+        layout.label("After Execution: " + prettyTime(getPostExecutionInfo().totalTime), icon = "TIME")
 
         layout.separator()
         layout.prop_search(tree, "sceneName", bpy.data, "scenes", icon = "SCENE_DATA", text = "Scene")
@@ -9,6 +9,7 @@ fileLoadPostHandlers = []
 addonLoadPostHandlers = []
 sceneUpdatePostHandlers = []
 frameChangePostHandlers = []
+undoPostHandlers = []
 
 renderPreHandlers = []
 renderInitHandlers = []
@@ -21,6 +22,7 @@ def eventHandler(event):
         if event == "ADDON_LOAD_POST": addonLoadPostHandlers.append(function)
         if event == "SCENE_UPDATE_POST": sceneUpdatePostHandlers.append(function)
         if event == "FRAME_CHANGE_POST": frameChangePostHandlers.append(function)
+        if event == "UNDO_POST": undoPostHandlers.append(function)
 
         if event == "RENDER_INIT": renderInitHandlers.append(function)
         if event == "RENDER_PRE": renderPreHandlers.append(function)
@@ -46,6 +48,12 @@ def loadPost(scene):
     for handler in fileLoadPostHandlers:
         handler()
 
+# called after undo and redo
+@persistent
+def undoPost(scene):
+    for handler in undoPostHandlers:
+        handler()
+
 @persistent
 def renderPre(scene):
     for handler in renderPreHandlers:
@@ -75,6 +83,8 @@ def registerHandlers():
     bpy.app.handlers.frame_change_post.append(frameChangedPost)
     bpy.app.handlers.scene_update_post.append(sceneUpdatePost)
     bpy.app.handlers.load_post.append(loadPost)
+    bpy.app.handlers.undo_post.append(undoPost)
+    bpy.app.handlers.redo_post.append(undoPost)
 
     bpy.app.handlers.render_complete.append(renderCompleted)
     bpy.app.handlers.render_init.append(renderInitialized)
@@ -88,6 +98,8 @@ def unregisterHandlers():
     bpy.app.handlers.frame_change_post.remove(frameChangedPost)
     bpy.app.handlers.scene_update_post.remove(sceneUpdatePost)
     bpy.app.handlers.load_post.remove(loadPost)
+    bpy.app.handlers.undo_post.remove(undoPost)
+    bpy.app.handlers.redo_post.remove(undoPost)
 
     bpy.app.handlers.render_complete.remove(renderCompleted)
     bpy.app.handlers.render_init.remove(renderInitialized)
@@ -1,4 +1,5 @@
 import bpy
+from . handlers import eventHandler
 
 hashByObjectName = {}
 
@@ -6,7 +7,7 @@ def updateObjectReference(object):
     hashByObjectName[object.name] = hash(object)
 
 def tryToFindObjectReference(name):
-    object = bpy.data.objects.get(name)
+    object = findObjectByName(name)
     if object is not None:
         updateObjectReference(object)
         return object
@@ -20,3 +21,103 @@ def tryToFindObjectReference(name):
             return object
 
     return None
+
+
+# Object Name Index
+##################################
+# bpy.data.objects.get() compares the name with every object in the file.
+# This index is shared by all nodes. Counting the objects is not free either,
+# so the index is only validated once per event or execution and rebuilt when
+# the amount of objects changed, a file has been loaded, an undo step happened
+# or a lookup detected that an object has been renamed or created.
+#
+# Like above only names, positions and hashes are stored. Objects that have
+# been removed in the meantime must never be accessed, so they are always
+# taken from bpy.data.objects and compared with the stored hash and name.
+#
+# bpy.data.objects is sorted by name, so renaming an object can move other
+# objects without changing the amount. Code that uses the positions of many
+# objects at once has to check hasCurrentOrder() first.
+
+objectNameIndex = None
+
+class ObjectNameIndex:
+    def __init__(self):
+        self.hashes = [hash(object) for object in bpy.data.objects]
+        self.names = bpy.data.objects.keys()
+        self.amount = len(self.hashes)
+        self.indexByName = {name : i for i, name in enumerate(self.names)}
+        self.indexByHash = None
+
+    def isValid(self):
+        return len(bpy.data.objects) == self.amount
+
+    def hasCurrentOrder(self):
+        '''More expensive than isValid, but also detects renamed objects'''
+        return bpy.data.objects.keys() == self.names
+
+    def get(self, name, objects = None):
+        '''objects can be list(bpy.data.objects) when many names are searched'''
+        index = self.indexByName.get(name)
+        if index is None: return None
+        if objects is None: objects = bpy.data.objects
+        try: object = objects[index]
+        except IndexError: return None
+        if hash(object) != self.hashes[index] or object.name != name: return None
+        return object
+
+    def getPositions(self, objects):
+        '''Positions of the objects in bpy.data.objects or None when one is not indexed'''
+        if self.indexByHash is None:
+            self.indexByHash = {objectHash : i for i, objectHash in enumerate(self.hashes)}
+        get = self.indexByHash.get
+        positions = [get(hash(object)) for object in objects]
+        if None in positions: return None
+        return positions
+
+def getObjectNameIndex():
+    global objectNameIndex
+    if objectNameIndex is None:
+        objectNameIndex = ObjectNameIndex()
+    return objectNameIndex
+
+def findObjectByName(name):
+    object = getObjectNameIndex().get(name)
+    if object is not None: return object
+    return findObjectWithoutIndex(name)
+
+def findObjectsByNames(names):
+    '''Same as findObjectByName for every name, but faster for many names'''
+    index = getObjectNameIndex()
+    # getting an object by position has to walk through all objects before it
+    if len(names) * 64 < index.amount:
+        return [findObjectByName(name) for name in names]
+
+    allObjects = list(bpy.data.objects)
+    objects = []
+    for name in names:
+        object = index.get(name, allObjects)
+        if object is None: object = findObjectWithoutIndex(name)
+        objects.append(object)
+    return objects
+
+def findObjectWithoutIndex(name):
+    # the name is either not used or the index is outdated
+    object = bpy.data.objects.get(name)
+    if object is not None:
+        invalidateObjectNameIndex()
+    return object
+
+def validateObjectNameIndex():
+    if objectNameIndex is not None and not objectNameIndex.isValid():
+        invalidateObjectNameIndex()
+
+# has to be called after objects have been removed
+def invalidateObjectNameIndex():
+    global objectNameIndex
+    objectNameIndex = None
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+def fileOrUndoLoaded():
+    invalidateObjectNameIndex()
@@ -0,0 +1,72 @@
+import bpy
+import numpy
+from . id_reference import getObjectNameIndex, invalidateObjectNameIndex
+
+'''
+Set location, rotation_euler or scale of many objects at once.
+Writing a property of an object is expensive, because Blender tags the
+object for an update every time. So the current values are read first
+and only the objects whose values actually change are written.
+'''
+
+def setObjectVectors(objects, attribute, vectors, components = (0, 1, 2)):
+    '''
+    Set the attribute of the first N objects to the rows of the (N, 3) array.
+    Only the given components are compared and set.
+    Returns the amount of objects that have been changed.
+    '''
+    amount = min(len(objects), len(vectors))
+    if amount == 0 or len(components) == 0: return 0
+    objects = objects[:amount]
+    # Blender stores the values as float, so they are compared with that precision
+    vectors = numpy.asarray(vectors[:amount], dtype = "f")
+
+    if None in objects:
+        indices = [i for i, object in enumerate(objects) if object is not None]
+        objects = [objects[i] for i in indices]
+        vectors = vectors[indices]
+        if len(objects) == 0: return 0
+    components = list(components)
+
+    currentVectors = getCurrentVectors(objects, attribute)
+    isChanged = (currentVectors[:, components] != vectors[:, components]).any(axis = 1)
+    changedIndices = numpy.flatnonzero(isChanged).tolist()
+    values = vectors.tolist()
+
+    if len(components) == 3:
+        _setattr = setattr
+        for i in changedIndices:
+            _setattr(objects[i], attribute, values[i])
+    else:
+        _getattr = getattr
+        for i in changedIndices:
+            vector = _getattr(objects[i], attribute)
+            value = values[i]
+            for component in components:
+                vector[component] = value[component]
+
+    return len(changedIndices)
+
+def getCurrentVectors(objects, attribute):
+    '''(N, 3) array with the current values of the attribute'''
+    index = getObjectNameIndex()
+    # a single foreach_get over all objects is only faster when many of them are set
+    if len(objects) * 16 >= index.amount:
+        positions = index.getPositions(objects)
+        if positions is None or not index.hasCurrentOrder():
+            # objects have been created or renamed after the index was built
+            invalidateObjectNameIndex()
+            index = getObjectNameIndex()
+            positions = index.getPositions(objects)
+
+        if positions is not None:
+            allVectors = numpy.empty(index.amount * 3, dtype = "f")
+            try:
+                bpy.data.objects.foreach_get(attribute, allVectors)
+                return allVectors.reshape(-1, 3)[positions]
+            except (TypeError, RuntimeError):
+                # objects have been removed without updating the index
+                invalidateObjectNameIndex()
+
+    _getattr = getattr
+    return numpy.array([_getattr(object, attribute)[:] for object in objects], dtype = "f")
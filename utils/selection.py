@@ -1,5 +1,6 @@
 import bpy
 from . handlers import eventHandler
+from . id_reference import findObjectByName
 
 enableSelectionSorting = True
 sortedSelectionNames = []
@@ -7,7 +8,7 @@ sortedSelectionNames = []
 def getSortedSelectedObjects():
     objects = []
     for name in getSortedSelectedObjectNames():
-        objects.append(bpy.data.objects.get(name))
+        objects.append(findObjectByName(name))
     return objects
 
 def getSortedSelectedObjectNames():